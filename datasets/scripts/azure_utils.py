@@ -2,8 +2,210 @@
 Utility functions for dataset processing and Azure blob storage operations.
 """
 
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from azure.storage.blob import BlobServiceClient
+from types import SimpleNamespace
+
+
+MANIFEST_NAME = ".azure_manifest.json"
+
+# Hidden directory where LocalContainerClient keeps staged blocks and blob metadata
+LOCAL_STATE_DIR = ".blob_state"
+
+
+def _md5_hex(content_md5):
+    """Normalize a blob's Content-MD5 (bytes/bytearray or None) to a hex string."""
+    return bytes(content_md5).hex() if content_md5 else None
+
+
+class LocalBlobDownloader:
+    """
+    Streaming download handle returned by LocalBlobClient.download_blob.
+
+    Mirrors the subset of azure.storage.blob.StorageStreamDownloader used here.
+    """
+
+    def __init__(self, path, chunk_size):
+        self._path = path
+        self._chunk_size = chunk_size
+        self.size = path.stat().st_size
+
+    def chunks(self):
+        """Yield the blob content in chunks."""
+        with open(self._path, "rb") as f:
+            while chunk := f.read(self._chunk_size):
+                yield chunk
+
+    def readall(self):
+        """Return the whole blob content."""
+        return self._path.read_bytes()
+
+
+class LocalBlobClient:
+    """
+    Filesystem-backed stand-in for azure.storage.blob.BlobClient.
+    """
+
+    def __init__(self, container, name):
+        self._container = container
+        self.blob_name = name
+        self._path = container.root / name
+
+    def download_blob(self, max_concurrency=1):
+        """
+        Open a streaming download of the blob.
+
+        Args:
+            max_concurrency (int): Ignored (kept for API compatibility)
+
+        Returns:
+            LocalBlobDownloader: Handle exposing chunks() and readall()
+        """
+        if not self._path.is_file():
+            raise FileNotFoundError(f"Blob not found: {self.blob_name}")
+        return LocalBlobDownloader(self._path, self._container.chunk_size)
+
+    def get_blob_properties(self):
+        """Return blob properties (name, size, etag, metadata, content_settings.content_md5)."""
+        return self._container._properties(self._path)
+
+    def stage_block(self, block_id, data, length=None):
+        """
+        Stage an uncommitted block (invisible to readers until commit_block_list).
+
+        Args:
+            block_id (str): Block identifier
+            data (bytes): Block content
+            length (int): Ignored (kept for API compatibility)
+        """
+        block_dir = self._container._state_path("blocks", self.blob_name)
+        block_dir.mkdir(parents=True, exist_ok=True)
+        (block_dir / block_id).write_bytes(data)
+
+    def commit_block_list(self, block_list, metadata=None):
+        """
+        Atomically replace the blob with the concatenation of staged blocks.
+
+        Args:
+            block_list (list): Block identifiers, in order
+            metadata (dict): Blob metadata
+        """
+        block_dir = self._container._state_path("blocks", self.blob_name)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._container._state_path("commit", self.blob_name)
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(tmp_path, "wb") as f:
+            for block_id in block_list:
+                f.write((block_dir / str(block_id)).read_bytes())
+        os.replace(tmp_path, self._path)
+        self._container._write_metadata(self.blob_name, metadata)
+
+        for block_file in block_dir.iterdir():
+            block_file.unlink()
+        block_dir.rmdir()
+
+    def upload_blob(self, data, overwrite=False, metadata=None):
+        """
+        Atomically write the blob in a single request.
+
+        Args:
+            data (bytes): Blob content
+            overwrite (bool): Replace an existing blob
+            metadata (dict): Blob metadata
+        """
+        if self._path.exists() and not overwrite:
+            raise FileExistsError(f"Blob already exists: {self.blob_name}")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._container._state_path("commit", self.blob_name)
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self._path)
+        self._container._write_metadata(self.blob_name, metadata)
+
+
+class LocalContainerClient:
+    """
+    Filesystem-backed stand-in for azure.storage.blob.ContainerClient.
+
+    Blobs are the files under root, named by their POSIX path relative to root.
+    ETags change whenever a file's size or modification time changes; staged
+    blocks and blob metadata live in a hidden state directory. Lets the
+    download/upload logic run (and be tested) without an Azure account.
+    """
+
+    def __init__(self, root, chunk_size=4 * 1024 * 1024):
+        """
+        Initialize local container client.
+
+        Args:
+            root (str | Path): Directory acting as the container
+            chunk_size (int): Chunk size used by streaming downloads
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+
+    def _state_path(self, kind, blob_name):
+        """Path of a blob's staged blocks, metadata or commit buffer under the hidden state dir."""
+        return self.root / LOCAL_STATE_DIR / kind / blob_name
+
+    def _write_metadata(self, blob_name, metadata):
+        metadata_path = self._state_path("metadata", blob_name)
+        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        metadata_path.write_text(json.dumps(metadata or {}))
+
+    def _read_metadata(self, blob_name):
+        metadata_path = self._state_path("metadata", blob_name)
+        return json.loads(metadata_path.read_text()) if metadata_path.exists() else {}
+
+    def _properties(self, path):
+        stat = path.stat()
+        md5 = hashlib.md5()
+        with open(path, "rb") as f:
+            while chunk := f.read(self.chunk_size):
+                md5.update(chunk)
+
+        name = path.relative_to(self.root).as_posix()
+        return SimpleNamespace(
+            name=name,
+            size=stat.st_size,
+            metadata=self._read_metadata(name),
+            etag=f'"0x{stat.st_mtime_ns:x}{stat.st_size:x}"',
+            last_modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            content_settings=SimpleNamespace(content_md5=bytearray(md5.digest()))
+        )
+
+    def list_blobs(self, name_starts_with=None, include=None):
+        """
+        List blobs whose name starts with a prefix.
+
+        Args:
+            name_starts_with (str): Blob name prefix
+            include (list): Ignored; metadata is always included
+
+        Returns:
+            list: Blob properties, sorted by name
+        """
+        prefix = name_starts_with or ""
+        state_dir = self.root / LOCAL_STATE_DIR
+        paths = sorted(
+            path for path in self.root.rglob("*")
+            if path.is_file() and state_dir not in path.parents
+        )
+        return [
+            self._properties(path) for path in paths
+            if path.relative_to(self.root).as_posix().startswith(prefix)
+        ]
+
+    def get_blob_client(self, blob):
+        """Return a LocalBlobClient for a blob name."""
+        return LocalBlobClient(self, blob)
 
 
 class AzureBlobDownloader:
@@ -11,34 +213,122 @@ class AzureBlobDownloader:
     Azure Blob Storage downloader class for managing dataset downloads.
 
     This class encapsulates Azure blob operations and maintains connection state
-    for efficient dataset management operations.
+    for efficient dataset management operations. Blobs are streamed to disk in
+    chunks on a bounded thread pool, and files whose size/ETag/MD5 match the local
+    manifest are skipped. Local folders are synced back incrementally: files whose
+    SHA-256 matches the remote blob's metadata are never re-sent.
     """
 
-    def __init__(self, account_url, container_name):
+    def __init__(self, account_url=None, container_name=None, container_client=None, max_concurrency=8):
         """
         Initialize Azure blob downloader.
 
         Args:
             account_url (str): Azure storage account URL
             container_name (str): Name of the blob container
+            container_client: Optional pre-built container client (e.g. LocalContainerClient);
+                when given, no Azure connection is made
+            max_concurrency (int): Maximum number of blobs downloaded concurrently
 
         Raises:
             Exception: If connection to Azure fails or Azure SDK not available
         """
+        self.account_url = account_url
+        self.container_name = container_name
+        self.max_concurrency = max(1, max_concurrency)
+        self.last_transfer_stats = None
+
+        if container_client is not None:
+            self.blob_service_client = None
+            self.container_client = container_client
+            return
+
         try:
-            self.account_url = account_url
-            self.container_name = container_name
+            from azure.storage.blob import BlobServiceClient
+
             self.blob_service_client = BlobServiceClient(account_url=account_url)
             self.container_client = self.blob_service_client.get_container_client(container_name)
 
         except Exception as e:
             raise Exception(f"Failed to initialize Azure Blob connection: {e}")
 
+    @staticmethod
+    def _load_manifest(manifest_path):
+        """Load a download manifest (blob name -> size/etag/md5), empty if missing or unreadable."""
+        try:
+            with open(manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_manifest(manifest_path, manifest):
+        """Write a download manifest atomically."""
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp_path, manifest_path)
+
+    @staticmethod
+    def _is_unchanged(blob, local_file_path, entry):
+        """
+        Check whether a local file is up to date with a blob.
+
+        The local file must exist with the blob's size, and the manifest entry recorded
+        at its download must match the blob's ETag (or its MD5 when both are known).
+        """
+        if entry is None or not local_file_path.is_file():
+            return False
+        if local_file_path.stat().st_size != blob.size or entry.get("size") != blob.size:
+            return False
+
+        remote_md5 = _md5_hex(getattr(blob.content_settings, "content_md5", None))
+        if remote_md5 and entry.get("md5"):
+            return remote_md5 == entry["md5"]
+        return entry.get("etag") == blob.etag
+
+    def _download_blob(self, blob, local_file_path):
+        """
+        Stream one blob to disk chunk by chunk, verifying its MD5 when available.
+
+        The content is written to a temporary sibling file and renamed into place,
+        so an interrupted download never leaves a truncated file behind.
+
+        Returns:
+            dict: Manifest entry (size, etag, md5) of the downloaded blob
+        """
+        local_file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_file_path.with_name(local_file_path.name + ".part")
+        md5 = hashlib.md5()
+        n_bytes = 0
+
+        try:
+            downloader = self.container_client.get_blob_client(blob.name).download_blob(max_concurrency=1)
+            with open(tmp_path, "wb") as download_file:
+                for chunk in downloader.chunks():
+                    download_file.write(chunk)
+                    md5.update(chunk)
+                    n_bytes += len(chunk)
+
+            remote_md5 = _md5_hex(getattr(blob.content_settings, "content_md5", None))
+            if remote_md5 and remote_md5 != md5.hexdigest():
+                raise IOError(f"MD5 mismatch for {blob.name}")
+
+            os.replace(tmp_path, local_file_path)
+
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return {"size": n_bytes, "etag": blob.etag, "md5": md5.hexdigest()}
 
     def download_documents(self, project_folder, document_folder, base_path="../"):
         """
         Download dataset from Azure Blob Storage.
 
+        Blobs are streamed concurrently (at most max_concurrency at a time); files
+        recorded as unchanged in {base_path}/{project_folder}/{document_folder}/.azure_manifest.json
+        are skipped. Transfer statistics are stored in last_transfer_stats.
+
         Args:
             project_folder: Name of the project folder in blob storage
             document_folder: Name of the document folder in blob storage
@@ -48,28 +338,203 @@ class AzureBlobDownloader:
             bool: True if download successful, False otherwise
         """
         try:
-            original_dir = Path(base_path) / project_folder 
-            specific_dir = original_dir / document_folder
+            start_time = time.perf_counter()
+            specific_dir = Path(base_path) / project_folder / document_folder
+            specific_dir.mkdir(parents=True, exist_ok=True)
 
-            original_dir.mkdir(exist_ok=True)
-            specific_dir.mkdir(exist_ok=True)
+            manifest_path = specific_dir / MANIFEST_NAME
+            manifest = self._load_manifest(manifest_path)
 
             remote_path = f"{project_folder}/{document_folder}/"
-            downloaded_files = 0
-
+            pending = []
+            skipped_files = 0
             for blob in self.container_client.list_blobs(name_starts_with=remote_path):
-                blob_client = self.container_client.get_blob_client(blob.name)
                 local_file_path = Path(base_path) / blob.name
-                local_file_path.parent.mkdir(parents=True, exist_ok=True)
+                if self._is_unchanged(blob, local_file_path, manifest.get(blob.name)):
+                    skipped_files += 1
+                else:
+                    pending.append((blob, local_file_path))
+
+            downloaded_files = 0
+            downloaded_bytes = 0
+            errors = []
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {
+                    executor.submit(self._download_blob, blob, local_file_path): blob
+                    for blob, local_file_path in pending
+                }
+                for future in as_completed(futures):
+                    blob = futures[future]
+                    try:
+                        manifest[blob.name] = future.result()
+                        downloaded_files += 1
+                        downloaded_bytes += manifest[blob.name]["size"]
+                    except Exception as e:
+                        errors.append(f"{blob.name}: {e}")
+
+            # Record what did succeed, so a retry only fetches the rest
+            self._save_manifest(manifest_path, manifest)
 
-                blob_data = blob_client.download_blob()
-                with open(local_file_path, "wb") as download_file:
-                    download_file.write(blob_data.readall())
-                downloaded_files += 1
+            elapsed = time.perf_counter() - start_time
+            self.last_transfer_stats = {
+                "downloaded_files": downloaded_files,
+                "skipped_files": skipped_files,
+                "failed_files": len(errors),
+                "bytes": downloaded_bytes,
+                "seconds": round(elapsed, 3),
+                "bytes_per_second": round(downloaded_bytes / elapsed, 1) if elapsed > 0 else None
+            }
 
-            print(f"Successfully downloaded {downloaded_files} files from Azure Blob Storage")
+            if errors:
+                raise IOError(f"{len(errors)} blob(s) failed: {'; '.join(errors)}")
+
+            print(f"Successfully downloaded {downloaded_files} files from Azure Blob Storage "
+                  f"({skipped_files} unchanged skipped, {downloaded_bytes / 1e6:.1f} MB "
+                  f"at {downloaded_bytes / 1e6 / max(elapsed, 1e-9):.1f} MB/s)")
             return True
 
         except Exception as e:
             print(f"Failed to download from Azure Blob Storage: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _file_sha256(path, chunk_size=4 * 1024 * 1024):
+        """Stream a file through SHA-256 and return the hex digest."""
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _upload_file(self, local_file_path, blob_name, sha256, block_size, block_executor):
+        """
+        Upload one file, committing it atomically with its SHA-256 in the blob metadata.
+
+        Files larger than block_size are staged as blocks in parallel and become
+        visible only when the block list is committed; smaller files are sent in a
+        single (equally atomic) request.
+
+        Returns:
+            int: Number of bytes uploaded
+        """
+        blob_client = self.container_client.get_blob_client(blob_name)
+        size = local_file_path.stat().st_size
+        metadata = {"sha256": sha256}
+
+        if size <= block_size:
+            blob_client.upload_blob(local_file_path.read_bytes(), overwrite=True, metadata=metadata)
+            return size
+
+        def stage(block_id, offset):
+            with open(local_file_path, "rb") as f:
+                f.seek(offset)
+                data = f.read(block_size)
+            blob_client.stage_block(block_id, data, length=len(data))
+
+        offsets = list(range(0, size, block_size))
+        # Fixed-width ids: Azure requires all block ids of a blob to have the same length
+        block_ids = [f"{index:08d}" for index in range(len(offsets))]
+        list(block_executor.map(stage, block_ids, offsets))
+        blob_client.commit_block_list(block_ids, metadata=metadata)
+        return size
+
+    def upload_documents(self, project_folder, document_folder, base_path="../", block_size=4 * 1024 * 1024):
+        """
+        Incrementally sync a local folder to Azure Blob Storage.
+
+        Mirror of download_documents: {base_path}/{project_folder}/{document_folder} is
+        uploaded to the {project_folder}/{document_folder}/ prefix. Hidden files and
+        folders (manifests, caches) and partial downloads are ignored. Files whose
+        SHA-256 equals the remote blob's 'sha256' metadata are skipped. Checkpoint
+        metadata files (*.metadata.json) are committed last, and only for models whose
+        other files uploaded successfully, so readers never see a half-pushed model.
+
+        Args:
+            project_folder: Name of the project folder in blob storage
+            document_folder: Name of the document folder in blob storage
+            base_path: Local base path of the folder (default: "../")
+            block_size: Block size for parallel uploads of large files
+
+        Returns:
+            bool: True if upload successful, False otherwise
+        """
+        try:
+            start_time = time.perf_counter()
+            base_path = Path(base_path)
+            specific_dir = base_path / project_folder / document_folder
+            if not specific_dir.is_dir():
+                raise FileNotFoundError(f"Local folder not found: {specific_dir}")
+
+            remote_path = f"{project_folder}/{document_folder}/"
+            remote_hashes = {
+                blob.name: (blob.metadata or {}).get("sha256")
+                for blob in self.container_client.list_blobs(name_starts_with=remote_path, include=["metadata"])
+            }
+
+            local_files = sorted(
+                path for path in specific_dir.rglob("*")
+                if path.is_file()
+                and not any(part.startswith(".") for part in path.relative_to(specific_dir).parts)
+                and not path.name.endswith((".part", ".tmp"))
+            )
+
+            pending = []
+            skipped_files = 0
+            for local_file_path in local_files:
+                blob_name = local_file_path.relative_to(base_path).as_posix()
+                sha256 = self._file_sha256(local_file_path)
+                if remote_hashes.get(blob_name) == sha256:
+                    skipped_files += 1
+                else:
+                    pending.append((local_file_path, blob_name, sha256))
+
+            # Metadata files mark a checkpoint as complete, so they go in a second phase
+            phases = [
+                [item for item in pending if not item[0].name.endswith(".metadata.json")],
+                [item for item in pending if item[0].name.endswith(".metadata.json")]
+            ]
+
+            uploaded_files = 0
+            uploaded_bytes = 0
+            errors = []
+            failed_models = set()
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as file_executor, \
+                    ThreadPoolExecutor(max_workers=self.max_concurrency) as block_executor:
+                for phase, items in enumerate(phases):
+                    if phase == 1:
+                        items = [item for item in items if item[0].name.split(".")[0] not in failed_models]
+                    futures = {
+                        file_executor.submit(self._upload_file, path, blob_name, sha256, block_size, block_executor):
+                            (path, blob_name)
+                        for path, blob_name, sha256 in items
+                    }
+                    for future in as_completed(futures):
+                        path, blob_name = futures[future]
+                        try:
+                            uploaded_bytes += future.result()
+                            uploaded_files += 1
+                        except Exception as e:
+                            errors.append(f"{blob_name}: {e}")
+                            failed_models.add(path.name.split(".")[0])
+
+            elapsed = time.perf_counter() - start_time
+            self.last_transfer_stats = {
+                "uploaded_files": uploaded_files,
+                "skipped_files": skipped_files,
+                "failed_files": len(errors),
+                "bytes": uploaded_bytes,
+                "seconds": round(elapsed, 3),
+                "bytes_per_second": round(uploaded_bytes / elapsed, 1) if elapsed > 0 else None
+            }
+
+            if errors:
+                raise IOError(f"{len(errors)} file(s) failed: {'; '.join(errors)}")
+
+            print(f"Successfully uploaded {uploaded_files} files to Azure Blob Storage "
+                  f"({skipped_files} unchanged skipped, {uploaded_bytes / 1e6:.1f} MB "
+                  f"at {uploaded_bytes / 1e6 / max(elapsed, 1e-9):.1f} MB/s)")
+            return True
+
+        except Exception as e:
+            print(f"Failed to upload to Azure Blob Storage: {e}")
+            return False
@@ -0,0 +1,271 @@
+"""
+Columnar float32 feature store for the processed datasets.
+
+Persists a processed frame (e.g. df_complete / df_labeled) as a directory of
+plain .npy files: a contiguous row-major float32 feature block plus separate
+txId and label arrays. Loading memory-maps the files, so arrays are NumPy views
+of the page cache (no parsing, no copies, shared between processes), and a
+pandas adapter rebuilds the frame layout the notebooks expect.
+
+Usage:
+    from feature_store import FeatureStore, write_feature_store, convert_hdf, benchmark_load
+
+    store_path = convert_hdf(
+        "../processed/elliptic_bitcoin_dataset/df_labeled.h5", key="df_labeled",
+        store_path="../processed/elliptic_bitcoin_dataset/df_labeled.features"
+    )
+
+    store = FeatureStore(store_path)
+    X, y, tx_ids = store.features, store.labels, store.tx_ids   # memory-mapped views
+    df_labeled = store.to_pandas()                               # same columns as the HDF5 frame
+
+    print(benchmark_load("../processed/elliptic_bitcoin_dataset/df_labeled.h5", "df_labeled", store_path))
+"""
+
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+FEATURES_FILE = "features.npy"
+TX_IDS_FILE = "tx_ids.npy"
+LABELS_FILE = "labels.npy"
+META_FILE = "meta.json"
+
+
+class _FeatureStoreWriter:
+    """
+    Incremental writer of a feature store (used for chunked conversions).
+
+    Arrays are preallocated with np.lib.format.open_memmap and filled chunk by
+    chunk; the store directory is written under a temporary name and renamed
+    when complete.
+    """
+
+    def __init__(self, store_path, n_rows, feature_names, id_column, label_column, columns):
+        self.store_path = Path(store_path)
+        self.tmp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+        self.tmp_path.mkdir(parents=True)
+
+        n_features = len(feature_names)
+        self.features = np.lib.format.open_memmap(
+            self.tmp_path / FEATURES_FILE, mode="w+", dtype=np.float32, shape=(n_rows, n_features)
+        )
+        self.tx_ids = np.lib.format.open_memmap(self.tmp_path / TX_IDS_FILE, mode="w+", dtype=np.int64, shape=(n_rows,))
+        self.labels = np.lib.format.open_memmap(self.tmp_path / LABELS_FILE, mode="w+", dtype=np.float32, shape=(n_rows,))
+        self.meta = {
+            "n_rows": int(n_rows),
+            "n_features": n_features,
+            "feature_names": [_json_name(name) for name in feature_names],
+            "columns": [_json_name(name) for name in columns],
+            "id_column": id_column,
+            "label_column": label_column,
+            "dtype": "float32"
+        }
+        self.position = 0
+
+    def append(self, df):
+        """Write the next chunk of rows."""
+        stop = self.position + len(df)
+        self.features[self.position:stop] = df[self.meta["feature_names"]].to_numpy(dtype=np.float32)
+        self.tx_ids[self.position:stop] = df[self.meta["id_column"]].to_numpy(dtype=np.int64)
+        if self.meta["label_column"] in df.columns:
+            self.labels[self.position:stop] = df[self.meta["label_column"]].to_numpy(dtype=np.float32)
+        else:
+            self.labels[self.position:stop] = np.nan
+        self.position = stop
+
+    def close(self):
+        """Flush arrays, write metadata and move the store into place."""
+        if self.position != self.meta["n_rows"]:
+            raise ValueError(f"Expected {self.meta['n_rows']} rows, got {self.position}")
+        for array in (self.features, self.tx_ids, self.labels):
+            array.flush()
+        del self.features, self.tx_ids, self.labels
+
+        with open(self.tmp_path / META_FILE, "w") as f:
+            json.dump(self.meta, f, indent=2)
+
+        shutil.rmtree(self.store_path, ignore_errors=True)
+        os.replace(self.tmp_path, self.store_path)
+
+
+def _json_name(name):
+    """Column name as a JSON-serializable value (numpy integer names become int)."""
+    return name.item() if isinstance(name, np.generic) else name
+
+
+def _feature_names(columns, id_column, label_column):
+    """Feature columns of a processed frame, in frame order."""
+    return [column for column in columns if column not in (id_column, label_column)]
+
+
+def write_feature_store(df, store_path, id_column="txId", label_column="class"):
+    """
+    Persist a processed frame as a feature store.
+
+    Args:
+        df (pd.DataFrame): Frame with an id column, an optional label column and feature columns
+        store_path (str | Path): Output directory (replaced if it exists)
+        id_column (str): Transaction id column
+        label_column (str): Label column (stored as float32, NaN for unlabeled rows)
+
+    Returns:
+        Path: Store directory
+    """
+    feature_names = _feature_names(df.columns, id_column, label_column)
+    writer = _FeatureStoreWriter(store_path, len(df), feature_names, id_column, label_column, df.columns)
+    writer.append(df)
+    writer.close()
+    return Path(store_path)
+
+
+def convert_hdf(h5_path, key, store_path=None, id_column="txId", label_column="class", chunk_size=100_000):
+    """
+    Convert a pandas HDF5 "table" frame into a feature store, chunk by chunk.
+
+    Args:
+        h5_path (str | Path): Processed HDF5 file (e.g. df_labeled.h5)
+        key (str): Key of the frame inside the store
+        store_path (str | Path): Output directory (default: <h5 stem>.features next to the file)
+        id_column (str): Transaction id column
+        label_column (str): Label column
+        chunk_size (int): Rows converted per chunk (bounds peak memory)
+
+    Returns:
+        Path: Store directory
+    """
+    h5_path = Path(h5_path)
+    store_path = Path(store_path) if store_path is not None else h5_path.with_name(f"{h5_path.stem}.features")
+
+    with pd.HDFStore(h5_path, mode="r") as hdf:
+        n_rows = int(hdf.get_storer(key).nrows)
+        columns = list(hdf.select(key, start=0, stop=0).columns)
+        writer = _FeatureStoreWriter(
+            store_path, n_rows, _feature_names(columns, id_column, label_column), id_column, label_column, columns
+        )
+        for start in range(0, n_rows, chunk_size):
+            writer.append(hdf.select(key, start=start, stop=start + chunk_size))
+        writer.close()
+
+    print(f"✅ {h5_path.name} [{key}] → {store_path} ({n_rows:,} rows)")
+    return store_path
+
+
+class FeatureStore:
+    """
+    Memory-mapped, read-only view of a feature store.
+
+    Attributes:
+        path: Store directory
+        features: float32 array of shape (n_rows, n_features), row-major
+        tx_ids: int64 array of transaction ids
+        labels: float32 array of labels (NaN for unlabeled rows)
+        feature_names: Feature column names, in stored order
+    """
+
+    def __init__(self, path, mmap_mode="r"):
+        """
+        Open a feature store.
+
+        Args:
+            path (str | Path): Store directory
+            mmap_mode (str): np.load mmap_mode ('r' shares pages read-only; None loads into memory)
+        """
+        self.path = Path(path)
+        with open(self.path / META_FILE, "r") as f:
+            self.meta = json.load(f)
+
+        self.features = np.load(self.path / FEATURES_FILE, mmap_mode=mmap_mode)
+        self.tx_ids = np.load(self.path / TX_IDS_FILE, mmap_mode=mmap_mode)
+        self.labels = np.load(self.path / LABELS_FILE, mmap_mode=mmap_mode)
+        self.feature_names = self.meta["feature_names"]
+
+    @property
+    def shape(self):
+        return self.features.shape
+
+    def __len__(self):
+        return self.meta["n_rows"]
+
+    def labeled_mask(self):
+        """Boolean mask of rows with a label."""
+        return ~np.isnan(self.labels)
+
+    def to_pandas(self, include_id=True, include_label=True):
+        """
+        Pandas adapter returning the frame layout of the original HDF5 data.
+
+        The feature block wraps the memory-mapped array without copying.
+
+        Args:
+            include_id (bool): Include the id column
+            include_label (bool): Include the label column
+
+        Returns:
+            pd.DataFrame: Columns in the original order (features as float32)
+        """
+        df = pd.DataFrame(self.features, columns=self.feature_names, copy=False)
+        if include_id:
+            df.insert(self.meta["columns"].index(self.meta["id_column"]), self.meta["id_column"], self.tx_ids)
+        if include_label and self.meta["label_column"] in self.meta["columns"]:
+            df[self.meta["label_column"]] = self.labels
+            df = df[[c for c in self.meta["columns"] if c in df.columns]]
+        return df
+
+
+def _measure_load(loader, source, key):
+    """Load a dataset in a fresh process and report seconds and resident memory growth."""
+    import psutil
+
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    start_time = time.perf_counter()
+
+    if loader == "hdf":
+        df = pd.read_hdf(source, key=key)
+        checksum = float(df.drop(columns=["txId", "class"], errors="ignore").to_numpy().sum())
+    else:
+        store = FeatureStore(source)
+        checksum = float(store.features.sum(dtype=np.float64))
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        "seconds": round(elapsed, 4),
+        "rss_mb": round((process.memory_info().rss - rss_before) / 1e6, 1),
+        "checksum": checksum
+    }
+
+
+def benchmark_load(h5_path, key, store_path):
+    """
+    Compare load time and resident memory of pd.read_hdf against the feature store.
+
+    Each loader runs in a fresh process and touches every feature value once
+    (a full sum), so both paths read all data.
+
+    Args:
+        h5_path (str | Path): Processed HDF5 file
+        key (str): Key of the frame inside the HDF5 store
+        store_path (str | Path): Feature store directory
+
+    Returns:
+        dict: Seconds and RSS growth (MB) of both loaders, plus speedup
+    """
+    results = {}
+    for loader, source in (("hdf", str(h5_path)), ("feature_store", str(store_path))):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            results[loader] = executor.submit(_measure_load, loader, source, key).result()
+
+    results["speedup"] = round(results["hdf"]["seconds"] / max(results["feature_store"]["seconds"], 1e-9), 1)
+    print(f"HDF5: {results['hdf']['seconds']:.3f}s / {results['hdf']['rss_mb']:.0f} MB | "
+          f"feature store: {results['feature_store']['seconds']:.3f}s / {results['feature_store']['rss_mb']:.0f} MB")
+    return results
@@ -0,0 +1,418 @@
+"""
+Sparse graph features over the Elliptic transaction edge list.
+
+Builds CSR adjacency matrices (out: source → destination, in, and undirected)
+from df_edges once, then computes vectorized neighborhood aggregates with sparse
+matrix products: degrees, k-hop neighbor feature means and maxima, and the
+fraction of known-illicit neighbors. Results are cached as a feature store next
+to the processed dataset and can be joined onto any frame by txId.
+
+Usage:
+    from graph_features import TransactionGraph, compute_graph_features, load_graph_features, join_graph_features
+
+    graph = TransactionGraph.from_frames(df_complete, df_edges)
+    df_graph = compute_graph_features(graph, df_complete, k_hops=2, feature_columns=[2, 3, 4])
+
+    # Cached next to ../processed/elliptic_bitcoin_dataset/df_complete.h5 and df_edges.h5;
+    # neighbor label ratios only use the labels of the training transactions
+    df_graph = load_graph_features("../processed/elliptic_bitcoin_dataset", k_hops=2,
+                                   label_mask=df_train["txId"])
+    df_labeled = join_graph_features(df_labeled, df_graph)
+"""
+
+import hashlib
+import json
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from feature_store import FeatureStore, write_feature_store
+
+
+GRAPH_FEATURES_NAME = "graph_features"
+
+# Neighborhood direction -> feature name suffix
+NEIGHBORHOODS = {"undirected": "", "in": "_in", "out": "_out"}
+
+# Nodes with more neighbors than this are reduced individually in neighbor-max aggregation
+HUB_DEGREE = 256
+
+# Columns computed from neighbor labels (leak evaluation labels unless masked)
+LABEL_RATIO_PREFIXES = ("graph_illicit_ratio", "graph_labeled_ratio")
+
+
+class TransactionGraph:
+    """
+    Directed transaction graph stored as CSR adjacency matrices.
+
+    Node i is the i-th entry of tx_ids; edges whose endpoints are not known
+    nodes are dropped, and duplicate edges are counted once.
+
+    Attributes:
+        tx_ids: Transaction id of every node, in node order
+        out_adj: CSR matrix with out_adj[i, j] = 1 for an edge i → j
+        in_adj: CSR matrix with in_adj[i, j] = 1 for an edge j → i
+        undirected_adj: CSR matrix of the symmetrized graph
+    """
+
+    def __init__(self, tx_ids, sources, destinations):
+        """
+        Build the adjacency matrices.
+
+        Args:
+            tx_ids (array-like): Transaction ids of the nodes
+            sources (array-like): Source transaction id of every edge
+            destinations (array-like): Destination transaction id of every edge
+        """
+        self.tx_ids = np.asarray(tx_ids, dtype=np.int64)
+        n_nodes = len(self.tx_ids)
+
+        rows = self.node_index(sources)
+        cols = self.node_index(destinations)
+        known = (rows >= 0) & (cols >= 0)
+        self.n_dropped_edges = int((~known).sum())
+
+        out_adj = sp.csr_matrix(
+            (np.ones(int(known.sum()), dtype=np.float32), (rows[known], cols[known])), shape=(n_nodes, n_nodes)
+        )
+        out_adj.sum_duplicates()
+        out_adj.data[:] = 1.0
+        self.out_adj = out_adj
+        self.in_adj = out_adj.T.tocsr()
+
+        undirected_adj = (out_adj + self.in_adj).tocsr()
+        undirected_adj.data[:] = 1.0
+        self.undirected_adj = undirected_adj
+        self._normalized = {}
+
+    @classmethod
+    def from_frames(cls, df_nodes, df_edges, id_column="txId", source_column="source", destination_column="destination"):
+        """
+        Build the graph from the processed node and edge frames.
+
+        Args:
+            df_nodes (pd.DataFrame): Node frame (e.g. df_complete)
+            df_edges (pd.DataFrame): Edge frame with source / destination transaction ids
+            id_column (str): Transaction id column of df_nodes
+            source_column (str): Source column of df_edges
+            destination_column (str): Destination column of df_edges
+
+        Returns:
+            TransactionGraph
+        """
+        return cls(df_nodes[id_column].to_numpy(), df_edges[source_column].to_numpy(),
+                   df_edges[destination_column].to_numpy())
+
+    @property
+    def n_nodes(self):
+        return len(self.tx_ids)
+
+    @property
+    def n_edges(self):
+        return self.out_adj.nnz
+
+    def node_index(self, tx_ids):
+        """
+        Node index of each transaction id (-1 for unknown ids).
+
+        Args:
+            tx_ids (array-like): Transaction ids
+
+        Returns:
+            np.ndarray: int64 node indices
+        """
+        if not hasattr(self, "_sorter"):
+            self._sorter = np.argsort(self.tx_ids, kind="stable")
+            self._sorted_ids = self.tx_ids[self._sorter]
+
+        tx_ids = np.asarray(tx_ids, dtype=np.int64)
+        positions = np.searchsorted(self._sorted_ids, tx_ids)
+        positions = np.minimum(positions, len(self._sorted_ids) - 1)
+        found = self._sorted_ids[positions] == tx_ids if len(self._sorted_ids) else np.zeros(len(tx_ids), dtype=bool)
+        return np.where(found, self._sorter[positions], -1)
+
+    def adjacency(self, direction):
+        """Adjacency matrix for 'in', 'out' or 'undirected'."""
+        if direction == "in":
+            return self.in_adj
+        if direction == "out":
+            return self.out_adj
+        if direction == "undirected":
+            return self.undirected_adj
+        raise ValueError(f"Unknown direction '{direction}'. Use 'in', 'out' or 'undirected'")
+
+    def degrees(self, direction="undirected"):
+        """Number of distinct neighbors of every node."""
+        return np.diff(self.adjacency(direction).indptr).astype(np.float32)
+
+    def normalized_adjacency(self, direction="undirected"):
+        """Row-normalized adjacency (D^-1 A); rows of isolated nodes stay zero. Built once per direction."""
+        if direction not in self._normalized:
+            adj = self.adjacency(direction)
+            degrees = self.degrees(direction)
+            inverse = np.divide(1.0, degrees, out=np.zeros_like(degrees), where=degrees > 0)
+            self._normalized[direction] = sp.diags(inverse).dot(adj).tocsr()
+        return self._normalized[direction]
+
+
+def _neighbor_max(adj, values):
+    """
+    Column-wise max of the values of each row's neighbors (NaN for isolated nodes).
+
+    Rows are ordered by degree and reduced one neighbor slot at a time, so every
+    step is a single vectorized gather over the rows that still have neighbors left
+    (total work proportional to nnz). Hub rows with more than HUB_DEGREE neighbors
+    are reduced individually to keep the number of slot steps bounded. NaN inputs
+    are ignored.
+    """
+    n_nodes = adj.shape[0]
+    result = np.full((n_nodes, values.shape[1]), np.nan, dtype=np.float32)
+    indptr, indices = adj.indptr, adj.indices
+    degrees = np.diff(indptr)
+
+    for row in np.flatnonzero(degrees > HUB_DEGREE):
+        result[row] = np.fmax.reduce(values[indices[indptr[row]:indptr[row + 1]]], axis=0)
+
+    order = np.argsort(-np.minimum(degrees, HUB_DEGREE + 1), kind="stable")
+    order = order[(degrees[order] > 0) & (degrees[order] <= HUB_DEGREE)]
+    sorted_degrees = degrees[order]
+    for slot in range(int(sorted_degrees[0]) if len(order) else 0):
+        rows = order[:np.count_nonzero(sorted_degrees > slot)]
+        gathered = values[indices[indptr[rows] + slot]]
+        if slot > 0:
+            np.fmax(result[rows], gathered, out=gathered)
+        result[rows] = gathered
+
+    return result
+
+
+def _known_labels(labels, label_mask, illicit_label):
+    """Float32 indicators of usable labels and of usable illicit labels."""
+    known = ~np.isnan(labels)
+    if label_mask is not None:
+        known &= np.asarray(label_mask, dtype=bool)
+    return known.astype(np.float32), (known & (labels == illicit_label)).astype(np.float32)
+
+
+def _neighborhood_columns(adjacencies, labels, label_mask, illicit_label):
+    """
+    Degree and known-illicit / labeled neighbor ratio columns.
+
+    Args:
+        adjacencies (dict): Direction name -> CSR matrix whose rows are the output rows
+            and whose columns index all nodes
+        labels (np.ndarray): Label of every node (NaN if unknown), or None to skip the ratios
+        label_mask (np.ndarray): Boolean mask of nodes whose label may be used
+        illicit_label (int): Label value of illicit transactions
+
+    Returns:
+        dict: Column name -> values
+    """
+    columns = {}
+    for name, adj in adjacencies.items():
+        columns[f"graph_degree{NEIGHBORHOODS[name]}"] = np.diff(adj.indptr).astype(np.float32)
+
+    if labels is not None:
+        known, illicit = _known_labels(labels, label_mask, illicit_label)
+        for name, adj in adjacencies.items():
+            suffix = NEIGHBORHOODS[name]
+            degrees = columns[f"graph_degree{suffix}"]
+            columns[f"graph_illicit_ratio{suffix}"] = np.divide(
+                adj.dot(illicit), degrees, out=np.zeros_like(degrees), where=degrees > 0
+            )
+            columns[f"graph_labeled_ratio{suffix}"] = np.divide(
+                adj.dot(known), degrees, out=np.zeros_like(degrees), where=degrees > 0
+            )
+    return columns
+
+
+def _hop_columns(hop, feature_columns, hop_mean, hop_max, isolated, fill_value):
+    """Output columns of one hop; isolated rows and NaN maxima get fill_value."""
+    output_mean = hop_mean.copy()
+    output_mean[isolated] = fill_value
+    output_max = np.where(np.isnan(hop_max), np.float32(fill_value), hop_max)
+
+    columns = {}
+    for i, column in enumerate(feature_columns):
+        columns[f"graph_hop{hop}_mean_{column}"] = output_mean[:, i]
+    for i, column in enumerate(feature_columns):
+        columns[f"graph_hop{hop}_max_{column}"] = output_max[:, i]
+    return columns
+
+
+def compute_graph_features(graph, df_nodes, k_hops=2, feature_columns=None, direction="undirected",
+                           id_column="txId", label_column="class", illicit_label=0, label_mask=None,
+                           fill_value=0.0):
+    """
+    Compute neighborhood features for every node of the graph.
+
+    Hop-k means propagate the node features k times through the row-normalized
+    adjacency (mean over k-step walks); hop-k maxima repeat the neighbor max k
+    times (max over nodes reachable in exactly k steps). Illicit ratios count
+    neighbors whose known label equals illicit_label over all neighbors; pass
+    label_mask (e.g. training rows only) to keep evaluation labels from leaking
+    into the features.
+
+    Args:
+        graph (TransactionGraph): Graph whose nodes are the rows of df_nodes, in order
+        df_nodes (pd.DataFrame): Node frame with id, label and feature columns
+        k_hops (int): Number of hops of the mean / max aggregates
+        feature_columns (list): Columns to aggregate (all feature columns if None)
+        direction (str): Adjacency used by the hop aggregates ('in', 'out' or 'undirected')
+        id_column (str): Transaction id column
+        label_column (str): Label column (NaN for unlabeled rows)
+        illicit_label (int): Label value of illicit transactions
+        label_mask (np.ndarray): Boolean mask of rows whose label may be used (all labeled rows if None)
+        fill_value (float): Value of hop aggregates for nodes without neighbors
+
+    Returns:
+        pd.DataFrame: txId column followed by graph feature columns, in node order
+    """
+    if len(df_nodes) != graph.n_nodes:
+        raise ValueError(f"df_nodes has {len(df_nodes)} rows but the graph has {graph.n_nodes} nodes")
+    if k_hops < 0:
+        raise ValueError("k_hops must be >= 0")
+
+    columns = {id_column: graph.tx_ids}
+    adjacencies = {name: graph.adjacency(name) for name in NEIGHBORHOODS}
+    labels = df_nodes[label_column].to_numpy(dtype=np.float64) if label_column in df_nodes.columns else None
+    columns.update(_neighborhood_columns(adjacencies, labels, label_mask, illicit_label))
+
+    # k-hop feature aggregates
+    if feature_columns is None:
+        feature_columns = [c for c in df_nodes.columns if c not in (id_column, label_column)]
+    values = np.ascontiguousarray(df_nodes[feature_columns].to_numpy(dtype=np.float32))
+
+    adj = graph.adjacency(direction)
+    normalized = graph.normalized_adjacency(direction)
+    isolated = graph.degrees(direction) == 0
+    hop_mean, hop_max = values, values
+    for hop in range(1, k_hops + 1):
+        hop_mean = normalized.dot(hop_mean).astype(np.float32, copy=False)
+        hop_max = _neighbor_max(adj, hop_max)
+        columns.update(_hop_columns(hop, feature_columns, hop_mean, hop_max, isolated, fill_value))
+
+    return pd.DataFrame(columns)
+
+
+def _source_signature(path):
+    """Size and modification time identifying a cached input file."""
+    stat = Path(path).stat()
+    return {"path": str(path), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _node_label_mask(df_nodes, label_mask, id_column="txId"):
+    """Boolean mask over node rows from a row mask or a collection of transaction ids."""
+    label_mask = np.asarray(label_mask)
+    if label_mask.dtype == bool:
+        if len(label_mask) != len(df_nodes):
+            raise ValueError(f"label_mask has {len(label_mask)} entries but there are {len(df_nodes)} nodes")
+        return label_mask
+    return df_nodes[id_column].isin(label_mask).to_numpy()
+
+
+def load_graph_features(processed_dir, k_hops=2, feature_columns=None, direction="undirected",
+                        illicit_label=0, nodes_name="df_complete", edges_name="df_edges", refresh=False,
+                        label_mask=None):
+    """
+    Graph features of the processed dataset, computed once and cached next to it.
+
+    The cache (graph_features_<hash>.features, a feature store) is reused while the
+    parameters, the label mask and the source HDF5 files are unchanged.
+
+    Elliptic edges only link transactions of the same time step, so neighbor label
+    ratios built from every label would give held-out rows the labels of their
+    held-out neighbors. The graph_illicit_ratio* / graph_labeled_ratio* columns are
+    therefore only returned when label_mask says which labels may be used (e.g. the
+    training transactions); without it they are dropped with a warning.
+
+    Args:
+        processed_dir (str | Path): Processed dataset directory (e.g. ../processed/elliptic_bitcoin_dataset)
+        k_hops (int): Number of hops of the mean / max aggregates
+        feature_columns (list): Columns to aggregate (all feature columns if None)
+        direction (str): Adjacency used by the hop aggregates
+        illicit_label (int): Label value of illicit transactions
+        nodes_name (str): Name (file stem and HDF5 key) of the node frame
+        edges_name (str): Name (file stem and HDF5 key) of the edge frame
+        refresh (bool): Recompute even if a valid cache exists
+        label_mask (array-like): Labels usable by the neighbor label ratios: a boolean mask
+            over the rows of the node frame, or the transaction ids (e.g. training rows);
+            None drops the ratio columns
+
+    Returns:
+        pd.DataFrame: txId column followed by graph feature columns
+    """
+    processed_dir = Path(processed_dir)
+    nodes_path = processed_dir / f"{nodes_name}.h5"
+    edges_path = processed_dir / f"{edges_name}.h5"
+
+    df_nodes = None
+    mask_digest = None
+    if label_mask is not None:
+        df_nodes = pd.read_hdf(nodes_path, key=nodes_name)
+        label_mask = _node_label_mask(df_nodes, label_mask)
+        mask_digest = hashlib.sha256(np.packbits(label_mask).tobytes()).hexdigest()
+    else:
+        warnings.warn("load_graph_features without label_mask: neighbor label ratio columns are dropped, "
+                      "since they would use the labels of evaluation rows")
+
+    params = {
+        "k_hops": k_hops,
+        "feature_columns": None if feature_columns is None else [str(c) for c in feature_columns],
+        "direction": direction,
+        "illicit_label": illicit_label,
+        "label_mask": mask_digest,
+        "sources": [_source_signature(nodes_path), _source_signature(edges_path)]
+    }
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+    store_path = processed_dir / f"{GRAPH_FEATURES_NAME}_{digest}.features"
+
+    if store_path.exists() and not refresh:
+        print(f"✅ Graph features loaded from cache: {store_path.name}")
+        return FeatureStore(store_path).to_pandas(include_label=False)
+
+    if df_nodes is None:
+        df_nodes = pd.read_hdf(nodes_path, key=nodes_name)
+    df_edges = pd.read_hdf(edges_path, key=edges_name)
+    graph = TransactionGraph.from_frames(df_nodes, df_edges)
+    df_graph = compute_graph_features(graph, df_nodes, k_hops=k_hops, feature_columns=feature_columns,
+                                      direction=direction, illicit_label=illicit_label, label_mask=label_mask)
+    if label_mask is None:
+        df_graph = df_graph.drop(columns=[c for c in df_graph.columns if c.startswith(LABEL_RATIO_PREFIXES)])
+
+    write_feature_store(df_graph, store_path)
+    with open(store_path / "params.json", "w") as f:
+        json.dump(params, f, indent=2)
+
+    print(f"✅ Graph features computed: {graph.n_nodes:,} nodes, {graph.n_edges:,} edges, "
+          f"{df_graph.shape[1] - 1} features → {store_path.name}")
+    return df_graph
+
+
+def join_graph_features(df, df_graph, id_column="txId", label_column="class"):
+    """
+    Append graph features to a frame by transaction id, preserving its row order.
+
+    Args:
+        df (pd.DataFrame): Frame with an id column (e.g. df_labeled)
+        df_graph (pd.DataFrame): Output of compute_graph_features / load_graph_features
+        id_column (str): Transaction id column
+        label_column (str): Label column kept last, as in the processed frames
+
+    Returns:
+        pd.DataFrame: df with the graph feature columns inserted before the label column
+    """
+    graph_columns = [c for c in df_graph.columns if c != id_column]
+    positions = pd.Index(df_graph[id_column]).get_indexer(df[id_column])
+    if (positions < 0).any():
+        raise ValueError(f"{int((positions < 0).sum())} transactions have no graph features")
+
+    graph_part = pd.DataFrame(
+        {c: df_graph[c].to_numpy()[positions] for c in graph_columns}, index=df.index
+    )
+    if label_column in df.columns:
+        return pd.concat([df.drop(columns=label_column), graph_part, df[[label_column]]], axis=1)
+    return pd.concat([df, graph_part], axis=1)
@@ -0,0 +1,393 @@
+"""
+Incremental graph-feature state for streaming transactions.
+
+Keeps the transaction graph in growable adjacency structures (a CSR base plus
+per-node lists of appended edges) together with the raw hop aggregates of every
+node. Each batch of new transactions / edges only recomputes the rows whose
+neighborhood changed: the batch's nodes and edge endpoints for degrees, ratios
+and hop 1, then their neighbors for every further hop. The updated rows are
+returned for re-scoring, with the same columns as compute_graph_features.
+
+Usage:
+    from incremental_graph import IncrementalGraphState
+
+    state = IncrementalGraphState.from_frames(df_complete, df_edges, k_hops=2, feature_columns=[2, 3, 4])
+
+    df_updated = state.apply_batch(df_new_transactions, df_new_edges)   # txId + graph features
+    df_updated = state.update_labels([230425980], [0])                  # e.g. confirmed illicit
+    print(state.last_batch_stats)
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from graph_features import NEIGHBORHOODS, TransactionGraph, _hop_columns, _neighbor_max, _neighborhood_columns
+
+
+class _GrowableAdjacency:
+    """
+    Directed adjacency as a CSR base plus per-row lists of appended neighbors.
+
+    Appended edges are merged into the base once they exceed compact_ratio times
+    its size, so the amortized cost per edge stays constant.
+    """
+
+    def __init__(self, csr, compact_ratio=0.25):
+        csr = csr.sorted_indices()
+        self.indptr = csr.indptr.astype(np.int64)
+        self.indices = csr.indices.astype(np.int64)
+        self.n_base_rows = csr.shape[0]
+        self.extra = {}
+        self.n_extra = 0
+        self.compact_ratio = compact_ratio
+
+    @property
+    def nnz(self):
+        return len(self.indices) + self.n_extra
+
+    def has_edge(self, row, col):
+        """Whether the edge row → col exists."""
+        if row < self.n_base_rows:
+            start, stop = self.indptr[row], self.indptr[row + 1]
+            position = start + np.searchsorted(self.indices[start:stop], col)
+            if position < stop and self.indices[position] == col:
+                return True
+        return col in self.extra.get(row, ())
+
+    def add_edge(self, row, col):
+        """Append the edge row → col (caller checks for duplicates)."""
+        self.extra.setdefault(row, []).append(col)
+        self.n_extra += 1
+
+    def rows_coo(self, rows):
+        """
+        Edges of the given rows as (local row position, column) arrays.
+
+        Args:
+            rows (np.ndarray): Node indices
+
+        Returns:
+            tuple: (local_rows, cols) int64 arrays
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        in_base = rows < self.n_base_rows
+        base_positions = np.flatnonzero(in_base)
+        starts = self.indptr[rows[in_base]]
+        counts = self.indptr[rows[in_base] + 1] - starts
+
+        local_rows = [np.repeat(base_positions, counts)]
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        cols = [self.indices[np.repeat(starts, counts) + offsets]]
+
+        # Look up appended edges from whichever side is smaller
+        if len(rows) <= len(self.extra):
+            matches = ((position, self.extra.get(row)) for position, row in enumerate(rows.tolist()))
+        else:
+            sorter = np.argsort(rows)
+            extra_rows = np.fromiter(self.extra, dtype=np.int64, count=len(self.extra))
+            found = np.minimum(np.searchsorted(rows, extra_rows, sorter=sorter), max(len(rows) - 1, 0))
+            matches = (
+                (int(sorter[position]), self.extra[int(row)])
+                for position, row in zip(found, extra_rows) if len(rows) and rows[sorter[position]] == row
+            )
+        for position, neighbors in matches:
+            if neighbors:
+                local_rows.append(np.full(len(neighbors), position, dtype=np.int64))
+                cols.append(np.asarray(neighbors, dtype=np.int64))
+        return np.concatenate(local_rows), np.concatenate(cols)
+
+    def maybe_compact(self, n_rows):
+        """Merge appended edges into the CSR base when they grew past compact_ratio of it."""
+        if self.n_extra <= self.compact_ratio * max(len(self.indices), 1):
+            return False
+
+        local_rows, cols = self.rows_coo(np.arange(n_rows))
+        csr = sp.csr_matrix((np.ones(len(cols), dtype=np.float32), (local_rows, cols)), shape=(n_rows, n_rows))
+        csr.sort_indices()
+        self.indptr = csr.indptr.astype(np.int64)
+        self.indices = csr.indices.astype(np.int64)
+        self.n_base_rows = n_rows
+        self.extra = {}
+        self.n_extra = 0
+        return True
+
+
+class IncrementalGraphState:
+    """
+    Graph features maintained incrementally as transactions and edges arrive.
+
+    Only insertions are supported (transactions and edges are never removed).
+    Features of existing rows match compute_graph_features on the full graph.
+
+    Attributes:
+        k_hops: Number of hop aggregates
+        feature_columns: Node feature columns aggregated over neighbors
+        last_batch_stats: Counters and timing of the last update
+    """
+
+    def __init__(self, graph, df_nodes, k_hops=2, feature_columns=None, direction="undirected",
+                 id_column="txId", label_column="class", illicit_label=0, fill_value=0.0, compact_ratio=0.25):
+        """
+        Initialize state from a full graph (one full computation).
+
+        Args:
+            graph (TransactionGraph): Graph whose nodes are the rows of df_nodes, in order
+            df_nodes (pd.DataFrame): Node frame with id, label and feature columns
+            k_hops (int): Number of hops of the mean / max aggregates
+            feature_columns (list): Columns to aggregate (all feature columns if None)
+            direction (str): Adjacency used by the hop aggregates ('in', 'out' or 'undirected')
+            id_column (str): Transaction id column
+            label_column (str): Label column (NaN for unlabeled rows)
+            illicit_label (int): Label value of illicit transactions
+            fill_value (float): Value of hop aggregates for nodes without neighbors
+            compact_ratio (float): Appended-edge fraction that triggers merging into the CSR base
+        """
+        if len(df_nodes) != graph.n_nodes:
+            raise ValueError(f"df_nodes has {len(df_nodes)} rows but the graph has {graph.n_nodes} nodes")
+        graph.adjacency(direction)
+
+        self.k_hops = k_hops
+        self.direction = direction
+        self.id_column = id_column
+        self.label_column = label_column
+        self.illicit_label = illicit_label
+        self.fill_value = fill_value
+        self.feature_columns = (
+            list(feature_columns) if feature_columns is not None
+            else [c for c in df_nodes.columns if c not in (id_column, label_column)]
+        )
+
+        self.n_nodes = graph.n_nodes
+        self._has_labels = label_column in df_nodes.columns
+        self._index = dict(zip(graph.tx_ids.tolist(), range(graph.n_nodes)))
+        self._out = _GrowableAdjacency(graph.out_adj, compact_ratio)
+        self._in = _GrowableAdjacency(graph.in_adj, compact_ratio)
+
+        self._tx_ids = graph.tx_ids.copy()
+        self._labels = (df_nodes[label_column].to_numpy(dtype=np.float64) if label_column in df_nodes.columns
+                        else np.full(graph.n_nodes, np.nan))
+        self._values = np.ascontiguousarray(df_nodes[self.feature_columns].to_numpy(dtype=np.float32))
+
+        adj = graph.adjacency(direction)
+        normalized = graph.normalized_adjacency(direction)
+        self._hop_means, self._hop_maxes = [], []
+        hop_mean, hop_max = self._values, self._values
+        for _ in range(k_hops):
+            hop_mean = normalized.dot(hop_mean).astype(np.float32, copy=False)
+            hop_max = _neighbor_max(adj, hop_max)
+            self._hop_means.append(hop_mean)
+            self._hop_maxes.append(hop_max)
+
+        self.last_batch_stats = {}
+
+    @classmethod
+    def from_frames(cls, df_nodes, df_edges, source_column="source", destination_column="destination", **kwargs):
+        """
+        Build the state from the processed node and edge frames.
+
+        Args:
+            df_nodes (pd.DataFrame): Node frame (e.g. df_complete)
+            df_edges (pd.DataFrame): Edge frame with source / destination transaction ids
+            source_column (str): Source column of df_edges
+            destination_column (str): Destination column of df_edges
+            **kwargs: IncrementalGraphState options
+
+        Returns:
+            IncrementalGraphState
+        """
+        graph = TransactionGraph.from_frames(df_nodes, df_edges, id_column=kwargs.get("id_column", "txId"),
+                                             source_column=source_column, destination_column=destination_column)
+        return cls(graph, df_nodes, **kwargs)
+
+    @property
+    def n_edges(self):
+        return self._out.nnz
+
+    def _reserve(self, n_nodes):
+        """Grow node arrays (doubling capacity) to hold n_nodes rows."""
+        capacity = len(self._tx_ids)
+        if n_nodes <= capacity:
+            return
+        new_capacity = max(n_nodes, 2 * capacity)
+
+        def grow(array, fill):
+            grown = np.full((new_capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            grown[:capacity] = array
+            return grown
+
+        self._tx_ids = grow(self._tx_ids, -1)
+        self._labels = grow(self._labels, np.nan)
+        self._values = grow(self._values, np.nan)
+        self._hop_means = [grow(array, 0.0) for array in self._hop_means]
+        self._hop_maxes = [grow(array, np.nan) for array in self._hop_maxes]
+
+    def _local_adjacency(self, rows, direction):
+        """CSR matrix (len(rows) × n_nodes) of the given rows' neighbors."""
+        if direction == "out":
+            parts = [self._out.rows_coo(rows)]
+        elif direction == "in":
+            parts = [self._in.rows_coo(rows)]
+        else:
+            parts = [self._out.rows_coo(rows), self._in.rows_coo(rows)]
+        local_rows = np.concatenate([part[0] for part in parts])
+        cols = np.concatenate([part[1] for part in parts])
+
+        adj = sp.csr_matrix((np.ones(len(cols), dtype=np.float32), (local_rows, cols)),
+                            shape=(len(rows), self.n_nodes))
+        adj.sum_duplicates()
+        adj.data[:] = 1.0
+        return adj
+
+    def _neighbors(self, rows):
+        """Distinct undirected neighbors of the given rows."""
+        if len(rows) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate([self._out.rows_coo(rows)[1], self._in.rows_coo(rows)[1]]))
+
+    def _recompute_hops(self, seeds):
+        """Recompute hop aggregates of the rows affected by changes at seeds; returns all touched rows."""
+        touched = seeds
+        rows = seeds
+        for hop in range(self.k_hops):
+            if len(rows) == 0:
+                break
+            previous_values = self._values if hop == 0 else self._hop_means[hop - 1]
+            previous_maxes = self._values if hop == 0 else self._hop_maxes[hop - 1]
+
+            adj = self._local_adjacency(rows, self.direction)
+            degrees = np.diff(adj.indptr).astype(np.float32)
+            inverse = np.divide(1.0, degrees, out=np.zeros_like(degrees), where=degrees > 0)
+            self._hop_means[hop][rows] = sp.diags(inverse).dot(adj).dot(previous_values[:self.n_nodes])
+            self._hop_maxes[hop][rows] = _neighbor_max(adj, previous_maxes[:self.n_nodes])
+
+            # Rows whose next hop reads a value that just changed, plus the seeds
+            # (whose own neighbor sets changed)
+            if hop + 1 < self.k_hops:
+                rows = np.union1d(seeds, self._neighbors(rows))
+                touched = np.union1d(touched, rows)
+        return touched
+
+    def _feature_rows(self, rows):
+        """Output frame (txId + graph features) of the given rows."""
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = {self.id_column: self._tx_ids[rows]}
+
+        adjacencies = {name: self._local_adjacency(rows, name) for name in NEIGHBORHOODS}
+        labels = self._labels[:self.n_nodes] if self._has_labels else None
+        columns.update(_neighborhood_columns(adjacencies, labels, None, self.illicit_label))
+
+        isolated = np.diff(adjacencies[self.direction].indptr) == 0
+        for hop in range(self.k_hops):
+            columns.update(_hop_columns(hop + 1, self.feature_columns, self._hop_means[hop][rows],
+                                        self._hop_maxes[hop][rows], isolated, self.fill_value))
+        return pd.DataFrame(columns)
+
+    def apply_batch(self, df_nodes=None, df_edges=None, source_column="source", destination_column="destination"):
+        """
+        Add new transactions and edges, update affected rows and return them.
+
+        New nodes are added before edges, so edges may reference transactions of the
+        same batch. Edges to unknown transactions and duplicate edges are skipped.
+
+        Args:
+            df_nodes (pd.DataFrame): New transactions (id, optional label, feature columns)
+            df_edges (pd.DataFrame): New edges with source / destination transaction ids
+            source_column (str): Source column of df_edges
+            destination_column (str): Destination column of df_edges
+
+        Returns:
+            pd.DataFrame: txId + graph features of every updated row
+        """
+        start_time = time.perf_counter()
+        new_rows = np.empty(0, dtype=np.int64)
+
+        if df_nodes is not None and len(df_nodes):
+            tx_ids = df_nodes[self.id_column].to_numpy(dtype=np.int64)
+            fresh = np.array([tx_id not in self._index for tx_id in tx_ids.tolist()], dtype=bool)
+            if not fresh.all():
+                raise ValueError(f"{int((~fresh).sum())} transactions already exist in the graph")
+
+            new_rows = np.arange(self.n_nodes, self.n_nodes + len(tx_ids))
+            self._reserve(self.n_nodes + len(tx_ids))
+            self._tx_ids[new_rows] = tx_ids
+            self._values[new_rows] = df_nodes[self.feature_columns].to_numpy(dtype=np.float32)
+            if self._has_labels and self.label_column in df_nodes.columns:
+                self._labels[new_rows] = df_nodes[self.label_column].to_numpy(dtype=np.float64)
+            self._index.update(zip(tx_ids.tolist(), new_rows.tolist()))
+            self.n_nodes += len(tx_ids)
+
+        endpoints = []
+        n_added, n_dropped = 0, 0
+        if df_edges is not None and len(df_edges):
+            for source, destination in zip(df_edges[source_column].tolist(), df_edges[destination_column].tolist()):
+                row, col = self._index.get(source), self._index.get(destination)
+                if row is None or col is None:
+                    n_dropped += 1
+                    continue
+                if self._out.has_edge(row, col):
+                    continue
+                self._out.add_edge(row, col)
+                self._in.add_edge(col, row)
+                endpoints.extend((row, col))
+                n_added += 1
+
+        seeds = np.union1d(new_rows, np.asarray(endpoints, dtype=np.int64))
+        touched = self._recompute_hops(seeds)
+
+        self._out.maybe_compact(self.n_nodes)
+        self._in.maybe_compact(self.n_nodes)
+
+        updated = self._feature_rows(touched)
+        self.last_batch_stats = {
+            "new_nodes": len(new_rows),
+            "new_edges": n_added,
+            "dropped_edges": n_dropped,
+            "updated_rows": len(touched),
+            "seconds": round(time.perf_counter() - start_time, 4)
+        }
+        return updated
+
+    def update_labels(self, tx_ids, labels):
+        """
+        Set labels of existing transactions (e.g. confirmed cases) and return the rows
+        whose neighbor ratios changed.
+
+        Args:
+            tx_ids (array-like): Transaction ids
+            labels (array-like): New labels (NaN to clear)
+
+        Returns:
+            pd.DataFrame: txId + graph features of the affected rows
+        """
+        start_time = time.perf_counter()
+        rows = np.array([self._index[tx_id] for tx_id in np.asarray(tx_ids, dtype=np.int64).tolist()], dtype=np.int64)
+        self._labels[rows] = np.asarray(labels, dtype=np.float64)
+
+        touched = self._neighbors(rows)
+        updated = self._feature_rows(touched)
+        self.last_batch_stats = {
+            "labeled_nodes": len(rows),
+            "updated_rows": len(touched),
+            "seconds": round(time.perf_counter() - start_time, 4)
+        }
+        return updated
+
+    def features(self, tx_ids=None):
+        """
+        Current graph features of the given transactions (all if None).
+
+        Args:
+            tx_ids (array-like): Transaction ids
+
+        Returns:
+            pd.DataFrame: txId + graph features, in the given order
+        """
+        if tx_ids is None:
+            rows = np.arange(self.n_nodes)
+        else:
+            rows = np.array([self._index[tx_id] for tx_id in np.asarray(tx_ids, dtype=np.int64).tolist()],
+                            dtype=np.int64)
+        return self._feature_rows(rows)
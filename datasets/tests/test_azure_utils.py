@@ -0,0 +1,145 @@
+"""
+Tests for the blob storage sync in azure_utils, run against LocalContainerClient
+(a filesystem-backed stand-in for an Azure container).
+
+Usage:
+    python -m pytest -q datasets/tests
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from azure_utils import MANIFEST_NAME, AzureBlobDownloader, LocalContainerClient  # noqa: E402
+
+
+def _write_blob(container_root, name, data):
+    path = Path(container_root) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def _make_downloader(container_root, **kwargs):
+    return AzureBlobDownloader(container_client=LocalContainerClient(container_root, chunk_size=1024), **kwargs)
+
+
+def test_download_streams_every_blob_and_writes_manifest(tmp_path):
+    container_root = tmp_path / "container"
+    _write_blob(container_root, "datasets/raw/a.csv", b"a" * 5000)
+    _write_blob(container_root, "datasets/raw/nested/b.csv", b"b" * 10)
+    _write_blob(container_root, "datasets/other/c.csv", b"c")
+
+    downloader = _make_downloader(container_root, max_concurrency=2)
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+
+    local_dir = tmp_path / "local" / "datasets" / "raw"
+    assert (local_dir / "a.csv").read_bytes() == b"a" * 5000
+    assert (local_dir / "nested" / "b.csv").read_bytes() == b"b" * 10
+    assert not (tmp_path / "local" / "datasets" / "other").exists()
+    assert (local_dir / MANIFEST_NAME).is_file()
+    assert downloader.last_transfer_stats["downloaded_files"] == 2
+    assert downloader.last_transfer_stats["skipped_files"] == 0
+    assert downloader.last_transfer_stats["bytes"] == 5010
+
+
+def test_download_skips_unchanged_blobs(tmp_path):
+    container_root = tmp_path / "container"
+    _write_blob(container_root, "datasets/raw/a.csv", b"a" * 100)
+    _write_blob(container_root, "datasets/raw/b.csv", b"b" * 100)
+
+    downloader = _make_downloader(container_root)
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+
+    assert downloader.last_transfer_stats["downloaded_files"] == 0
+    assert downloader.last_transfer_stats["skipped_files"] == 2
+    assert downloader.last_transfer_stats["bytes"] == 0
+
+
+def test_download_fetches_only_changed_blobs(tmp_path):
+    container_root = tmp_path / "container"
+    _write_blob(container_root, "datasets/raw/a.csv", b"a" * 100)
+    blob_b = _write_blob(container_root, "datasets/raw/b.csv", b"b" * 100)
+
+    downloader = _make_downloader(container_root)
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+
+    # Same size, new content and modification time: only the MD5/ETag tell it apart
+    blob_b.write_bytes(b"B" * 100)
+    os.utime(blob_b, ns=(blob_b.stat().st_atime_ns, blob_b.stat().st_mtime_ns + 10**9))
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+
+    assert downloader.last_transfer_stats["downloaded_files"] == 1
+    assert downloader.last_transfer_stats["skipped_files"] == 1
+    assert (tmp_path / "local" / "datasets" / "raw" / "b.csv").read_bytes() == b"B" * 100
+
+
+def test_download_refetches_locally_modified_files(tmp_path):
+    container_root = tmp_path / "container"
+    _write_blob(container_root, "datasets/raw/a.csv", b"a" * 100)
+
+    downloader = _make_downloader(container_root)
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+
+    local_file = tmp_path / "local" / "datasets" / "raw" / "a.csv"
+    local_file.write_bytes(b"truncated")
+    assert downloader.download_documents("datasets", "raw", base_path=tmp_path / "local")
+
+    assert downloader.last_transfer_stats["downloaded_files"] == 1
+    assert local_file.read_bytes() == b"a" * 100
+
+
+def _make_checkpoint_dir(base_path):
+    checkpoint_dir = Path(base_path) / "models" / "run"
+    checkpoint_dir.mkdir(parents=True)
+    (checkpoint_dir / "XGB.pkl").write_bytes(os.urandom(10_000))
+    (checkpoint_dir / "XGB.study.pkl").write_bytes(b"study")
+    (checkpoint_dir / "XGB.metadata.json").write_text('{"model_name": "XGB"}')
+    (checkpoint_dir / MANIFEST_NAME).write_text("{}")
+    return checkpoint_dir
+
+
+def test_upload_sends_new_files_with_their_hash(tmp_path):
+    _make_checkpoint_dir(tmp_path / "local")
+    container = LocalContainerClient(tmp_path / "container")
+    uploader = AzureBlobDownloader(container_client=container)
+
+    # Small block size: the pickle goes through staged blocks
+    assert uploader.upload_documents("models", "run", base_path=tmp_path / "local", block_size=4096)
+
+    blobs = {blob.name: blob for blob in container.list_blobs(name_starts_with="models/run/")}
+    assert sorted(blobs) == ["models/run/XGB.metadata.json", "models/run/XGB.pkl", "models/run/XGB.study.pkl"]
+    local_pkl = tmp_path / "local" / "models" / "run" / "XGB.pkl"
+    assert (tmp_path / "container" / "models" / "run" / "XGB.pkl").read_bytes() == local_pkl.read_bytes()
+    assert blobs["models/run/XGB.pkl"].metadata["sha256"] == AzureBlobDownloader._file_sha256(local_pkl)
+    assert uploader.last_transfer_stats["uploaded_files"] == 3
+
+
+def test_identical_repush_uploads_nothing(tmp_path):
+    _make_checkpoint_dir(tmp_path / "local")
+    uploader = AzureBlobDownloader(container_client=LocalContainerClient(tmp_path / "container"))
+    assert uploader.upload_documents("models", "run", base_path=tmp_path / "local", block_size=4096)
+
+    # Touching files without changing them must not trigger an upload either
+    for path in (tmp_path / "local" / "models" / "run").iterdir():
+        os.utime(path)
+    assert uploader.upload_documents("models", "run", base_path=tmp_path / "local", block_size=4096)
+
+    assert uploader.last_transfer_stats["uploaded_files"] == 0
+    assert uploader.last_transfer_stats["skipped_files"] == 3
+    assert uploader.last_transfer_stats["bytes"] == 0
+
+
+def test_repush_sends_only_changed_files(tmp_path):
+    checkpoint_dir = _make_checkpoint_dir(tmp_path / "local")
+    uploader = AzureBlobDownloader(container_client=LocalContainerClient(tmp_path / "container"))
+    assert uploader.upload_documents("models", "run", base_path=tmp_path / "local")
+
+    (checkpoint_dir / "XGB.metadata.json").write_text('{"model_name": "XGB", "version": 2}')
+    assert uploader.upload_documents("models", "run", base_path=tmp_path / "local")
+
+    assert uploader.last_transfer_stats["uploaded_files"] == 1
+    assert uploader.last_transfer_stats["skipped_files"] == 2
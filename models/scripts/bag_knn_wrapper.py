@@ -2,9 +2,9 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from sklearn.ensemble import BaggingClassifier
 from sklearn.neighbors import KNeighborsClassifier
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
@@ -18,7 +18,7 @@ class BagKNNWrapper(PipelineWrapper):
         """Build Bagging-KNN pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('bagging', BaggingClassifier(
                 estimator=KNeighborsClassifier(),
                 n_estimators=10,
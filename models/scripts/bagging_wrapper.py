@@ -2,9 +2,9 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from sklearn.ensemble import BaggingClassifier
 from sklearn.tree import DecisionTreeClassifier
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
@@ -18,7 +18,7 @@ class BaggingWrapper(PipelineWrapper):
         """Build Bagging pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('Bag', BaggingClassifier(
                 random_state=self.random_seed
             ))
@@ -0,0 +1,325 @@
+"""
+Batch Scorer Module
+
+Streams transactions from a processed HDF5 store in fixed-size chunks, scores each
+chunk with a checkpointed pipeline (optionally across a pool of worker processes)
+and appends txId / probability / prediction / label columns to a resizable HDF5
+output, so peak memory stays flat regardless of the input size.
+
+Usage:
+    from batch_scorer import BatchScorer, read_predictions
+
+    batch_scorer = BatchScorer.from_checkpoint(
+        checkpoint_dir="./models/mvp-kyt-sup-main",
+        model_name="XGB",
+        chunk_size=50_000,
+        n_workers=4
+    )
+
+    summary = batch_scorer.score_hdf(
+        input_path="./datasets/processed/elliptic_bitcoin_dataset/df_unlabeled.h5",
+        key="df_unlabeled",
+        output_path="./datasets/predictions/df_unlabeled_predictions.h5"
+    )
+    df_predictions = read_predictions("./datasets/predictions/df_unlabeled_predictions.h5")
+"""
+
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import h5py
+import joblib
+import numpy as np
+import pandas as pd
+
+
+# Pipeline loaded once per worker process by _init_worker
+_WORKER_PIPELINE = None
+
+
+def load_scoring_model(checkpoint_dir: Path, model_name: str, fused: bool = False,
+                       compiled: bool = False) -> Tuple[Any, float]:
+    """
+    Load a trained pipeline and its optimal threshold from a checkpoint.
+
+    Args:
+        checkpoint_dir: Directory containing the checkpoint files
+        model_name: Name of the model (e.g. 'XGB')
+        fused: Prefer the inference-optimized {model_name}.fused.pkl when it exists and
+            was built from the current checkpoint (recorded in its metadata)
+        compiled: Prefer the compiled tree ensemble {model_name}.compiled.pkl (see
+            tree_compiler.py) under the same conditions; it is only faster for a few rows
+            per call, so don't use it for batch scoring
+
+    Returns:
+        Tuple of (pipeline, threshold)
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    with open(checkpoint_dir / f"{model_name}.metadata.json", 'r') as f:
+        metadata = json.load(f)
+
+    model_path = checkpoint_dir / f"{model_name}.pkl"
+    # A derived file without a metadata entry predates the current {model_name}.pkl
+    for use, suffix, entry in ((compiled, '.compiled.pkl', 'compiled_pipeline'),
+                               (fused, '.fused.pkl', 'fused_pipeline')):
+        derived_path = checkpoint_dir / f"{model_name}{suffix}"
+        if use and derived_path.exists() and entry in metadata:
+            model_path = derived_path
+            break
+    mmap_mode = 'r' if metadata.get('checkpoint_format') == 'mmap' and model_path.name == f"{model_name}.pkl" else None
+    pipeline = joblib.load(model_path, mmap_mode=mmap_mode)
+    return pipeline, metadata.get('optimal_threshold', 0.5)
+
+
+def _init_worker(model_path: str, mmap_mode: Optional[str] = None) -> None:
+    """Load the pipeline once in each worker process (memory-mapped checkpoints share pages)."""
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = joblib.load(model_path, mmap_mode=mmap_mode)
+
+
+def _predict_chunk(features: pd.DataFrame) -> np.ndarray:
+    """Positive class probabilities of a chunk, using the worker's pipeline."""
+    return _WORKER_PIPELINE.predict_proba(features)[:, 1]
+
+
+def read_predictions(path: Path, start: Optional[int] = None, stop: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read (a slice of) a predictions file written by BatchScorer.
+
+    Args:
+        path: Predictions HDF5 file
+        start: First row to read
+        stop: Row to stop before
+
+    Returns:
+        DataFrame with txId, probability, prediction and label columns
+    """
+    with h5py.File(path, 'r') as f:
+        rows = slice(start, stop)
+        return pd.DataFrame({
+            'txId': f['txId'][rows],
+            'probability': f['probability'][rows],
+            'prediction': f['prediction'][rows],
+            'label': f['label'][rows].astype(str)
+        })
+
+
+class BatchScorer:
+    """
+    Chunked, bounded-memory scorer for large transaction sets.
+
+    Attributes:
+        pipeline: Trained pipeline used in-process (None when only model_path is given)
+        threshold: Classification threshold applied to the positive class probability
+        chunk_size: Number of rows scored per chunk
+        n_workers: Number of worker processes (1 scores in the current process)
+        labels: Label names indexed by predicted class
+        model_path: Pipeline file loaded by worker processes
+        mmap_mode: joblib mmap_mode used when loading model_path
+    """
+
+    def __init__(
+        self,
+        pipeline: Optional[Any],
+        threshold: float,
+        chunk_size: int = 50_000,
+        n_workers: int = 1,
+        labels: Sequence[str] = ('Illicit', 'Licit'),
+        model_path: Optional[Path] = None,
+        mmap_mode: Optional[str] = None
+    ):
+        """
+        Initialize batch scorer.
+
+        Args:
+            pipeline: Trained pipeline (may be None if model_path is given)
+            threshold: Classification threshold (e.g. the checkpoint's optimal_threshold)
+            chunk_size: Number of rows scored per chunk
+            n_workers: Number of worker processes (1 scores in the current process)
+            labels: Label names indexed by predicted class (class 0 is illicit in the processed dataset)
+            model_path: Pipeline file loaded once by each worker process (required if n_workers > 1)
+            mmap_mode: joblib mmap_mode for loading model_path (e.g. 'r' for 'mmap' checkpoints)
+        """
+        if pipeline is None and model_path is None:
+            raise ValueError("Either pipeline or model_path must be provided")
+        if n_workers > 1 and model_path is None:
+            raise ValueError("model_path is required when n_workers > 1")
+
+        self.pipeline = pipeline
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.n_workers = n_workers
+        self.labels = np.asarray(labels, dtype='S')
+        self.model_path = Path(model_path) if model_path is not None else None
+        self.mmap_mode = mmap_mode
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint_dir: Path, model_name: str, **kwargs) -> 'BatchScorer':
+        """
+        Create a batch scorer from a TrainingManager checkpoint.
+
+        Worker processes load the pipeline file themselves, so the main process only
+        loads it when scoring in-process. Batches are always scored by the native
+        pipeline: compiled tree ensembles are slower than native on large batches.
+
+        Args:
+            checkpoint_dir: Directory containing the checkpoint files
+            model_name: Name of the model (e.g. 'XGB')
+            **kwargs: Additional BatchScorer arguments (chunk_size, n_workers, labels)
+
+        Returns:
+            Configured BatchScorer
+        """
+        checkpoint_dir = Path(checkpoint_dir)
+        model_path = checkpoint_dir / f"{model_name}.pkl"
+
+        with open(checkpoint_dir / f"{model_name}.metadata.json", 'r') as f:
+            metadata = json.load(f)
+        mmap_mode = 'r' if metadata.get('checkpoint_format') == 'mmap' else None
+
+        if kwargs.get('n_workers', 1) > 1:
+            threshold = metadata.get('optimal_threshold', 0.5)
+            return cls(None, threshold, model_path=model_path, mmap_mode=mmap_mode, **kwargs)
+
+        pipeline, threshold = load_scoring_model(checkpoint_dir, model_name)
+        return cls(pipeline, threshold, model_path=model_path, mmap_mode=mmap_mode, **kwargs)
+
+    def _probabilities(self, chunks: Iterator[pd.DataFrame]) -> Iterator[np.ndarray]:
+        """
+        Positive class probabilities per chunk, in input order.
+
+        With worker processes, at most 2 chunks per worker are in flight at any time.
+        """
+        if self.n_workers <= 1:
+            pipeline = self.pipeline if self.pipeline is not None else joblib.load(self.model_path, mmap_mode=self.mmap_mode)
+            for features in chunks:
+                yield pipeline.predict_proba(features)[:, 1]
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_worker,
+            initargs=(str(self.model_path), self.mmap_mode)
+        ) as executor:
+            pending = deque()
+            for features in chunks:
+                pending.append(executor.submit(_predict_chunk, features))
+                if len(pending) >= 2 * self.n_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def score_frame(self, df: pd.DataFrame, id_column: str = 'txId',
+                    drop_columns: Sequence[str] = ('class', 'txId')) -> pd.DataFrame:
+        """
+        Score an in-memory DataFrame chunk by chunk.
+
+        Args:
+            df: Transactions with feature columns (and optionally id/class columns)
+            id_column: Transaction id column
+            drop_columns: Non-feature columns removed before scoring
+
+        Returns:
+            DataFrame with txId, probability, prediction and label columns
+        """
+        features = df.drop(columns=[c for c in drop_columns if c in df.columns])
+        chunks = (features.iloc[i:i + self.chunk_size] for i in range(0, len(df), self.chunk_size))
+        y_proba = np.concatenate(list(self._probabilities(chunks))) if len(df) else np.empty(0)
+        predictions = (y_proba >= self.threshold).astype(np.int8)
+
+        return pd.DataFrame({
+            'txId': df[id_column].to_numpy(),
+            'probability': y_proba,
+            'prediction': predictions,
+            'label': self.labels[predictions].astype(str)
+        })
+
+    def score_hdf(
+        self,
+        input_path: Path,
+        key: str,
+        output_path: Path,
+        id_column: str = 'txId',
+        drop_columns: Sequence[str] = ('class', 'txId')
+    ) -> Dict[str, Any]:
+        """
+        Stream a pandas HDF5 table, score it chunk by chunk and write predictions incrementally.
+
+        The input must be stored in pandas "table" format so row ranges can be read
+        without loading the whole frame.
+
+        Args:
+            input_path: Processed HDF5 file (e.g. df_unlabeled.h5)
+            key: Key of the frame inside the HDF5 store
+            output_path: Predictions HDF5 file (overwritten)
+            id_column: Transaction id column
+            drop_columns: Non-feature columns removed before scoring
+
+        Returns:
+            Summary with row/chunk counts, label counts, elapsed seconds and rows per second
+        """
+        start_time = time.time()
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with pd.HDFStore(input_path, mode='r') as store:
+            n_rows = store.get_storer(key).nrows
+            ids = deque()
+
+            def chunks() -> Iterator[pd.DataFrame]:
+                for start in range(0, n_rows, self.chunk_size):
+                    chunk = store.select(key, start=start, stop=start + self.chunk_size)
+                    ids.append(chunk[id_column].to_numpy())
+                    yield chunk.drop(columns=[c for c in drop_columns if c in chunk.columns])
+
+            with h5py.File(output_path, 'w') as out:
+                label_size = max(len(label) for label in self.labels)
+                columns = {
+                    'txId': out.create_dataset('txId', shape=(0,), maxshape=(None,), dtype=np.int64, chunks=True),
+                    'probability': out.create_dataset('probability', shape=(0,), maxshape=(None,), dtype=np.float32,
+                                                      chunks=True, compression='gzip'),
+                    'prediction': out.create_dataset('prediction', shape=(0,), maxshape=(None,), dtype=np.int8,
+                                                     chunks=True, compression='gzip'),
+                    'label': out.create_dataset('label', shape=(0,), maxshape=(None,), dtype=f'S{label_size}',
+                                                chunks=True, compression='gzip')
+                }
+                out.attrs['threshold'] = self.threshold
+
+                n_written = 0
+                n_chunks = 0
+                label_counts = np.zeros(len(self.labels), dtype=np.int64)
+                for y_proba in self._probabilities(chunks()):
+                    # Vectorized thresholding and label mapping
+                    predictions = (y_proba >= self.threshold).astype(np.int8)
+                    values = {
+                        'txId': ids.popleft(),
+                        'probability': y_proba,
+                        'prediction': predictions,
+                        'label': self.labels[predictions]
+                    }
+
+                    n_new = n_written + len(predictions)
+                    for name, dataset in columns.items():
+                        dataset.resize((n_new,))
+                        dataset[n_written:n_new] = values[name]
+
+                    label_counts += np.bincount(predictions, minlength=len(self.labels))
+                    n_written = n_new
+                    n_chunks += 1
+
+        elapsed = time.time() - start_time
+        summary = {
+            'rows': n_written,
+            'chunks': n_chunks,
+            'threshold': self.threshold,
+            'label_counts': {label.decode(): int(count) for label, count in zip(self.labels, label_counts)},
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(n_written / elapsed, 1) if elapsed > 0 else None
+        }
+        print(f"✅ Scored {n_written:,} rows in {n_chunks} chunks ({summary['rows_per_second']} rows/s) → {output_path}")
+
+        return summary
@@ -0,0 +1,340 @@
+"""
+Binned Dataset Cache Module
+
+Builds the native training structures of the histogram boosters once per
+cross-validation fold and preprocessing configuration, and hands them to every
+trial's fit: xgboost QuantileDMatrix, lightgbm Dataset and catboost quantized
+Pool. Feature quantization is identical across trials that only change booster
+params, so cached folds skip it (and the preprocessing fit) entirely.
+
+On a cache hit the booster is trained through its native API on the cached
+structures; the sklearn estimator only supplies the params. Entries are keyed by
+data fingerprint, fold indices, preprocessing params and the binning params of
+the booster (max_bin / border_count ...), and evicted least-recently-used once
+the memory budget is exceeded. Within a process an entry is used by one fit at
+a time.
+
+Native datasets can't be memory-mapped or shared between processes, so there is
+no disk mode. Each joblib worker process keeps its own bounded store. With
+n_jobs > 1 a trial only hits when its fold runs on a worker that has already
+binned that fold, and every worker pays the budget. n_jobs=1 gives the most
+reuse per byte. lookups() counts the hits and misses of the calling process,
+so the caller can add them up across workers.
+
+Usage:
+    from binned_dataset_cache import BinnedDatasetCache
+
+    binned_cache = BinnedDatasetCache(max_bytes=2 * 1024**3)
+    objective = aml_scorer.create_objective(
+        name, pipe, param_distributions, X_train, y_train, cv, scorer,
+        preprocessing_cache=preprocessing_cache, binned_cache=binned_cache
+    )
+"""
+
+import hashlib
+import threading
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from preprocessing_cache import BoundedLRUCache, PreprocessingCache, array_fingerprint
+
+
+# Estimator class name -> params that change how its features are binned
+BINNING_PARAMS: Dict[str, Tuple[str, ...]] = {
+    'XGBClassifier': ('max_bin', 'missing'),
+    'LGBMClassifier': ('max_bin', 'min_data_in_bin', 'subsample_for_bin'),
+    'CatBoostClassifier': ('border_count', 'feature_border_type', 'nan_mode')
+}
+
+# Sklearn-only LGBMClassifier params, not understood by lightgbm.train
+_LGB_SKLEARN_PARAMS = ('class_weight', 'importance_type', 'n_estimators', 'subsample_for_bin')
+
+
+class _BinnedFold:
+    """Cached native datasets of one fold, plus the lock serializing fits that use them."""
+
+    def __init__(self, train: Any, val: Any, X_val: Optional[np.ndarray]):
+        self.train = train
+        self.val = val
+        self.X_val = X_val
+        self.lock = threading.Lock()
+
+
+# Per-process stores looked up by cache id (see preprocessing_cache._MEMORY_STORES)
+_STORES: Dict[str, BoundedLRUCache] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def _binned_store(cache_id: str, max_bytes: Optional[int], max_entries: Optional[int]) -> BoundedLRUCache:
+    """Get (or create) this process's store for a cache, dropping stores of previous studies."""
+    with _STORES_LOCK:
+        store = _STORES.get(cache_id)
+        if store is None:
+            _STORES.clear()
+            store = _STORES[cache_id] = BoundedLRUCache(max_bytes, max_entries)
+        return store
+
+
+class BinnedDatasetCache:
+    """
+    Fold-level cache of QuantileDMatrix / lightgbm Dataset / quantized Pool objects.
+
+    Entries live in a per-process store: joblib workers don't see each other's entries.
+
+    Attributes:
+        max_bytes: Memory budget in bytes (binned matrices are accounted at one
+            byte per value, two above 256 bins)
+        max_entries: Maximum number of cached folds (None for unbounded)
+    """
+
+    def __init__(self, max_bytes: int = 1024 ** 3, max_entries: Optional[int] = None):
+        """
+        Initialize binned dataset cache.
+
+        Args:
+            max_bytes: Memory budget in bytes
+            max_entries: Maximum number of cached folds (None for unbounded)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._cache_id = uuid.uuid4().hex
+        self._build_lock = threading.Lock()
+
+    @property
+    def _store(self) -> BoundedLRUCache:
+        return _binned_store(self._cache_id, self.max_bytes, self.max_entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks can't be pickled; workers get a fresh one
+        state = self.__dict__.copy()
+        del state['_build_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._build_lock = threading.Lock()
+
+    @staticmethod
+    def supports(estimator: Any) -> bool:
+        """Whether the estimator can be trained from cached binned datasets."""
+        kind = estimator.__class__.__name__
+        if kind == 'XGBClassifier':
+            # QuantileDMatrix only feeds the histogram tree method
+            return estimator.get_params().get('tree_method') in (None, 'hist', 'auto')
+        if kind == 'LGBMClassifier':
+            # Class weights become per-row weights inside the sklearn wrapper
+            return estimator.get_params().get('class_weight') is None
+        return kind == 'CatBoostClassifier'
+
+    def fold_key(self, pipeline: Any, data_fingerprint: str, train_idx: np.ndarray, val_idx: np.ndarray) -> str:
+        """
+        Cache key of a fold: data, fold indices, preprocessing params and binning params.
+
+        Args:
+            pipeline: Sklearn pipeline whose last step is a supported booster
+            data_fingerprint: Fingerprint of the full feature matrix and labels
+            train_idx: Training fold indices
+            val_idx: Validation fold indices
+
+        Returns:
+            Hex digest key
+        """
+        estimator = pipeline.steps[-1][1]
+        kind = estimator.__class__.__name__
+        params = estimator.get_params()
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(data_fingerprint.encode())
+        digest.update(array_fingerprint(train_idx, val_idx).encode())
+        digest.update(PreprocessingCache.preprocessing_params(pipeline).encode())
+        digest.update(repr((kind, [(name, params.get(name)) for name in BINNING_PARAMS[kind]])).encode())
+        return digest.hexdigest()
+
+    def fit_predict_fold(
+        self,
+        pipeline: Any,
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        val_idx: np.ndarray,
+        data_fingerprint: str,
+        early_stopping_rounds: Optional[int] = None,
+        preprocessing_cache: Optional[PreprocessingCache] = None
+    ) -> Tuple[np.ndarray, Optional[int]]:
+        """
+        Train the pipeline's booster on a fold's binned datasets and predict the validation fold.
+
+        Args:
+            pipeline: Sklearn pipeline whose last step is a supported booster
+            X: Feature matrix
+            y: Label array
+            train_idx: Training fold indices
+            val_idx: Validation fold indices
+            data_fingerprint: Fingerprint of X and y (see array_fingerprint)
+            early_stopping_rounds: Stop once the validation loss has not improved for
+                this many rounds (None trains the full budget)
+            preprocessing_cache: Optional PreprocessingCache supplying the transformed
+                fold on a miss
+
+        Returns:
+            Tuple of (positive class probabilities for the validation fold, number of
+            rounds up to the best one if early stopping was used, else None)
+        """
+        estimator = pipeline.steps[-1][1]
+        fold = self._fold(pipeline, X, y, train_idx, val_idx, data_fingerprint, preprocessing_cache)
+
+        with fold.lock:
+            kind = estimator.__class__.__name__
+            if kind == 'XGBClassifier':
+                return self._fit_predict_xgb(estimator, fold, early_stopping_rounds)
+            if kind == 'LGBMClassifier':
+                return self._fit_predict_lgb(estimator, fold, early_stopping_rounds)
+            return self._fit_predict_cat(estimator, fold, early_stopping_rounds)
+
+    def _fold(self, pipeline: Any, X: np.ndarray, y: np.ndarray, train_idx: np.ndarray, val_idx: np.ndarray,
+              data_fingerprint: str, preprocessing_cache: Optional[PreprocessingCache]) -> _BinnedFold:
+        """Cached binned datasets of a fold, building them on a miss."""
+        key = self.fold_key(pipeline, data_fingerprint, train_idx, val_idx)
+        fold = self._store.get(key)
+        if fold is not None:
+            return fold
+
+        # Threads missing the same fold build it once
+        with self._build_lock:
+            if key in self._store:
+                return self._store.get(key)
+
+            if len(pipeline.steps) < 2:
+                X_train_t, X_val_t = X[train_idx], X[val_idx]
+            elif preprocessing_cache is not None:
+                X_train_t, X_val_t = preprocessing_cache.transform_fold(
+                    pipeline, X, y, train_idx, val_idx, data_fingerprint
+                )
+            else:
+                preprocessor = pipeline[:-1]
+                X_train_t = preprocessor.fit_transform(X[train_idx], y[train_idx])
+                X_val_t = preprocessor.transform(X[val_idx])
+
+            fold, nbytes = self._build(pipeline.steps[-1][1], X_train_t, y[train_idx], X_val_t, y[val_idx])
+            self._store.put(key, fold, nbytes)
+            return fold
+
+    @staticmethod
+    def _build(estimator: Any, X_train: np.ndarray, y_train: np.ndarray, X_val: np.ndarray,
+               y_val: np.ndarray) -> Tuple[_BinnedFold, int]:
+        """Quantize a fold for the estimator's library, returning the entry and its accounted size."""
+        kind = estimator.__class__.__name__
+        params = estimator.get_params()
+        n_values = X_train.shape[0] * X_train.shape[1] + X_val.shape[0] * X_val.shape[1]
+
+        if kind == 'XGBClassifier':
+            import xgboost as xgb
+            max_bin = params.get('max_bin') or 256
+            missing = np.nan if params.get('missing') is None else params['missing']
+            train = xgb.QuantileDMatrix(X_train, y_train, max_bin=max_bin, missing=missing)
+            val = xgb.QuantileDMatrix(X_val, y_val, ref=train, missing=missing)
+            return _BinnedFold(train, val, None), n_values * (1 if max_bin <= 256 else 2)
+
+        if kind == 'LGBMClassifier':
+            import lightgbm as lgb
+            dataset_params = _lgb_dataset_params(params)
+            train = lgb.Dataset(X_train, y_train, params=dataset_params).construct()
+            val = lgb.Dataset(X_val, y_val, reference=train, params=dataset_params).construct()
+            # Boosters predict from raw features, so the validation matrix is kept as well
+            X_val = np.ascontiguousarray(X_val)
+            nbytes = n_values * (1 if dataset_params['max_bin'] <= 256 else 2) + X_val.nbytes
+            return _BinnedFold(train, val, X_val), nbytes
+
+        import catboost as cb
+        border_count = params.get('border_count') or 254
+        quantize_params = {'border_count': border_count}
+        if params.get('feature_border_type') is not None:
+            quantize_params['feature_border_type'] = params['feature_border_type']
+        if params.get('nan_mode') is not None:
+            quantize_params['nan_mode'] = params['nan_mode']
+        train = cb.Pool(X_train, y_train)
+        train.quantize(**quantize_params)
+        val = cb.Pool(X_val, y_val)
+        return _BinnedFold(train, val, None), n_values * (1 if border_count <= 255 else 2)
+
+    @staticmethod
+    def _fit_predict_xgb(estimator: Any, fold: _BinnedFold,
+                         early_stopping_rounds: Optional[int]) -> Tuple[np.ndarray, Optional[int]]:
+        import xgboost as xgb
+
+        booster = xgb.train(
+            estimator.get_xgb_params(), fold.train,
+            num_boost_round=estimator.get_params()['n_estimators'] or 100,
+            evals=[(fold.val, 'validation')] if early_stopping_rounds else (),
+            early_stopping_rounds=early_stopping_rounds or None,
+            verbose_eval=False
+        )
+        if not early_stopping_rounds:
+            return booster.predict(fold.val), None
+
+        best_iteration = int(booster.best_iteration) + 1
+        return booster.predict(fold.val, iteration_range=(0, best_iteration)), best_iteration
+
+    @staticmethod
+    def _fit_predict_lgb(estimator: Any, fold: _BinnedFold,
+                         early_stopping_rounds: Optional[int]) -> Tuple[np.ndarray, Optional[int]]:
+        import lightgbm as lgb
+
+        params = estimator.get_params()
+        num_boost_round = params['n_estimators']
+        booster_params = {k: v for k, v in params.items()
+                          if k not in _LGB_SKLEARN_PARAMS and k not in BINNING_PARAMS['LGBMClassifier']
+                          and v is not None}
+        booster_params['boosting'] = booster_params.pop('boosting_type', 'gbdt')
+        booster_params['objective'] = booster_params.get('objective') or 'binary'
+
+        if not early_stopping_rounds:
+            booster = lgb.train(booster_params, fold.train, num_boost_round=num_boost_round)
+            return booster.predict(fold.X_val), None
+
+        booster = lgb.train(
+            booster_params, fold.train, num_boost_round=num_boost_round, valid_sets=[fold.val],
+            callbacks=[lgb.early_stopping(early_stopping_rounds, verbose=False)]
+        )
+        best_iteration = int(booster.best_iteration or booster.current_iteration())
+        return booster.predict(fold.X_val, num_iteration=best_iteration), best_iteration
+
+    @staticmethod
+    def _fit_predict_cat(estimator: Any, fold: _BinnedFold,
+                         early_stopping_rounds: Optional[int]) -> Tuple[np.ndarray, Optional[int]]:
+        if not early_stopping_rounds:
+            estimator.fit(fold.train)
+            return estimator.predict_proba(fold.val)[:, 1], None
+
+        estimator.fit(fold.train, eval_set=fold.val, early_stopping_rounds=early_stopping_rounds,
+                      use_best_model=True)
+        return estimator.predict_proba(fold.val)[:, 1], int(estimator.get_best_iteration()) + 1
+
+    def lookups(self) -> Tuple[int, int]:
+        """Hits and misses of the lookups made by this process."""
+        stats = self._store.stats()
+        return stats['hits'], stats['misses']
+
+    def stats(self) -> Dict[str, int]:
+        """Get statistics of this process's store."""
+        return self._store.stats()
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._store.clear()
+
+
+def _lgb_dataset_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Dataset construction params of an LGBMClassifier."""
+    dataset_params = {
+        'max_bin': params.get('max_bin') or 255,
+        'bin_construct_sample_cnt': params.get('subsample_for_bin') or 200000,
+        # Pre-filtering depends on min_child_samples, which trials change
+        'feature_pre_filter': False,
+        'verbose': -1
+    }
+    if params.get('min_data_in_bin') is not None:
+        dataset_params['min_data_in_bin'] = params['min_data_in_bin']
+    return dataset_params
@@ -0,0 +1,125 @@
+"""
+Cached PCA Module
+
+Drop-in replacement for sklearn's PCA that computes the full decomposition of a
+matrix once and serves every n_components (variance retention) target by slicing
+the components, so Optuna trials that only change pca__n_components or pca__whiten
+on the same fold skip the SVD entirely.
+
+Usage:
+    from cached_pca import CachedPCA
+
+    Pipeline([
+        ('std', StandardScaler()),
+        ('pca', CachedPCA(n_components=0.95)),
+        ('LR', LogisticRegression())
+    ])
+"""
+
+from typing import Any
+
+import numpy as np
+from scipy.sparse import issparse
+from sklearn.decomposition import PCA
+from sklearn.utils.validation import validate_data
+
+from preprocessing_cache import BoundedLRUCache, array_fingerprint
+
+
+class CachedPCA(PCA):
+    """
+    PCA reusing a per-process cache of full decompositions.
+
+    Accepts exactly the same parameters as sklearn's PCA. Whitening is applied at
+    transform time, so one decomposition per (data, solver) serves both whiten
+    settings. Truncated solvers ('arpack', 'randomized' with an integer target),
+    'mle' and sparse input fall back to sklearn's implementation.
+    """
+
+    # Full decompositions keyed by (data fingerprint, solver); bounded per process
+    _decompositions = BoundedLRUCache(max_entries=8)
+
+    def _resolve_solver(self, X: Any) -> str:
+        """Solver sklearn would pick for this input (mirrors PCA._fit)."""
+        if self.svd_solver != 'auto':
+            return self.svd_solver
+        if X.shape[1] <= 1_000 and X.shape[0] >= 10 * X.shape[1]:
+            return 'covariance_eigh'
+        if max(X.shape) <= 500:
+            return 'full'
+        n_components = min(X.shape) if self.n_components is None else self.n_components
+        if 1 <= n_components < 0.8 * min(X.shape):
+            return 'randomized'
+        return 'full'
+
+    def _full_decomposition(self, X: np.ndarray, solver: str) -> PCA:
+        """Fit (or fetch from cache) the decomposition keeping every component."""
+        key = (array_fingerprint(X), solver)
+        full = self._decompositions.get(key)
+        if full is None:
+            full = PCA(n_components=None, svd_solver=solver).fit(X)
+            self._decompositions.put(key, full, nbytes=full.components_.nbytes)
+        return full
+
+    def fit(self, X: Any, y: Any = None) -> 'CachedPCA':
+        """
+        Fit the model with X, reusing a cached full decomposition when possible.
+
+        Args:
+            X: Training data of shape (n_samples, n_features)
+            y: Ignored
+
+        Returns:
+            Fitted estimator
+        """
+        self._validate_params()
+        if issparse(X) or self.n_components == 'mle':
+            return super().fit(X, y)
+
+        solver = self._resolve_solver(X)
+        if solver not in ('full', 'covariance_eigh'):
+            return super().fit(X, y)
+
+        X = validate_data(self, X, dtype=[np.float64, np.float32], ensure_2d=True)
+        n_samples, n_features = X.shape
+        full = self._full_decomposition(X, solver)
+
+        # Resolve the number of components exactly as PCA._fit_full does
+        n_components = min(n_samples, n_features) if self.n_components is None else self.n_components
+        if 0 < n_components < 1.0:
+            ratio_cumsum = np.cumsum(full.explained_variance_ratio_, dtype=np.float64)
+            n_components = int(np.searchsorted(ratio_cumsum, n_components, side='right') + 1)
+        elif not 0 <= n_components <= min(n_samples, n_features):
+            raise ValueError(
+                f"n_components={n_components} must be between 0 and "
+                f"min(n_samples, n_features)={min(n_samples, n_features)} with svd_solver={solver!r}"
+            )
+
+        if n_components < min(n_features, n_samples):
+            self.noise_variance_ = float(np.mean(full.explained_variance_[n_components:]))
+        else:
+            self.noise_variance_ = 0.0
+
+        self._fit_svd_solver = solver
+        self.mean_ = full.mean_
+        self.n_samples_ = n_samples
+        self.n_components_ = n_components
+        self.components_ = full.components_[:n_components].copy()
+        self.explained_variance_ = full.explained_variance_[:n_components].copy()
+        self.explained_variance_ratio_ = full.explained_variance_ratio_[:n_components].copy()
+        self.singular_values_ = full.singular_values_[:n_components].copy()
+
+        return self
+
+    def fit_transform(self, X: Any, y: Any = None) -> np.ndarray:
+        """
+        Fit the model with X and apply the dimensionality reduction on X.
+
+        Args:
+            X: Training data of shape (n_samples, n_features)
+            y: Ignored
+
+        Returns:
+            Transformed values of shape (n_samples, n_components_)
+        """
+        return self.fit(X, y).transform(X)
@@ -2,14 +2,17 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 import catboost as cb
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
 class CatBoostWrapper(PipelineWrapper):
     """Wrapper for CatBoost pipeline."""
 
+    resource_param = 'cat__iterations'
+    early_stopping_rounds = 50
+
     def __init__(self, random_seed: int = 42):
         super().__init__(name='CAT', random_seed=random_seed)
 
@@ -17,14 +20,15 @@ class CatBoostWrapper(PipelineWrapper):
         """Build CatBoost pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('cat', cb.CatBoostClassifier(
                 iterations=500,
                 depth=8,
                 learning_rate=0.1,
                 auto_class_weights='Balanced',
                 random_seed=self.random_seed,
-                verbose=False
+                verbose=False,
+                allow_writing_files=False
             ))
         ])
 
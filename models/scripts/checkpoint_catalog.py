@@ -0,0 +1,221 @@
+"""
+Checkpoint Catalog Module
+
+Lazy view over a TrainingManager checkpoint directory: only the *.metadata.json
+files are read up front (rankings, thresholds, scores), and pipelines / studies
+are deserialized the first time they are accessed and kept in a bounded LRU cache
+(by entry count and/or estimated bytes). Also holds the helpers used to write
+checkpoint files atomically and to drop the fused / compiled pipelines derived
+from a checkpoint when it is replaced.
+
+Usage:
+    from training_manager import TrainingManager
+
+    catalog = manager.catalog(max_entries=4)
+
+    for name, mean, std in catalog.ranking(top=5):
+        print(name, mean, std)
+
+    best_pipe = catalog.get_model(catalog.best())
+    name, cv_scores, pipe, study, threshold = catalog['XGB']
+
+    # Existing consumers of (name, cv_scores, pipe, study, threshold) tuples
+    for name, cv_scores, pipe, study, threshold in catalog:
+        ...
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from preprocessing_cache import BoundedLRUCache
+
+
+# Files built from {name}.pkl (inference_optimizer / tree_compiler), stale once it is rewritten
+DERIVED_SUFFIXES = ('.fused.pkl', '.compiled.pkl')
+
+
+def atomic_write(path: Path, write_fn) -> None:
+    """
+    Write a file atomically by writing to a temporary sibling and renaming it.
+
+    Args:
+        path: Final destination path
+        write_fn: Callable receiving the temporary path to write to
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write_fn(Path(tmp_path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def remove_derived_artifacts(checkpoint_dir: Path, model_name: str) -> List[str]:
+    """
+    Delete a model's fused / compiled pipelines before its checkpoint is replaced.
+
+    Args:
+        checkpoint_dir: Directory containing the checkpoint files
+        model_name: Name of the model
+
+    Returns:
+        Names of the removed files
+    """
+    removed = []
+    for suffix in DERIVED_SUFFIXES:
+        path = Path(checkpoint_dir) / f"{model_name}{suffix}"
+        if path.exists():
+            path.unlink()
+            removed.append(path.name)
+    return removed
+
+
+class CheckpointCatalog:
+    """
+    Metadata-only index of checkpoints with lazily loaded, LRU-cached models and studies.
+
+    Attributes:
+        manager: TrainingManager used to deserialize pipelines and studies
+        checkpoint_dir: Directory containing the checkpoint files
+        cache: Bounded cache of loaded pipelines and studies
+    """
+
+    def __init__(self, manager: Any, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize catalog by reading every checkpoint's metadata.
+
+        Args:
+            manager: TrainingManager owning the checkpoint directory
+            max_entries: Maximum number of loaded pipelines + studies kept in memory (None = unbounded)
+            max_bytes: Approximate memory budget of loaded objects, estimated from their file sizes
+                (None = unbounded)
+        """
+        self.manager = manager
+        self.checkpoint_dir = Path(manager.checkpoint_dir)
+        self.cache = BoundedLRUCache(max_bytes=max_bytes, max_entries=max_entries)
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-scan the checkpoint directory for complete checkpoints (cached objects are kept)."""
+        self._metadata = {}
+        for metadata_path in sorted(self.checkpoint_dir.glob('*.metadata.json')):
+            model_name = metadata_path.name[:-len('.metadata.json')]
+            if not self.manager.has_checkpoint(model_name):
+                continue
+            with open(metadata_path, 'r') as f:
+                self._metadata[model_name] = json.load(f)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all complete checkpoints, sorted."""
+        return list(self._metadata)
+
+    def __len__(self) -> int:
+        return len(self._metadata)
+
+    def __contains__(self, model_name: str) -> bool:
+        return model_name in self._metadata
+
+    def metadata(self, model_name: str) -> Dict[str, Any]:
+        """Metadata of a checkpoint (no deserialization)."""
+        return self._metadata[model_name]
+
+    def ranking(self, top: Optional[int] = None) -> List[Tuple[str, float, float]]:
+        """
+        Checkpoints ranked by mean cross-validation score.
+
+        Args:
+            top: Number of best models to return (all if None)
+
+        Returns:
+            List of (model_name, cv_score_mean, cv_score_std), best first
+        """
+        ranked = sorted(
+            ((name, meta['cv_score_mean'], meta['cv_score_std']) for name, meta in self._metadata.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        return ranked[:top] if top is not None else ranked
+
+    def best(self) -> str:
+        """Name of the checkpoint with the highest mean cross-validation score."""
+        return self.ranking(top=1)[0][0]
+
+    def _file_bytes(self, *paths: Optional[Path]) -> int:
+        """Total size of the existing files among paths."""
+        return sum(path.stat().st_size for path in paths if path is not None and path.exists())
+
+    def get_model(self, model_name: str) -> Any:
+        """
+        Trained pipeline of a checkpoint, deserialized on first access.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            Trained pipeline
+        """
+        key = ('model', model_name)
+        pipe = self.cache.get(key)
+        if pipe is None:
+            metadata = self._metadata[model_name]
+            pipe = self.manager.load_pipeline(model_name, metadata)
+            nbytes = metadata.get('checkpoint_bytes') or self._file_bytes(self.checkpoint_dir / f"{model_name}.pkl")
+            self.cache.put(key, pipe, nbytes=nbytes)
+        return pipe
+
+    def get_study(self, model_name: str) -> Any:
+        """
+        Optuna study of a checkpoint, deserialized on first access.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            Optuna study object
+        """
+        if model_name not in self._metadata:
+            raise KeyError(model_name)
+
+        key = ('study', model_name)
+        study = self.cache.get(key)
+        if study is None:
+            study = self.manager._load_study(model_name)
+            nbytes = self._file_bytes(self.checkpoint_dir / f"{model_name}.study.pkl",
+                                      self.manager._study_storage_path(model_name))
+            self.cache.put(key, study, nbytes=nbytes)
+        return study
+
+    def __getitem__(self, model_name: str) -> Tuple[str, np.ndarray, Any, Any, float]:
+        """Checkpoint tuple (model_name, cv_scores, pipeline, study, threshold)."""
+        metadata = self._metadata[model_name]
+        return (
+            model_name,
+            np.array(metadata['cv_scores']),
+            self.get_model(model_name),
+            self.get_study(model_name),
+            metadata.get('optimal_threshold', 0.5)
+        )
+
+    def __iter__(self) -> Iterator[Tuple[str, np.ndarray, Any, Any, float]]:
+        """Checkpoint tuples in name order, loaded one at a time."""
+        for model_name in self.names:
+            yield self[model_name]
+
+    def evict(self, model_name: str) -> None:
+        """Drop a checkpoint's loaded pipeline and study from memory."""
+        self.cache.pop(('model', model_name))
+        self.cache.pop(('study', model_name))
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics plus the number of catalogued checkpoints."""
+        return {'checkpoints': len(self._metadata), **self.cache.stats()}
@@ -2,17 +2,20 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from scikeras.wrappers import KerasClassifier
 import tensorflow as tf
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import Dense, Dropout, BatchNormalization
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
 class FNNWrapper(PipelineWrapper):
     """Wrapper for Feedforward Neural Network pipeline."""
 
+    resource_param = 'fnn__epochs'
+    early_stopping_rounds = 10
+
     def __init__(self, random_seed: int = 42):
         super().__init__(name='FNN', random_seed=random_seed)
         tf.random.set_seed(random_seed)
@@ -66,7 +69,7 @@ class FNNWrapper(PipelineWrapper):
         """Build FNN pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('fnn', KerasClassifier(
                 model=FNNWrapper.create_feedforward_nn,
                 hidden_dims=[128, 64],
@@ -2,8 +2,8 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from sklearn.ensemble import GradientBoostingClassifier
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
@@ -17,7 +17,7 @@ class GBWrapper(PipelineWrapper):
         """Build Gradient Boosting pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('GB', GradientBoostingClassifier(
                 random_state=self.random_seed
             ))
@@ -2,14 +2,17 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from sklearn.ensemble import HistGradientBoostingClassifier
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
 class HistGBWrapper(PipelineWrapper):
     """Wrapper for HistGradientBoosting pipeline."""
 
+    resource_param = 'histgb__max_iter'
+    early_stopping_rounds = 50
+
     def __init__(self, random_seed: int = 42):
         super().__init__(name='HistGB', random_seed=random_seed)
 
@@ -17,7 +20,7 @@ class HistGBWrapper(PipelineWrapper):
         """Build HistGradientBoosting pipeline."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('histgb', HistGradientBoostingClassifier(
                 max_iter=1000,
                 max_depth=10,
@@ -0,0 +1,279 @@
+"""
+Inference Optimizer Module
+
+Collapses the leading StandardScaler / PCA (including whitening) steps of a fitted
+pipeline into a single precomputed affine transform `X @ W + b`, removing one pass
+and one intermediate matrix per prediction. When the final estimator is a binary
+LogisticRegression the whole pipeline folds into one dot product and a sigmoid.
+
+Usage:
+    from inference_optimizer import optimize_pipeline, optimize_checkpoint
+
+    fused_pipe = optimize_pipeline(pipe)
+
+    # Fuse, verify against the original on sample rows and save {name}.fused.pkl
+    fused_pipe, report = optimize_checkpoint(
+        checkpoint_dir="./models/mvp-kyt-sup-main",
+        model_name="LR",
+        X_sample=X_test
+    )
+"""
+
+import json
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+from scipy.special import expit
+from sklearn.base import BaseEstimator, ClassifierMixin, TransformerMixin
+from sklearn.decomposition import PCA
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from checkpoint_catalog import atomic_write
+
+
+class AffineTransform(TransformerMixin, BaseEstimator):
+    """
+    Precomputed affine transform X @ W + b replacing fitted scaler/PCA steps.
+
+    Attributes:
+        weights_: Matrix W of shape (n_features_in_, n_components)
+        offset_: Offset b of shape (n_components,)
+        n_features_in_: Number of input features
+        feature_names_in_: Input feature names (when the original steps recorded them)
+    """
+
+    def __init__(self, weights: np.ndarray, offset: np.ndarray, feature_names_in: Optional[np.ndarray] = None):
+        self.weights = weights
+        self.offset = offset
+        self.feature_names_in = feature_names_in
+        self.weights_ = np.ascontiguousarray(weights, dtype=np.float64)
+        self.offset_ = np.asarray(offset, dtype=np.float64)
+        self.n_features_in_ = self.weights_.shape[0]
+        if feature_names_in is not None:
+            self.feature_names_in_ = feature_names_in
+
+    def fit(self, X: Any = None, y: Any = None) -> 'AffineTransform':
+        """No-op: the transform is precomputed."""
+        return self
+
+    def transform(self, X: Any) -> np.ndarray:
+        """Apply X @ W + b."""
+        return np.asarray(X, dtype=np.float64) @ self.weights_ + self.offset_
+
+
+class FusedLinearClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Binary linear classifier sigmoid(X @ coef + intercept) with preprocessing folded in.
+
+    Attributes:
+        coef_: Coefficients of shape (n_features_in_,)
+        intercept_: Scalar intercept
+        classes_: Class labels of the original estimator
+        n_features_in_: Number of input features
+        feature_names_in_: Input feature names (when the original steps recorded them)
+    """
+
+    def __init__(self, coef: np.ndarray, intercept: float, classes: np.ndarray,
+                 feature_names_in: Optional[np.ndarray] = None):
+        self.coef = coef
+        self.intercept = intercept
+        self.classes = classes
+        self.feature_names_in = feature_names_in
+        self.coef_ = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept_ = float(intercept)
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = self.coef_.shape[0]
+        if feature_names_in is not None:
+            self.feature_names_in_ = feature_names_in
+
+    def fit(self, X: Any = None, y: Any = None) -> 'FusedLinearClassifier':
+        """No-op: the classifier is precomputed."""
+        return self
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        """Linear decision values X @ coef + intercept."""
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """Class probabilities, matching LogisticRegression's binary predict_proba."""
+        proba = expit(self.decision_function(X))
+        return np.column_stack([1 - proba, proba])
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Predicted class labels."""
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+
+
+def _step_affine(step: Any, n_features: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Affine map (W, b) equivalent to a fitted step's transform, or None if not affine.
+
+    Args:
+        step: Fitted pipeline step
+        n_features: Number of features entering the step
+
+    Returns:
+        Tuple (W, b) with transform(X) == X @ W + b, or None
+    """
+    if isinstance(step, StandardScaler):
+        scale = step.scale_ if step.scale_ is not None else np.ones(n_features)
+        mean = step.mean_ if step.with_mean and step.mean_ is not None else np.zeros(n_features)
+        return np.diag(1.0 / scale), -mean / scale
+
+    if isinstance(step, PCA):
+        W = step.components_.T.copy()
+        if step.whiten:
+            W /= np.sqrt(step.explained_variance_)
+        return W, -step.mean_ @ W
+
+    return None
+
+
+def fuse_affine_steps(pipeline: Pipeline) -> Tuple[Optional[AffineTransform], int]:
+    """
+    Compose the leading scaler/PCA steps of a fitted pipeline into one affine transform.
+
+    Args:
+        pipeline: Fitted sklearn Pipeline
+
+    Returns:
+        Tuple of (AffineTransform or None if no leading step is affine, number of fused steps)
+    """
+    n_features = pipeline.steps[0][1].n_features_in_ if hasattr(pipeline.steps[0][1], 'n_features_in_') else None
+    W, b = None, None
+    n_fused = 0
+
+    # Never fuse the final estimator itself
+    for _, step in pipeline.steps[:-1]:
+        if step is None or step == 'passthrough' or n_features is None:
+            break
+        affine = _step_affine(step, n_features if W is None else W.shape[1])
+        if affine is None:
+            break
+
+        step_W, step_b = affine
+        if W is None:
+            W, b = step_W, step_b
+        else:
+            W, b = W @ step_W, b @ step_W + step_b
+        n_fused += 1
+
+    if W is None:
+        return None, 0
+
+    feature_names = getattr(pipeline.steps[0][1], 'feature_names_in_', None)
+    return AffineTransform(W, b, feature_names_in=feature_names), n_fused
+
+
+def optimize_pipeline(pipeline: Pipeline) -> Pipeline:
+    """
+    Build an inference-only pipeline with the leading scaler/PCA steps fused.
+
+    A binary LogisticRegression head is folded into the affine transform, leaving a
+    single FusedLinearClassifier. Any other final estimator (trees, SVM, stacking, ...)
+    keeps running on the fused affine output.
+
+    Args:
+        pipeline: Fitted sklearn Pipeline
+
+    Returns:
+        Optimized Pipeline (the original pipeline if nothing can be fused)
+    """
+    affine, n_fused = fuse_affine_steps(pipeline)
+    if affine is None:
+        warnings.warn("No leading StandardScaler/PCA steps to fuse; returning the original pipeline")
+        return pipeline
+
+    remaining = pipeline.steps[n_fused:]
+    if len(remaining) == 1:
+        name, estimator = remaining[0]
+        if isinstance(estimator, LogisticRegression) and len(estimator.classes_) == 2:
+            coef = affine.weights_ @ estimator.coef_[0]
+            intercept = affine.offset_ @ estimator.coef_[0] + estimator.intercept_[0]
+            fused = FusedLinearClassifier(coef, intercept, estimator.classes_,
+                                          feature_names_in=getattr(affine, 'feature_names_in_', None))
+            return Pipeline([(name, fused)])
+
+    return Pipeline([('affine', affine)] + remaining)
+
+
+def _single_row_latency_ms(pipeline: Pipeline, X_row: Any, n_repeats: int) -> float:
+    """Median single-row predict_proba latency in milliseconds."""
+    timings = []
+    for _ in range(n_repeats):
+        start_time = time.perf_counter()
+        pipeline.predict_proba(X_row)
+        timings.append(time.perf_counter() - start_time)
+    return float(np.median(timings) * 1000)
+
+
+def optimize_checkpoint(
+    checkpoint_dir: Path,
+    model_name: str,
+    X_sample: Any,
+    rtol: float = 1e-7,
+    atol: float = 1e-9,
+    n_repeats: int = 200
+) -> Tuple[Optional[Pipeline], Dict[str, Any]]:
+    """
+    Fuse a checkpointed pipeline, verify it and save it as {model_name}.fused.pkl.
+
+    The fused pipeline is only saved if its probabilities on X_sample match the
+    original's within (rtol, atol).
+
+    Args:
+        checkpoint_dir: Directory containing the checkpoint files
+        model_name: Name of the model (e.g. 'LR')
+        X_sample: Rows used for verification and latency measurement
+        rtol: Relative tolerance for np.allclose
+        atol: Absolute tolerance for np.allclose
+        n_repeats: Number of single-row predictions timed per pipeline
+
+    Returns:
+        Tuple of (optimized pipeline or None if verification failed, report dict)
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    pipeline = joblib.load(checkpoint_dir / f"{model_name}.pkl")
+    optimized = optimize_pipeline(pipeline)
+
+    y_proba = pipeline.predict_proba(X_sample)[:, 1]
+    y_proba_fused = optimized.predict_proba(X_sample)[:, 1]
+    equivalent = bool(np.allclose(y_proba_fused, y_proba, rtol=rtol, atol=atol))
+
+    X_row = X_sample.iloc[:1] if hasattr(X_sample, 'iloc') else X_sample[:1]
+    report = {
+        'model_name': model_name,
+        'steps': [name for name, _ in optimized.steps],
+        'equivalent': equivalent,
+        'max_abs_diff': float(np.max(np.abs(y_proba_fused - y_proba))) if len(y_proba) else 0.0,
+        'single_row_ms': round(_single_row_latency_ms(pipeline, X_row, n_repeats), 4),
+        'single_row_fused_ms': round(_single_row_latency_ms(optimized, X_row, n_repeats), 4)
+    }
+
+    if not equivalent:
+        warnings.warn(f"Fused pipeline for {model_name} differs from the original "
+                      f"(max abs diff {report['max_abs_diff']:.3e}); not saved")
+        return None, report
+
+    fused_path = checkpoint_dir / f"{model_name}.fused.pkl"
+    atomic_write(fused_path, lambda tmp: joblib.dump(optimized, tmp))
+
+    # Record the fused artifact in the checkpoint metadata; load_scoring_model only
+    # serves it while this entry exists (rewriting the checkpoint drops both)
+    metadata_path = checkpoint_dir / f"{model_name}.metadata.json"
+    if metadata_path.exists():
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+        metadata['fused_pipeline'] = {k: v for k, v in report.items() if k != 'model_name'}
+        atomic_write(metadata_path, lambda tmp: tmp.write_text(json.dumps(metadata, indent=2)))
+
+    print(f"✅ {model_name}: fused {report['steps']} "
+          f"({report['single_row_ms']:.3f} → {report['single_row_fused_ms']:.3f} ms/row) → {fused_path}")
+
+    return optimized, report
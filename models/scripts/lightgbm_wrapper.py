@@ -2,14 +2,17 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 import lightgbm as lgb
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
 class LightGBMWrapper(PipelineWrapper):
     """Wrapper for LightGBM pipeline."""
 
+    resource_param = 'lgb__n_estimators'
+    early_stopping_rounds = 50
+
     def __init__(self, random_seed: int = 42):
         super().__init__(name='LGB', random_seed=random_seed)
 
@@ -17,7 +20,7 @@ class LightGBMWrapper(PipelineWrapper):
         """Build LightGBM pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('lgb', lgb.LGBMClassifier(
                 random_state=self.random_seed,
                 verbose=-1,
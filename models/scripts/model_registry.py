@@ -0,0 +1,148 @@
+"""
+Model Registry Module
+
+Maps every PipelineWrapper name (e.g. 'XGB', 'TabNet', 'Stack-Adv') to the module
+and class that implement it, importing the module only when that wrapper is built
+or a checkpoint of it is loaded. A process that only scores with LR or XGB never
+pays for TensorFlow / PyTorch imports. First-import times are recorded per wrapper.
+
+Usage:
+    from model_registry import create_wrapper, create_wrappers, import_times
+
+    xgb_wrapper = create_wrapper('XGB', random_seed=42)
+    wrappers = create_wrappers(['LR', 'XGB', 'Stack-Adv'], random_seed=42)
+
+    print(import_times())  # {'XGB': 0.41, 'LR': 0.0, 'Stack-Adv': 6.2}
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from pipeline_wrapper import PipelineWrapper
+
+
+# Wrapper name -> (module, class), in the notebook's training order
+WRAPPER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'LR': ('lr_wrapper', 'LRWrapper'),
+    'KNN': ('knn_wrapper', 'KNNWrapper'),
+    'CART': ('cart_wrapper', 'CARTWrapper'),
+    'NB': ('nb_wrapper', 'NBWrapper'),
+    'SVM': ('svm_wrapper', 'SVMWrapper'),
+    'Bag': ('bagging_wrapper', 'BaggingWrapper'),
+    'Vote-Soft': ('voting_soft_wrapper', 'VotingSoftWrapper'),
+    'RF': ('rf_wrapper', 'RFWrapper'),
+    'ET': ('et_wrapper', 'ETWrapper'),
+    'Ada': ('ada_wrapper', 'AdaWrapper'),
+    'GB': ('gb_wrapper', 'GBWrapper'),
+    'Stack': ('stacking_wrapper', 'StackingWrapper'),
+    'Stack-Adv': ('stacking_adv_wrapper', 'StackingAdvWrapper'),
+    'Bag-KNN': ('bag_knn_wrapper', 'BagKNNWrapper'),
+    'XGB': ('xgboost_wrapper', 'XGBoostWrapper'),
+    'LGB': ('lightgbm_wrapper', 'LightGBMWrapper'),
+    'CAT': ('catboost_wrapper', 'CatBoostWrapper'),
+    'HistGB': ('histgb_wrapper', 'HistGBWrapper'),
+    'TabNet': ('tabnet_wrapper', 'TabNetWrapper'),
+    'FNN': ('fnn_wrapper', 'FNNWrapper')
+}
+
+# Seconds spent importing each wrapper's module the first time it was needed
+_IMPORT_SECONDS: Dict[str, float] = {}
+_IMPORT_LOCK = threading.Lock()
+
+
+def available_wrappers() -> List[str]:
+    """Names of all registered wrappers."""
+    return list(WRAPPER_REGISTRY)
+
+
+def is_loaded(name: str) -> bool:
+    """Whether the module backing a wrapper has already been imported."""
+    return WRAPPER_REGISTRY[name][0] in sys.modules if name in WRAPPER_REGISTRY else False
+
+
+def get_wrapper_class(name: str) -> Type[PipelineWrapper]:
+    """
+    Import (on first use) and return the wrapper class registered under name.
+
+    Args:
+        name: Wrapper name (e.g. 'XGB')
+
+    Returns:
+        PipelineWrapper subclass
+    """
+    if name not in WRAPPER_REGISTRY:
+        raise ValueError(f"Unknown wrapper '{name}'. Available: {', '.join(WRAPPER_REGISTRY)}")
+
+    module_name, class_name = WRAPPER_REGISTRY[name]
+    with _IMPORT_LOCK:
+        if name not in _IMPORT_SECONDS:
+            # Modules already imported elsewhere (or shared heavy dependencies) cost ~0 here
+            start_time = time.perf_counter()
+            module = importlib.import_module(module_name)
+            _IMPORT_SECONDS[name] = time.perf_counter() - start_time
+        else:
+            module = sys.modules[module_name]
+
+    return getattr(module, class_name)
+
+
+def create_wrapper(name: str, random_seed: int = 42) -> PipelineWrapper:
+    """
+    Instantiate a registered wrapper, importing its module if needed.
+
+    Args:
+        name: Wrapper name (e.g. 'XGB')
+        random_seed: Random seed for reproducibility
+
+    Returns:
+        PipelineWrapper instance
+    """
+    return get_wrapper_class(name)(random_seed=random_seed)
+
+
+def create_wrappers(names: Optional[Sequence[str]] = None, random_seed: int = 42) -> List[PipelineWrapper]:
+    """
+    Instantiate several registered wrappers.
+
+    Args:
+        names: Wrapper names (all registered wrappers if None)
+        random_seed: Random seed for reproducibility
+
+    Returns:
+        List of PipelineWrapper instances in the given order
+    """
+    return [create_wrapper(name, random_seed) for name in (names if names is not None else WRAPPER_REGISTRY)]
+
+
+def load_wrapper_module(name: str) -> bool:
+    """
+    Import the module backing a checkpointed model before unpickling it.
+
+    Unknown names (e.g. custom models) are ignored, leaving imports to the unpickler.
+
+    Args:
+        name: Wrapper / checkpoint model name
+
+    Returns:
+        True if the name is registered and its module is now imported
+    """
+    if name not in WRAPPER_REGISTRY:
+        return False
+    get_wrapper_class(name)
+    return True
+
+
+def import_times() -> Dict[str, float]:
+    """
+    First-import time per wrapper, in seconds, in import order.
+
+    The first wrapper needing a heavy shared dependency (e.g. TensorFlow for FNN
+    and Stack-Adv) carries its full cost.
+
+    Returns:
+        Dict of wrapper name -> seconds
+    """
+    return {name: round(seconds, 4) for name, seconds in _IMPORT_SECONDS.items()}
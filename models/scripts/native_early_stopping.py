@@ -0,0 +1,146 @@
+"""
+Native Early Stopping Module
+
+Fits the final estimator of a pipeline with its own library's early stopping,
+watching a held-out validation split (the cross-validation fold being scored),
+and turns the best iterations found across folds into the training budget of
+the final refit on full data.
+
+Supported estimators: XGBoost, LightGBM, CatBoost, HistGradientBoosting,
+scikeras KerasClassifier and TabNet. Libraries are only touched through the
+fitted estimator, so nothing heavy is imported here.
+
+Usage:
+    from native_early_stopping import supports_early_stopping, fit_with_early_stopping, refit_params
+
+    if supports_early_stopping(estimator):
+        best_iteration = fit_with_early_stopping(estimator, X_train_t, y_train, X_val_t, y_val, rounds=50)
+
+    set_params, fit_params = refit_params(pipe, best_iterations=[212, 187, 240])
+    pipe.set_params(**set_params)
+    pipe.fit(X_train, y_train, **fit_params)
+"""
+
+import inspect
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Estimator class name -> parameter holding its iteration budget
+BUDGET_PARAMS: Dict[str, str] = {
+    'XGBClassifier': 'n_estimators',
+    'LGBMClassifier': 'n_estimators',
+    'CatBoostClassifier': 'iterations',
+    'HistGradientBoostingClassifier': 'max_iter',
+    'KerasClassifier': 'epochs',
+    'TabNetClassifier': 'max_epochs'
+}
+
+
+def supports_early_stopping(estimator: Any) -> bool:
+    """Whether fit_with_early_stopping knows how to early-stop this estimator."""
+    return estimator.__class__.__name__ in BUDGET_PARAMS
+
+
+def fit_with_early_stopping(
+    estimator: Any,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    rounds: int
+) -> int:
+    """
+    Fit an estimator, stopping once the validation loss stops improving.
+
+    The fitted estimator predicts with its best iteration (boosters keep the best
+    round, neural nets restore the best weights).
+
+    Args:
+        estimator: Unfitted estimator (modified in place)
+        X_train: Transformed training features
+        y_train: Training labels
+        X_val: Transformed validation features
+        y_val: Validation labels
+        rounds: Iterations / epochs without improvement before stopping
+
+    Returns:
+        Number of iterations (trees or epochs) up to and including the best one
+    """
+    kind = estimator.__class__.__name__
+
+    if kind == 'XGBClassifier':
+        estimator.set_params(early_stopping_rounds=rounds)
+        estimator.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
+        return int(estimator.best_iteration) + 1
+
+    if kind == 'LGBMClassifier':
+        import lightgbm as lgb
+        callbacks = [lgb.early_stopping(rounds, verbose=False)]
+        if 'eval_X' in inspect.signature(estimator.fit).parameters:
+            # LightGBM >= 4.7 deprecates eval_set
+            estimator.fit(X_train, y_train, eval_X=(X_val,), eval_y=(y_val,), callbacks=callbacks)
+        else:
+            estimator.fit(X_train, y_train, eval_set=[(X_val, y_val)], callbacks=callbacks)
+        return int(estimator.best_iteration_ or estimator.n_estimators_)
+
+    if kind == 'CatBoostClassifier':
+        estimator.fit(X_train, y_train, eval_set=(X_val, y_val), early_stopping_rounds=rounds, use_best_model=True)
+        return int(estimator.get_best_iteration()) + 1
+
+    if kind == 'HistGradientBoostingClassifier':
+        # Scores start with the initial (constant) model, so argmax counts iterations
+        estimator.set_params(early_stopping=True, n_iter_no_change=rounds)
+        estimator.fit(X_train, y_train, X_val=X_val, y_val=y_val)
+        return max(1, int(np.argmax(estimator.validation_score_)))
+
+    if kind == 'KerasClassifier':
+        from tensorflow.keras.callbacks import EarlyStopping
+        estimator.fit(X_train, y_train, validation_data=(X_val, y_val),
+                      callbacks=[EarlyStopping(monitor='val_loss', patience=rounds, restore_best_weights=True)])
+        return int(np.argmin(estimator.history_['val_loss'])) + 1
+
+    if kind == 'TabNetClassifier':
+        estimator.fit(X_train, y_train, eval_set=[(X_val, y_val)], patience=rounds)
+        return int(estimator.best_epoch) + 1
+
+    raise ValueError(f"Early stopping is not supported for {kind}")
+
+
+def refit_iterations(best_iterations: Optional[Sequence[int]]) -> Optional[int]:
+    """Iteration budget of the final refit: mean best iteration across folds (None if unknown)."""
+    if not best_iterations:
+        return None
+    return max(1, int(round(float(np.mean(best_iterations)))))
+
+
+def refit_params(pipeline: Any, best_iterations: Optional[Sequence[int]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Pipeline parameters making the final refit train for the cross-validated best iterations.
+
+    Args:
+        pipeline: Sklearn pipeline whose last step is the estimator
+        best_iterations: Best iteration of every fold of the best trial
+
+    Returns:
+        Tuple of (set_params kwargs, fit kwargs); both empty if there is nothing to reuse
+    """
+    step_name, estimator = pipeline.steps[-1]
+    n_iterations = refit_iterations(best_iterations)
+    if n_iterations is None or not supports_early_stopping(estimator):
+        return {}, {}
+
+    budget_param = BUDGET_PARAMS[estimator.__class__.__name__]
+    if estimator.__class__.__name__ == 'TabNetClassifier':
+        # TabNet takes its epoch budget at fit time; patience=0 disables its early stopping
+        return {}, {f'{step_name}__{budget_param}': n_iterations, f'{step_name}__patience': 0}
+    if estimator.__class__.__name__ == 'HistGradientBoostingClassifier':
+        # early_stopping='auto' would hold out 10% of large training sets and stop again
+        return {f'{step_name}__{budget_param}': n_iterations, f'{step_name}__early_stopping': False}, {}
+    return {f'{step_name}__{budget_param}': n_iterations}, {}
+
+
+def best_iterations_of(fold_info: List[Dict[str, Any]]) -> List[int]:
+    """Best iterations recorded by the folds that used early stopping."""
+    return [int(info['best_iteration']) for info in fold_info if info.get('best_iteration') is not None]
@@ -1,6 +1,7 @@
 """Base class for ML pipeline wrappers."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 from sklearn.pipeline import Pipeline
 
 
@@ -12,8 +13,18 @@ class PipelineWrapper(ABC):
     - Pipeline construction logic
     - Hyperparameter distribution for Optuna
     - Model-specific configuration
+
+    Attributes:
+        resource_param: Pipeline parameter holding the training budget (e.g. 'xgb__n_estimators'),
+            scaled down at the low-fidelity rungs of a multi-fidelity search. None means the
+            rungs use a fraction of the training data instead.
+        early_stopping_rounds: Patience of the estimator's native early stopping on each
+            validation fold during the search (None trains the full budget)
     """
 
+    resource_param: Optional[str] = None
+    early_stopping_rounds: Optional[int] = None
+
     def __init__(self, name: str, random_seed: int = 42):
         """
         Initialize pipeline wrapper.
@@ -0,0 +1,445 @@
+"""
+Preprocessing Cache Module
+
+Memoizes the preprocessing steps of a pipeline (e.g. StandardScaler -> PCA) per
+cross-validation fold, so Optuna trials sharing the same preprocessing params reuse
+the fitted transformers and transformed fold matrices instead of refitting them.
+
+Each preprocessing step is cached on its own, keyed by data fingerprint, fold
+indices and the params of that step and the steps before it. A trial that only
+changes pca__n_components still reuses the fitted StandardScaler and the scaled
+fold; the PCA step itself then refits from the scaled fold, which CachedPCA turns
+into slicing one cached decomposition. Entries are evicted least-recently-used
+once the memory (or disk) budget is exceeded.
+
+In memory mode every process keeps its own store. With folds evaluated in joblib
+workers (n_jobs > 1), a trial only hits when its fold lands on a worker that has
+already transformed it, so expect far fewer hits than with n_jobs=1. Disk mode
+(cache_dir) shares entries across workers. lookups() counts the hits and misses
+of the calling process (a fold looks up its steps from the last one back until
+one hits), so callers can add them up across workers.
+
+Usage:
+    from preprocessing_cache import PreprocessingCache
+
+    cache = PreprocessingCache(max_bytes=2 * 1024**3)
+    objective = aml_scorer.create_objective(
+        name, pipe, param_distributions, X_train, y_train, cv, scorer,
+        preprocessing_cache=cache
+    )
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+
+
+def array_fingerprint(*arrays: Any) -> str:
+    """
+    Content hash of one or more arrays (shape, dtype and bytes).
+
+    Args:
+        *arrays: Arrays to fingerprint
+
+    Returns:
+        Hex digest identifying the array contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(memoryview(array).cast('B'))
+    return digest.hexdigest()
+
+
+class BoundedLRUCache:
+    """
+    Thread-safe in-memory LRU cache bounded by total bytes and/or number of entries.
+
+    Attributes:
+        max_bytes: Maximum total size of cached values (None for unbounded)
+        max_entries: Maximum number of cached values (None for unbounded)
+        current_bytes: Total size of cached values
+        hits: Number of successful lookups
+        misses: Number of failed lookups
+        evictions: Number of evicted entries
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None):
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_bytes: Maximum total size of cached values (None for unbounded)
+            max_entries: Maximum number of cached values (None for unbounded)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key (marking it most recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Any, value: Any, nbytes: int) -> None:
+        """
+        Insert a value, evicting least recently used entries to stay within budget.
+
+        Values larger than max_bytes are not cached.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            nbytes: Size accounted for the value
+        """
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+
+            while self._entries and (
+                (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def pop(self, key: Any) -> Optional[Any]:
+        """Remove and return the cached value for key, or None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self.current_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def keys(self) -> list:
+        """Keys from least to most recently used."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+def _is_passthrough(step: Any) -> bool:
+    """Whether a pipeline step is disabled (None or 'passthrough')."""
+    return step is None or (isinstance(step, str) and step == 'passthrough')
+
+
+# Per-process in-memory stores, looked up by cache id. A PreprocessingCache only
+# pickles its configuration, so joblib workers attach to their own local store
+# (loky keeps workers alive between trials, so the store survives across trials).
+_MEMORY_STORES: Dict[str, BoundedLRUCache] = {}
+_MEMORY_STORES_LOCK = threading.Lock()
+
+
+def _memory_store(cache_id: str, max_bytes: Optional[int], max_entries: Optional[int]) -> BoundedLRUCache:
+    """Get (or create) this process's store for a cache, dropping stores of previous studies."""
+    with _MEMORY_STORES_LOCK:
+        store = _MEMORY_STORES.get(cache_id)
+        if store is None:
+            _MEMORY_STORES.clear()
+            store = _MEMORY_STORES[cache_id] = BoundedLRUCache(max_bytes, max_entries)
+        return store
+
+
+class PreprocessingCache:
+    """
+    Fold-level cache of fitted preprocessing steps and transformed fold matrices.
+
+    The preprocessing steps are every pipeline step except the final estimator; each
+    entry holds one fitted step and its output on the fold. In
+    memory mode each process keeps its own bounded store (joblib workers don't see
+    each other's entries); in disk mode entries are written under cache_dir and
+    memory-mapped, so all worker processes share them.
+
+    Attributes:
+        max_bytes: Memory or disk budget in bytes
+        max_entries: Maximum number of cached fold steps (None for unbounded)
+        cache_dir: Directory for disk mode (None for in-memory mode)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 1024 ** 3,
+        max_entries: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        """
+        Initialize preprocessing cache.
+
+        Args:
+            max_bytes: Memory or disk budget in bytes
+            max_entries: Maximum number of cached fold steps (None for unbounded)
+            cache_dir: Directory for disk mode (None for in-memory mode)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_id = uuid.uuid4().hex
+        self._disk_hits = 0
+        self._disk_misses = 0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def _store(self) -> BoundedLRUCache:
+        return _memory_store(self._cache_id, self.max_bytes, self.max_entries)
+
+    @staticmethod
+    def preprocessing_params(pipeline: Any, n_steps: Optional[int] = None) -> str:
+        """
+        Canonical description of a pipeline's preprocessing steps and their params.
+
+        Args:
+            pipeline: Sklearn pipeline
+            n_steps: Only describe the first n_steps steps (default: every preprocessing step)
+
+        Returns:
+            String identifying the preprocessing configuration
+        """
+        steps = pipeline.steps[:-1] if n_steps is None else pipeline.steps[:n_steps]
+        parts = []
+        for step_name, step in steps:
+            if _is_passthrough(step):
+                parts.append(f"{step_name}=passthrough")
+                continue
+            params = sorted(
+                (k, repr(v)) for k, v in step.get_params(deep=True).items()
+                if not hasattr(v, 'get_params')
+            )
+            parts.append(f"{step_name}={type(step).__name__}{params}")
+        return ';'.join(parts)
+
+    def fold_key(self, pipeline: Any, data_fingerprint: str, train_idx: np.ndarray, val_idx: np.ndarray,
+                 n_steps: Optional[int] = None) -> str:
+        """
+        Cache key of a fold step: data fingerprint, fold indices and the params of the steps up to it.
+
+        Args:
+            pipeline: Sklearn pipeline
+            data_fingerprint: Fingerprint of the full feature matrix and labels
+            train_idx: Training fold indices
+            val_idx: Validation fold indices
+            n_steps: Key the output of the first n_steps steps (default: every preprocessing step)
+
+        Returns:
+            Hex digest key
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(data_fingerprint.encode())
+        digest.update(array_fingerprint(train_idx, val_idx).encode())
+        digest.update(self.preprocessing_params(pipeline, n_steps).encode())
+        return digest.hexdigest()
+
+    def _step_keys(self, pipeline: Any, data_fingerprint: str, train_idx: np.ndarray,
+                   val_idx: np.ndarray) -> list:
+        """Keys of every preprocessing step output of a fold, in pipeline order."""
+        return [self.fold_key(pipeline, data_fingerprint, train_idx, val_idx, n_steps)
+                for n_steps in range(1, len(pipeline.steps))]
+
+    def transform_fold(
+        self,
+        pipeline: Any,
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        val_idx: np.ndarray,
+        data_fingerprint: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transformed training and validation matrices of a fold, fitting the preprocessing on a miss.
+
+        Args:
+            pipeline: Sklearn pipeline whose preprocessing steps are applied
+            X: Feature matrix
+            y: Label array
+            train_idx: Training fold indices
+            val_idx: Validation fold indices
+            data_fingerprint: Fingerprint of X and y (see array_fingerprint)
+
+        Returns:
+            Tuple of (X_train_transformed, X_val_transformed)
+        """
+        steps = pipeline.steps[:-1]
+        keys = self._step_keys(pipeline, data_fingerprint, train_idx, val_idx)
+
+        # Resume after the last step whose output is cached (passthrough steps are never stored)
+        start = 0
+        X_train_t, X_val_t = X[train_idx], X[val_idx]
+        for i in reversed(range(len(steps))):
+            if _is_passthrough(steps[i][1]):
+                continue
+            cached = self._get(keys[i])
+            if cached is not None:
+                start = i + 1
+                X_train_t, X_val_t = cached[1], cached[2]
+                break
+
+        # Fit clones so the cached steps never alias the (reused) pipeline's steps
+        for i in range(start, len(steps)):
+            step = steps[i][1]
+            if _is_passthrough(step):
+                continue
+            step = clone(step)
+            X_train_t = step.fit_transform(X_train_t, y[train_idx])
+            X_val_t = step.transform(X_val_t)
+            self._put(keys[i], step, X_train_t, X_val_t)
+
+        return X_train_t, X_val_t
+
+    def get_preprocessor(self, pipeline: Any, data_fingerprint: str, train_idx: np.ndarray,
+                         val_idx: np.ndarray) -> Optional[Any]:
+        """Fitted preprocessing steps of a cached fold as a Pipeline, or None if any step is not cached."""
+        fitted_steps = []
+        keys = self._step_keys(pipeline, data_fingerprint, train_idx, val_idx)
+        for (step_name, step), key in zip(pipeline.steps[:-1], keys):
+            if not _is_passthrough(step):
+                cached = self._get(key)
+                if cached is None:
+                    return None
+                step = cached[0]
+            fitted_steps.append((step_name, step))
+        return Pipeline(fitted_steps)
+
+    def _get(self, key: str) -> Optional[Tuple[Any, np.ndarray, np.ndarray]]:
+        """Look up a (fitted step, train output, validation output) entry in memory or on disk."""
+        if self.cache_dir is None:
+            return self._store.get(key)
+
+        entry_dir = self.cache_dir / key
+        try:
+            # Touch the entry so disk eviction is least-recently-used
+            os.utime(entry_dir)
+            entry = (
+                joblib.load(entry_dir / 'preprocessor.pkl'),
+                np.load(entry_dir / 'train.npy', mmap_mode='r'),
+                np.load(entry_dir / 'val.npy', mmap_mode='r')
+            )
+        except (FileNotFoundError, OSError, EOFError):
+            self._disk_misses += 1
+            return None
+        self._disk_hits += 1
+        return entry
+
+    def _put(self, key: str, step: Any, X_train_t: np.ndarray, X_val_t: np.ndarray) -> None:
+        """Store an entry in memory or on disk, then enforce the budget."""
+        nbytes = int(X_train_t.nbytes + X_val_t.nbytes)
+
+        if self.cache_dir is None:
+            self._store.put(key, (step, X_train_t, X_val_t), nbytes)
+            return
+
+        # Write into a temporary directory and rename it, so readers never see partial entries
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-'))
+        try:
+            np.save(tmp_dir / 'train.npy', np.ascontiguousarray(X_train_t))
+            np.save(tmp_dir / 'val.npy', np.ascontiguousarray(X_val_t))
+            joblib.dump(step, tmp_dir / 'preprocessor.pkl')
+            os.rename(tmp_dir, self.cache_dir / key)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used disk entries until within budget."""
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            if entry_dir.name.startswith('.tmp-'):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry_dir.iterdir())
+                entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+            except FileNotFoundError:
+                continue
+
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (
+            total_bytes > self.max_bytes
+            or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            _, size, entry_dir = entries.pop(0)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_bytes -= size
+
+    def lookups(self) -> Tuple[int, int]:
+        """Hits and misses of the lookups made by this process."""
+        if self.cache_dir is not None:
+            return self._disk_hits, self._disk_misses
+        stats = self._store.stats()
+        return stats['hits'], stats['misses']
+
+    def stats(self) -> Dict[str, int]:
+        """Get statistics of this process's memory store, or entry count and size on disk."""
+        if self.cache_dir is not None:
+            entries = [d for d in self.cache_dir.iterdir() if not d.name.startswith('.tmp-')]
+            return {
+                'entries': len(entries),
+                'bytes': sum(f.stat().st_size for d in entries for f in d.iterdir()),
+                'hits': self._disk_hits,
+                'misses': self._disk_misses
+            }
+        return self._store.stats()
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        if self.cache_dir is not None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self._store.clear()
@@ -0,0 +1,406 @@
+"""
+Scoring Service Module
+
+Local asyncio scoring service: loads a checkpoint once, warms it up and coalesces
+concurrent requests into micro-batches (bounded by max batch size and max wait
+time) before calling predict_proba, returning probabilities plus the thresholded
+decision. Requests are validated on arrival, and a batch that fails to score is
+retried request by request, so one bad request never fails the others. Exposes p50/p99 latency and throughput counters and an optional
+JSON-lines TCP endpoint bound to localhost.
+
+Usage:
+    import asyncio
+    from scoring_service import ScoringService, send_request
+
+    async def main():
+        service = ScoringService.from_checkpoint(
+            checkpoint_dir="./models/mvp-kyt-sup-main",
+            model_name="XGB",
+            max_batch_size=64,
+            max_wait_ms=2.0
+        )
+        await service.start()
+
+        result = await service.score({"Local_feature_1": 0.1, ...})
+        results = await service.score_batch([{...}, {...}])
+
+        server = await service.serve(host="127.0.0.1", port=8765)
+        reply = await send_request("127.0.0.1", 8765, {"transactions": [{...}]})
+        stats = await send_request("127.0.0.1", 8765, {"command": "stats"})
+
+        server.close()
+        await service.stop()
+        print(service.stats())
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from batch_scorer import load_scoring_model
+
+
+Transaction = Union[Dict[str, float], Sequence[float]]
+
+
+class ScoringService:
+    """
+    Micro-batching asyncio scoring service around a trained pipeline.
+
+    Attributes:
+        pipeline: Trained pipeline
+        threshold: Classification threshold applied to the positive class probability
+        batch_pipeline: Pipeline used instead for batches larger than max_batch_size (or None)
+        max_batch_size: Maximum number of transactions per predict_proba call
+        max_wait_ms: Maximum time the first queued request waits for a batch to fill
+        labels: Label names indexed by predicted class
+        feature_names: Feature order expected by the pipeline
+    """
+
+    def __init__(
+        self,
+        pipeline: Any,
+        threshold: float = 0.5,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        labels: Sequence[str] = ('Illicit', 'Licit'),
+        feature_names: Optional[Sequence[str]] = None,
+        latency_window: int = 10_000,
+        batch_pipeline: Optional[Any] = None
+    ):
+        """
+        Initialize scoring service.
+
+        Args:
+            pipeline: Trained pipeline
+            threshold: Classification threshold (e.g. the checkpoint's optimal_threshold)
+            max_batch_size: Maximum number of transactions per predict_proba call
+            max_wait_ms: Maximum time the first queued request waits for a batch to fill
+            labels: Label names indexed by predicted class (class 0 is illicit in the processed dataset)
+            feature_names: Feature order (defaults to the pipeline's feature_names_in_)
+            latency_window: Number of most recent request latencies kept for percentiles
+            batch_pipeline: Pipeline for batches larger than max_batch_size (a single large
+                request), e.g. the native pipeline when pipeline is a compiled tree ensemble
+        """
+        self.pipeline = pipeline
+        self.batch_pipeline = batch_pipeline
+        self.threshold = threshold
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.labels = list(labels)
+
+        if feature_names is None and hasattr(pipeline, 'feature_names_in_'):
+            feature_names = pipeline.feature_names_in_
+        self.feature_names = list(feature_names) if feature_names is not None else None
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        # Single worker thread: batches are scored one at a time off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scoring')
+
+        self._latencies = deque(maxlen=latency_window)
+        self._n_requests = 0
+        self._n_transactions = 0
+        self._n_batches = 0
+        self._started_at = None
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint_dir: Path, model_name: str, fused: bool = True, compiled: bool = False,
+                        **kwargs) -> 'ScoringService':
+        """
+        Create a scoring service from a TrainingManager checkpoint.
+
+        Args:
+            checkpoint_dir: Directory containing the checkpoint files
+            model_name: Name of the model (e.g. 'XGB')
+            fused: Prefer the inference-optimized {model_name}.fused.pkl when it exists
+            compiled: Score micro-batches with the compiled tree ensemble {model_name}.compiled.pkl
+                when it exists; requests larger than max_batch_size keep the (fused) native pipeline
+            **kwargs: Additional ScoringService arguments
+
+        Returns:
+            Configured (not yet started) ScoringService
+        """
+        pipeline, threshold = load_scoring_model(checkpoint_dir, model_name, fused=fused)
+        if compiled:
+            # Compiled ensembles are ~10x faster per row but slower than native on large batches
+            kwargs.setdefault('batch_pipeline', pipeline)
+            pipeline, _ = load_scoring_model(checkpoint_dir, model_name, compiled=True)
+        return cls(pipeline, threshold=kwargs.pop('threshold', threshold), **kwargs)
+
+    @property
+    def n_features(self) -> int:
+        """Number of features expected per transaction."""
+        return len(self.feature_names) if self.feature_names is not None else self.pipeline.n_features_in_
+
+    def _to_rows(self, transactions: List[Transaction]) -> np.ndarray:
+        """
+        Validate transactions and convert each one to a feature row.
+
+        Args:
+            transactions: Feature dicts (missing features become NaN) or feature vectors, possibly mixed
+
+        Returns:
+            Array of shape (len(transactions), n_features)
+
+        Raises:
+            ValueError: If a transaction is not a dict / vector of the expected length, or not numeric
+        """
+        rows = np.empty((len(transactions), self.n_features), dtype=np.float64)
+        for i, transaction in enumerate(transactions):
+            try:
+                if isinstance(transaction, dict):
+                    if self.feature_names is None:
+                        raise ValueError("feature dicts need feature_names")
+                    rows[i] = [transaction.get(name, np.nan) for name in self.feature_names]
+                else:
+                    row = np.asarray(transaction, dtype=np.float64)
+                    if row.shape != (self.n_features,):
+                        raise ValueError(f"expected {self.n_features} features, got shape {row.shape}")
+                    rows[i] = row
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid transaction at index {i}: {e}") from None
+        return rows
+
+    def _to_frame(self, rows: np.ndarray) -> Union[pd.DataFrame, np.ndarray]:
+        """Model input for validated feature rows."""
+        if self.feature_names is not None:
+            return pd.DataFrame(rows, columns=self.feature_names)
+        return rows
+
+    def _predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Positive class probabilities (runs on the executor thread)."""
+        if self.batch_pipeline is not None and len(X) > self.max_batch_size:
+            return self.batch_pipeline.predict_proba(X)[:, 1]
+        return self.pipeline.predict_proba(X)[:, 1]
+
+    async def start(self) -> None:
+        """Warm up the pipeline and start the batching loop."""
+        if self._batcher is not None:
+            return
+
+        # Warm-up: first predict call pays lazy initialization (thread pools, JIT, caches)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._predict, self._to_frame(np.zeros((1, self.n_features))))
+
+        self._queue = asyncio.Queue()
+        self._started_at = time.perf_counter()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        print(f"✅ Scoring service ready (max_batch_size={self.max_batch_size}, max_wait_ms={self.max_wait_ms})")
+
+    async def stop(self) -> None:
+        """Stop the batching loop, fail requests still waiting for it and release the executor."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Scoring service stopped"))
+        self._executor.shutdown(wait=True)
+
+    async def _batch_loop(self) -> None:
+        """Coalesce queued requests into micro-batches and resolve their futures."""
+        loop = asyncio.get_running_loop()
+        max_wait = self.max_wait_ms / 1000
+
+        requests = []
+        try:
+            while True:
+                requests = [await self._queue.get()]
+                n_pending = len(requests[0][0])
+                deadline = loop.time() + max_wait
+
+                while n_pending < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        request = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    requests.append(request)
+                    n_pending += len(request[0])
+
+                rows = np.concatenate([batch for batch, _ in requests])
+                try:
+                    y_proba = await loop.run_in_executor(self._executor, self._predict, self._to_frame(rows))
+                except Exception as e:
+                    if len(requests) == 1:
+                        if not requests[0][1].done():
+                            requests[0][1].set_exception(e)
+                    else:
+                        await self._score_each(requests)
+                    continue
+
+                self._n_batches += 1
+                offset = 0
+                for batch, future in requests:
+                    if not future.done():
+                        future.set_result(y_proba[offset:offset + len(batch)])
+                    offset += len(batch)
+        except asyncio.CancelledError:
+            # Requests taken off the queue when the service stopped
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(RuntimeError("Scoring service stopped"))
+            raise
+
+    async def _score_each(self, requests: List[Any]) -> None:
+        """Score the requests of a failed micro-batch one by one, so errors stay with their request."""
+        loop = asyncio.get_running_loop()
+        for rows, future in requests:
+            try:
+                y_proba = await loop.run_in_executor(self._executor, self._predict, self._to_frame(rows))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+
+            self._n_batches += 1
+            if not future.done():
+                future.set_result(y_proba)
+
+    async def score_batch(self, transactions: List[Transaction]) -> List[Dict[str, Any]]:
+        """
+        Score a batch of transactions (coalesced with other concurrent requests).
+
+        Args:
+            transactions: Feature dicts (keyed by feature name) or feature vectors
+
+        Returns:
+            One dict per transaction with probability, prediction and label
+
+        Raises:
+            ValueError: If a transaction is malformed (nothing of the request is scored)
+        """
+        if self._batcher is None:
+            raise RuntimeError("Scoring service is not started; call 'await service.start()' first")
+        if not transactions:
+            return []
+
+        start_time = time.perf_counter()
+        rows = self._to_rows(list(transactions))
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((rows, future))
+        y_proba = await future
+
+        predictions = (y_proba >= self.threshold).astype(int)
+        self._latencies.append(time.perf_counter() - start_time)
+        self._n_requests += 1
+        self._n_transactions += len(predictions)
+
+        return [
+            {'probability': float(p), 'prediction': int(c), 'label': self.labels[c]}
+            for p, c in zip(y_proba, predictions)
+        ]
+
+    async def score(self, transaction: Transaction) -> Dict[str, Any]:
+        """
+        Score a single transaction.
+
+        Args:
+            transaction: Feature dict (keyed by feature name) or feature vector
+
+        Returns:
+            Dict with probability, prediction and label
+        """
+        return (await self.score_batch([transaction]))[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Latency and throughput counters.
+
+        Returns:
+            Dict with request/transaction/batch counts, mean batch size, p50/p99 latency (ms)
+            over the recent window and transactions per second since start
+        """
+        latencies_ms = np.asarray(self._latencies) * 1000
+        elapsed = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        return {
+            'requests': self._n_requests,
+            'transactions': self._n_transactions,
+            'batches': self._n_batches,
+            'mean_batch_size': round(self._n_transactions / self._n_batches, 2) if self._n_batches else 0.0,
+            'p50_latency_ms': round(float(np.percentile(latencies_ms, 50)), 3) if len(latencies_ms) else None,
+            'p99_latency_ms': round(float(np.percentile(latencies_ms, 99)), 3) if len(latencies_ms) else None,
+            'throughput_per_second': round(self._n_transactions / elapsed, 1) if elapsed > 0 else 0.0
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve JSON-lines requests on one connection."""
+        try:
+            while line := await reader.readline():
+                try:
+                    payload = json.loads(line)
+                    if payload.get('command') == 'stats':
+                        reply = self.stats()
+                    elif 'transactions' in payload:
+                        reply = {'results': await self.score_batch(payload['transactions'])}
+                    elif 'transaction' in payload:
+                        reply = {'result': await self.score(payload['transaction'])}
+                    else:
+                        reply = {'error': "Expected 'transaction', 'transactions' or 'command'"}
+                except Exception as e:
+                    reply = {'error': f"{type(e).__name__}: {e}"}
+
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        """
+        Expose the service over a JSON-lines TCP endpoint.
+
+        Each request is one JSON object per line: {"transaction": ...}, {"transactions": [...]}
+        or {"command": "stats"}; each reply is one JSON object per line.
+
+        Args:
+            host: Interface to bind (localhost by default)
+            port: TCP port (0 picks a free port)
+
+        Returns:
+            Running asyncio server
+        """
+        await self.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        bound_port = server.sockets[0].getsockname()[1]
+        print(f"🚀 Scoring service listening on {host}:{bound_port}")
+        return server
+
+
+async def send_request(host: str, port: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send one JSON-lines request to a running scoring service.
+
+    Args:
+        host: Service host
+        port: Service port
+        payload: Request object
+
+    Returns:
+        Decoded reply
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(json.dumps(payload).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
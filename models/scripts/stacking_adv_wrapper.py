@@ -2,7 +2,6 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from sklearn.ensemble import StackingClassifier
 from sklearn.linear_model import LogisticRegression
 import xgboost as xgb
@@ -11,6 +10,7 @@ from pytorch_tabnet.tab_model import TabNetClassifier
 import tensorflow as tf
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import Dense, Dropout, BatchNormalization
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
@@ -67,7 +67,7 @@ class StackingAdvWrapper(PipelineWrapper):
         """Build advanced stacking pipeline with FNN, TabNet, and XGBoost."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('stacking', StackingClassifier(
                 estimators=[
                     ('xgb', xgb.XGBClassifier(
@@ -0,0 +1,222 @@
+"""
+Study Seeding Module
+
+Warm-starts a new Optuna study from a previous run's checkpoints: the prior best
+configurations are enqueued as the first trials (re-evaluated on the current data),
+and the prior completed trials are shown to TPE as extra observations so the search
+continues from where the previous one left off instead of sampling at random.
+
+Prior trials are never added to the new study, so best_value, best_params, patience
+and trial counts only reflect trials evaluated on the current data. Their scores come
+from the previous data, so they only shape TPE's good/bad split as hints.
+
+Usage:
+    from study_seeding import HintedTPESampler, load_prior_trials, seed_study
+
+    prior = load_prior_trials("../checkpoints_2024_w12", "XGB")
+    study = optuna.create_study(direction='maximize', sampler=HintedTPESampler(prior.trials, seed=42))
+    seed_study(study, prior, param_names=param_distributions['XGB'].keys(), top_k=3, threshold_strategy='sampled')
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import joblib
+import optuna
+from optuna.distributions import BaseDistribution, CategoricalDistribution
+from optuna.samplers import TPESampler
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
+from optuna.trial import FrozenTrial, TrialState
+
+
+class PriorTrials(NamedTuple):
+    """
+    Completed trials and best configuration of a previous study.
+
+    Attributes:
+        source: Checkpoint directory the trials come from
+        trials: Completed trials, best first
+        best_params: Best params stored in the checkpoint metadata
+        best_value: Best CV score of the previous run
+        threshold: Optimal threshold of the previous run
+    """
+    source: str
+    trials: List[FrozenTrial]
+    best_params: Dict[str, Any]
+    best_value: Optional[float]
+    threshold: Optional[float]
+
+
+def load_prior_trials(checkpoint_dir: Any, model_name: str) -> Optional[PriorTrials]:
+    """
+    Read a model's previous study and metadata from a checkpoint directory.
+
+    The study is looked up in the same places TrainingManager writes it: SQLite or
+    journal storage, then the pickled study.
+
+    Args:
+        checkpoint_dir: Checkpoint directory of the previous run
+        model_name: Name of the model (study name)
+
+    Returns:
+        PriorTrials, or None if the directory has neither metadata nor a study for the model
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    metadata_path = checkpoint_dir / f"{model_name}.metadata.json"
+    metadata = json.loads(metadata_path.read_text()) if metadata_path.exists() else {}
+
+    study = None
+    db_path = checkpoint_dir / f"{model_name}.study.db"
+    journal_path = checkpoint_dir / f"{model_name}.study.journal"
+    pkl_path = checkpoint_dir / f"{model_name}.study.pkl"
+    if db_path.exists():
+        study = optuna.load_study(study_name=model_name, storage=f"sqlite:///{db_path.resolve()}")
+    elif journal_path.exists():
+        study = optuna.load_study(study_name=model_name,
+                                  storage=JournalStorage(JournalFileBackend(str(journal_path))))
+    elif pkl_path.exists():
+        study = joblib.load(pkl_path)
+
+    if study is None and not metadata:
+        return None
+
+    trials = []
+    if study is not None:
+        trials = sorted(
+            (t for t in study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,)) if t.value is not None),
+            key=lambda t: t.value, reverse=True
+        )
+
+    return PriorTrials(
+        source=str(checkpoint_dir),
+        trials=trials,
+        best_params=metadata.get('best_params') or (trials[0].params if trials else {}),
+        best_value=metadata.get('cv_score_mean', trials[0].value if trials else None),
+        threshold=metadata.get('optimal_threshold')
+    )
+
+
+def seed_study(study: optuna.study.Study, prior: PriorTrials, param_names: Iterable[str],
+               top_k: int = 3, threshold_strategy: str = 'sampled') -> int:
+    """
+    Enqueue the prior best configurations as the first trials of a new study.
+
+    Params missing from the current search space are dropped. With the 'sampled'
+    threshold strategy the objective suggests a threshold for every model (whether
+    or not the wrapper defines one), so each configuration keeps the threshold it
+    was scored with; with 'oof' the threshold is computed, never enqueued.
+
+    Args:
+        study: New (empty) study
+        prior: Trials of the previous run
+        param_names: Params of the current search space
+        top_k: Number of prior configurations to enqueue, best first
+        threshold_strategy: Threshold strategy of the new study's objective ('sampled' or 'oof')
+
+    Returns:
+        Number of enqueued trials
+    """
+    param_names = set(param_names) - {'threshold'}
+    # (params, threshold) of the prior best and of every prior trial, best first
+    candidates = [(prior.best_params, prior.threshold)] + [
+        (t.params, t.params.get('threshold', t.user_attrs.get('threshold'))) for t in prior.trials
+    ]
+
+    enqueued = []
+    for params, threshold in candidates:
+        if len(enqueued) >= top_k:
+            break
+        threshold = params.get('threshold', threshold)
+        params = {k: v for k, v in params.items() if k in param_names}
+        if threshold_strategy == 'sampled' and threshold is not None:
+            params['threshold'] = threshold
+        if params and params not in enqueued:
+            study.enqueue_trial(params, user_attrs={'warm_start_source': prior.source})
+            enqueued.append(params)
+
+    return len(enqueued)
+
+
+def trials_to_reach(study: optuna.study.Study, value: Optional[float]) -> Optional[int]:
+    """
+    Number of finished trials the study needed to first reach a score.
+
+    Args:
+        study: Optuna study (maximized)
+        value: Target score (e.g. the previous run's best)
+
+    Returns:
+        1-based trial count, or None if the score was never reached
+    """
+    if value is None:
+        return None
+    finished = study.get_trials(deepcopy=False, states=(TrialState.COMPLETE, TrialState.PRUNED))
+    for position, trial in enumerate(sorted(finished, key=lambda t: t.number), start=1):
+        if trial.state == TrialState.COMPLETE and trial.value is not None and trial.value >= value:
+            return position
+    return None
+
+
+def _in_distribution(value: Any, distribution: BaseDistribution) -> bool:
+    """Whether a prior param value is valid for the current distribution."""
+    if isinstance(distribution, CategoricalDistribution):
+        return value in distribution.choices
+    try:
+        return distribution.low <= value <= distribution.high
+    except (AttributeError, TypeError):
+        return False
+
+
+class _StudyWithHints:
+    """Read-only view of a study whose trial list also contains prior trials."""
+
+    def __init__(self, study: optuna.study.Study, hints: List[FrozenTrial]):
+        self._study = study
+        self._hints = hints
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._study, name)
+
+    def get_trials(self, deepcopy: bool = True, states: Optional[Iterable[TrialState]] = None) -> List[FrozenTrial]:
+        trials = self._study.get_trials(deepcopy=deepcopy, states=states)
+        hints = [t for t in self._hints if states is None or t.state in states]
+        return hints + trials
+
+    def _get_trials(self, deepcopy: bool = True, states: Optional[Iterable[TrialState]] = None,
+                    use_cache: bool = False) -> List[FrozenTrial]:
+        # TPESampler reads trials through this private hook; only the public API of the study is used
+        return self.get_trials(deepcopy=deepcopy, states=states)
+
+
+class HintedTPESampler(TPESampler):
+    """
+    TPE sampler that also learns from the completed trials of a previous study.
+
+    Prior trials count as observations (so TPE skips its random startup once enough
+    of them exist) but are never stored in the study being optimized. For each
+    parameter, only prior trials whose value fits the current distribution are used,
+    so a changed search space just narrows the hints.
+    """
+
+    def __init__(self, prior_trials: Optional[List[FrozenTrial]] = None, **kwargs: Any):
+        """
+        Initialize sampler.
+
+        Args:
+            prior_trials: Completed trials of the previous study
+            **kwargs: TPESampler arguments (e.g. seed)
+        """
+        super().__init__(**kwargs)
+        self.prior_trials = list(prior_trials or [])
+
+    def sample_independent(self, study: optuna.study.Study, trial: FrozenTrial, param_name: str,
+                           param_distribution: BaseDistribution) -> Any:
+        hints = [
+            t for t in self.prior_trials
+            if param_name in t.params and _in_distribution(t.params[param_name], param_distribution)
+        ]
+        if hints:
+            study = _StudyWithHints(study, hints)
+        return super().sample_independent(study, trial, param_name, param_distribution)
@@ -9,6 +9,8 @@ from pipeline_wrapper import PipelineWrapper
 class TabNetWrapper(PipelineWrapper):
     """Wrapper for TabNet pipeline."""
 
+    early_stopping_rounds = 10
+
     def __init__(self, random_seed: int = 42):
         super().__init__(name='TabNet', random_seed=random_seed)
 
@@ -0,0 +1,626 @@
+"""
+Tree Compiler Module
+
+Exports fitted tree ensembles (sklearn CART / Random Forest / Extra Trees /
+Gradient Boosting / AdaBoost, XGBoost, LightGBM and CatBoost) into compact,
+contiguous NumPy node arrays and predicts from them with a vectorized batch
+traversal, so serving a compiled model needs neither the original library
+import nor its per-call overhead.
+
+The compiled model is for low-latency scoring of a few rows at a time: single-row
+predict_proba is about 10x faster than native, but large batches are slower
+(100k rows: Random Forest 0.77 s -> 3.3 s, XGBoost 0.27 s -> 0.58 s), since the
+native libraries traverse trees in multithreaded C++. Only ScoringService opts
+into it (and keeps the native pipeline for requests larger than a micro-batch);
+BatchScorer always scores with the native pipeline.
+
+Usage:
+    from tree_compiler import compile_pipeline, compile_checkpoint, benchmark_compiled
+    from scoring_service import ScoringService
+
+    compiled_pipe = compile_pipeline(pipe)
+    y_proba = compiled_pipe.predict_proba(X_test)[:, 1]
+
+    # Compile, verify against the native model and save {name}.compiled.pkl
+    compiled_pipe, report = compile_checkpoint(
+        checkpoint_dir="./models/mvp-kyt-sup-main",
+        model_name="XGB",
+        X_sample=X_test
+    )
+    service = ScoringService.from_checkpoint("./models/mvp-kyt-sup-main", "XGB", compiled=True)
+
+    results = benchmark_compiled(pipe, compiled_pipe, X_test, n_rows=100_000)
+"""
+
+import json
+import re
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from scipy.special import expit
+from sklearn.ensemble import (
+    AdaBoostClassifier, ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+)
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+from checkpoint_catalog import atomic_write
+from inference_optimizer import fuse_affine_steps
+
+
+# Missing value handling per split node
+MISSING_AS_ZERO = 0   # NaN is replaced by 0.0 before comparing (LightGBM missing_type 'None')
+MISSING_DEFAULT = 1   # NaN follows the node's default direction
+MISSING_ZERO_DEFAULT = 2  # NaN and zero follow the default direction (LightGBM missing_type 'Zero')
+
+# LightGBM treats |x| <= kZeroThreshold as zero
+_LGB_ZERO_THRESHOLD = 1e-35
+
+# Upper bound on (rows x trees) traversed at once, bounding the node index matrix
+_MAX_CELLS_PER_CHUNK = 262_144
+
+
+class _CompiledEnsemble:
+    """
+    Base class for compiled binary tree ensembles.
+
+    Subclasses implement _leaf_values(X) -> (n_samples, n_trees) leaf outputs; the
+    raw score is base_score + leaf_values @ tree_weights, mapped to a probability by
+    the link function ('identity' for averaged probabilities, 'sigmoid' for margins).
+    """
+
+    def __init__(self, tree_weights: np.ndarray, base_score: float, link: str, classes: np.ndarray,
+                 input_dtype: str, n_features: int, source: str):
+        self.tree_weights = np.ascontiguousarray(tree_weights, dtype=np.float64)
+        self.base_score = float(base_score)
+        self.link = link
+        self.classes_ = np.asarray(classes)
+        self.input_dtype = input_dtype
+        self.n_features_in_ = n_features
+        self.source = source
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.tree_weights)
+
+    def fit(self, X: Any = None, y: Any = None) -> '_CompiledEnsemble':
+        """No-op: compiled ensembles are already fitted."""
+        return self
+
+    def _leaf_values(self, X: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        """Raw ensemble score (averaged probability or margin, depending on the link)."""
+        X = np.asarray(X, dtype=self.input_dtype)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        raw = np.empty(X.shape[0], dtype=np.float64)
+        chunk_size = max(1, _MAX_CELLS_PER_CHUNK // max(self.n_trees, 1))
+        for start in range(0, X.shape[0], chunk_size):
+            stop = start + chunk_size
+            raw[start:stop] = self._leaf_values(X[start:stop]) @ self.tree_weights
+        return raw + self.base_score
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """Class probabilities of shape (n_samples, 2)."""
+        raw = self.decision_function(X)
+        proba = expit(raw) if self.link == 'sigmoid' else np.clip(raw, 0.0, 1.0)
+        return np.column_stack([1 - proba, proba])
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Predicted class labels (threshold 0.5)."""
+        return self.classes_[(self.predict_proba(X)[:, 1] > 0.5).astype(int)]
+
+
+class CompiledForest(_CompiledEnsemble):
+    """
+    Ensemble of binary trees stored as flat node arrays.
+
+    Leaves point to themselves (left == right == node), so every sample can be
+    advanced max_depth times without branching on leaf status.
+
+    Attributes:
+        feature: Split feature per node (0 for leaves)
+        threshold: Split threshold per node
+        left: Left child per node (absolute index)
+        right: Right child per node (absolute index)
+        value: Leaf output per node
+        default_left: Direction of missing values per node
+        missing_mode: Missing value handling per node (MISSING_* constants)
+        roots: Root node index per tree
+        max_depth: Maximum depth over all trees
+        strict: Go left on x < threshold (XGBoost) instead of x <= threshold
+    """
+
+    def __init__(self, nodes: Dict[str, np.ndarray], roots: np.ndarray, max_depth: int, strict: bool,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.feature = np.ascontiguousarray(nodes['feature'], dtype=np.intp)
+        self.threshold = np.ascontiguousarray(nodes['threshold'], dtype=np.float64)
+        self.left = np.ascontiguousarray(nodes['left'], dtype=np.intp)
+        self.right = np.ascontiguousarray(nodes['right'], dtype=np.intp)
+        self.children = np.column_stack([self.right, self.left]).ravel()
+        self.value = np.ascontiguousarray(nodes['value'], dtype=np.float64)
+        self.default_left = np.ascontiguousarray(nodes['default_left'], dtype=bool)
+        self.missing_mode = np.ascontiguousarray(nodes['missing_mode'], dtype=np.int8)
+        self.roots = np.ascontiguousarray(roots, dtype=np.intp)
+        self.max_depth = int(max_depth)
+        self.strict = strict
+        self._zero_as_missing = bool(np.any(self.missing_mode == MISSING_ZERO_DEFAULT))
+
+    def _leaf_values(self, X: np.ndarray) -> np.ndarray:
+        X = np.ascontiguousarray(X)
+        X_flat = X.ravel()
+        # Flat offsets of each row, so feature lookups are a single 1-D gather
+        row_offsets = (np.arange(X.shape[0]) * X.shape[1])[:, None]
+        node = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        has_nan = bool(np.isnan(X_flat).any())
+
+        for _ in range(self.max_depth):
+            x = X_flat.take(row_offsets + self.feature.take(node))
+            threshold = self.threshold.take(node)
+            go_left = x < threshold if self.strict else x <= threshold
+
+            if has_nan or self._zero_as_missing:
+                mode = self.missing_mode.take(node)
+                nan = np.isnan(x)
+                missing = nan & (mode != MISSING_AS_ZERO)
+                if has_nan:
+                    go_left = np.where(nan & (mode == MISSING_AS_ZERO), 0.0 <= threshold, go_left)
+                if self._zero_as_missing:
+                    missing |= (mode == MISSING_ZERO_DEFAULT) & (np.abs(x) <= _LGB_ZERO_THRESHOLD)
+                go_left = np.where(missing, self.default_left.take(node), go_left)
+
+            # children holds (right, left) pairs: index 2 * node + go_left picks the branch
+            node = self.children.take(2 * node + go_left)
+
+        return self.value.take(node)
+
+
+class CompiledObliviousForest(_CompiledEnsemble):
+    """
+    Ensemble of oblivious (symmetric) trees, as trained by CatBoost.
+
+    Each tree applies the same split at every node of a level, so the leaf index is
+    the bit pattern of its split outcomes. Shallower trees are padded to max_depth
+    with never-true splits (border=+inf) on the high bits.
+
+    Attributes:
+        split_feature: Split feature per (tree, level)
+        split_border: Split border per (tree, level); the bit is set when x > border
+        nan_true: Whether a missing value sets the bit, per (tree, level)
+        leaf_values: Leaf outputs per (tree, leaf index)
+    """
+
+    def __init__(self, split_feature: np.ndarray, split_border: np.ndarray, nan_true: np.ndarray,
+                 leaf_values: np.ndarray, **kwargs):
+        super().__init__(**kwargs)
+        self.split_feature = np.ascontiguousarray(split_feature, dtype=np.intp)
+        self.split_border = np.ascontiguousarray(split_border, dtype=np.float64)
+        self.nan_true = np.ascontiguousarray(nan_true, dtype=bool)
+        self.leaf_values = np.ascontiguousarray(leaf_values, dtype=np.float64)
+
+    def _leaf_values(self, X: np.ndarray) -> np.ndarray:
+        n_trees, depth = self.split_feature.shape
+        has_nan = bool(np.isnan(X).any())
+        index = np.zeros((X.shape[0], n_trees), dtype=np.intp)
+
+        for level in range(depth):
+            x = X[:, self.split_feature[:, level]]
+            bit = x > self.split_border[:, level]
+            if has_nan:
+                bit = np.where(np.isnan(x), self.nan_true[:, level], bit)
+            index |= bit.astype(np.intp) << level
+
+        return self.leaf_values[np.arange(n_trees), index]
+
+
+def _assemble_forest(trees: List[Dict[str, np.ndarray]], strict: bool, **kwargs) -> CompiledForest:
+    """
+    Concatenate per-tree node arrays into one CompiledForest.
+
+    Each tree dict holds feature/threshold/left/right/value/default_left/missing_mode
+    arrays indexed locally (children == -1 for leaves) and its depth.
+    """
+    offsets = np.cumsum([0] + [len(tree['feature']) for tree in trees])
+    nodes = {}
+    for key in ('feature', 'threshold', 'value', 'default_left', 'missing_mode'):
+        nodes[key] = np.concatenate([tree[key] for tree in trees])
+
+    for key in ('left', 'right'):
+        children = []
+        for tree, offset in zip(trees, offsets):
+            child = np.asarray(tree[key], dtype=np.intp)
+            is_leaf = child < 0
+            # Leaves point to themselves so traversal can run a fixed number of steps
+            children.append(np.where(is_leaf, np.arange(len(child)), child) + offset)
+        nodes[key] = np.concatenate(children)
+
+    leaves = np.asarray(nodes['left']) == np.arange(offsets[-1])
+    nodes['feature'] = np.where(leaves, 0, nodes['feature'])
+    nodes['threshold'] = np.where(leaves, 0.0, nodes['threshold'])
+
+    return CompiledForest(
+        nodes=nodes,
+        roots=offsets[:-1],
+        max_depth=max(tree['depth'] for tree in trees),
+        strict=strict,
+        **kwargs
+    )
+
+
+def _sklearn_tree(tree: Any, value: np.ndarray) -> Dict[str, np.ndarray]:
+    """Node arrays of a fitted sklearn tree with the given per-node output."""
+    tree_ = tree.tree_
+    missing_left = getattr(tree_, 'missing_go_to_left', np.zeros(tree_.node_count, dtype=np.uint8))
+    return {
+        'feature': np.maximum(tree_.feature, 0),
+        'threshold': tree_.threshold,
+        'left': tree_.children_left,
+        'right': tree_.children_right,
+        'value': value,
+        'default_left': missing_left.astype(bool),
+        'missing_mode': np.full(tree_.node_count, MISSING_DEFAULT, dtype=np.int8),
+        'depth': tree_.max_depth
+    }
+
+
+def _positive_fraction(tree: DecisionTreeClassifier) -> np.ndarray:
+    """Per-node probability of the positive class of a classification tree."""
+    value = tree.tree_.value[:, 0, :]
+    return value[:, 1] / value.sum(axis=1)
+
+
+def _compile_sklearn(estimator: Any) -> CompiledForest:
+    """Compile a fitted sklearn tree or tree ensemble classifier."""
+    common = {'classes': estimator.classes_, 'input_dtype': 'float32',
+              'n_features': estimator.n_features_in_, 'source': type(estimator).__name__}
+
+    if isinstance(estimator, DecisionTreeClassifier):
+        trees = [_sklearn_tree(estimator, _positive_fraction(estimator))]
+        return _assemble_forest(trees, strict=False, tree_weights=[1.0], base_score=0.0, link='identity', **common)
+
+    if isinstance(estimator, (RandomForestClassifier, ExtraTreesClassifier)):
+        trees = [_sklearn_tree(tree, _positive_fraction(tree)) for tree in estimator.estimators_]
+        weights = np.full(len(trees), 1.0 / len(trees))
+        return _assemble_forest(trees, strict=False, tree_weights=weights, base_score=0.0, link='identity',
+                                **common)
+
+    if isinstance(estimator, GradientBoostingClassifier):
+        regressors = estimator.estimators_[:, 0]
+        trees = [_sklearn_tree(tree, tree.tree_.value[:, 0, 0]) for tree in regressors]
+        base_score = float(estimator._raw_predict_init(np.zeros((1, estimator.n_features_in_)))[0, 0])
+        weights = np.full(len(trees), estimator.learning_rate)
+        # Exponential loss maps raw scores to probabilities through expit(2 * raw)
+        scale = 2.0 if estimator.loss == 'exponential' else 1.0
+        return _assemble_forest(trees, strict=False, tree_weights=weights * scale, base_score=base_score * scale,
+                                link='sigmoid', **common)
+
+    if isinstance(estimator, AdaBoostClassifier):
+        # SAMME binary: decision = sum(w_i * (+2 | -2)) / sum(w), proba = expit(decision)
+        trees = []
+        for tree in estimator.estimators_:
+            if not isinstance(tree, DecisionTreeClassifier):
+                raise ValueError(f"AdaBoost base estimator {type(tree).__name__} is not a decision tree")
+            votes = np.where(np.argmax(tree.tree_.value[:, 0, :], axis=1) == 1, 2.0, -2.0)
+            trees.append(_sklearn_tree(tree, votes))
+        weights = estimator.estimator_weights_[:len(trees)] / estimator.estimator_weights_.sum()
+        return _assemble_forest(trees, strict=False, tree_weights=weights, base_score=0.0, link='sigmoid', **common)
+
+    raise ValueError(f"Unsupported sklearn estimator: {type(estimator).__name__}")
+
+
+def _compile_xgboost(estimator: Any) -> CompiledForest:
+    """Compile a fitted XGBClassifier (gbtree booster, binary:logistic) from its JSON model."""
+    booster = estimator.get_booster()
+    model = json.loads(booster.save_raw('json'))
+    learner = model['learner']
+
+    objective = learner['objective']['name']
+    if objective != 'binary:logistic':
+        raise ValueError(f"Unsupported XGBoost objective: {objective}")
+    if learner['gradient_booster']['name'] != 'gbtree':
+        raise ValueError(f"Unsupported XGBoost booster: {learner['gradient_booster']['name']}")
+
+    trees_json = learner['gradient_booster']['model']['trees']
+    # predict_proba uses the best iteration when early stopping was used
+    best_iteration = getattr(estimator, 'best_iteration', None) if booster.attr('best_iteration') else None
+    if best_iteration is not None:
+        trees_json = trees_json[:best_iteration + 1]
+
+    trees = []
+    for tree in trees_json:
+        left = np.asarray(tree['left_children'])
+        conditions = np.asarray(tree['split_conditions'], dtype=np.float32).astype(np.float64)
+        is_leaf = left < 0
+        depth = _depth_from_children(left, np.asarray(tree['right_children']))
+        trees.append({
+            'feature': np.asarray(tree['split_indices']),
+            'threshold': conditions,
+            'left': left,
+            'right': np.asarray(tree['right_children']),
+            'value': np.where(is_leaf, conditions, 0.0),
+            'default_left': np.asarray(tree['default_left'], dtype=bool),
+            'missing_mode': np.full(len(left), MISSING_DEFAULT, dtype=np.int8),
+            'depth': depth
+        })
+
+    # base_score is stored in probability space, e.g. '[4.68E-1]'
+    base_score = float(re.sub(r'[\[\]]', '', learner['learner_model_param']['base_score']))
+    base_margin = float(np.log(base_score / (1 - base_score)))
+
+    return _assemble_forest(
+        trees, strict=True, tree_weights=np.ones(len(trees)), base_score=base_margin, link='sigmoid',
+        classes=estimator.classes_, input_dtype='float32', n_features=booster.num_features(), source='XGBoost'
+    )
+
+
+def _depth_from_children(left: np.ndarray, right: np.ndarray) -> int:
+    """Depth of a tree given local child arrays (-1 for leaves), rooted at node 0."""
+    depth = np.zeros(len(left), dtype=np.intp)
+    for node in range(len(left)):
+        for child in (left[node], right[node]):
+            if child >= 0:
+                depth[child] = depth[node] + 1
+    return int(depth.max())
+
+
+def _compile_lightgbm(estimator: Any) -> CompiledForest:
+    """Compile a fitted LGBMClassifier (binary objective) from its JSON dump."""
+    booster = estimator.booster_
+    best_iteration = getattr(estimator, 'best_iteration_', None)
+    dump = booster.dump_model(num_iteration=best_iteration if best_iteration else -1)
+
+    objective = dump['objective'].split()
+    if objective[0] != 'binary':
+        raise ValueError(f"Unsupported LightGBM objective: {dump['objective']}")
+    sigmoid = float(objective[1].split(':')[1]) if len(objective) > 1 else 1.0
+    missing_modes = {'None': MISSING_AS_ZERO, 'NaN': MISSING_DEFAULT, 'Zero': MISSING_ZERO_DEFAULT}
+
+    trees = []
+    for tree_info in dump['tree_info']:
+        nodes = {key: [] for key in ('feature', 'threshold', 'left', 'right', 'value', 'default_left', 'missing_mode')}
+        max_depth = 0
+        stack = [(tree_info['tree_structure'], None, None, 0)]
+
+        # Pre-order walk assigning local node indices
+        while stack:
+            node, parent, side, depth = stack.pop()
+            index = len(nodes['feature'])
+            if parent is not None:
+                nodes[side][parent] = index
+            max_depth = max(max_depth, depth)
+
+            if 'leaf_value' in node:
+                for key, value in (('feature', 0), ('threshold', 0.0), ('left', -1), ('right', -1),
+                                   ('value', node['leaf_value']), ('default_left', False),
+                                   ('missing_mode', MISSING_DEFAULT)):
+                    nodes[key].append(value)
+                continue
+
+            if node['decision_type'] != '<=':
+                raise ValueError(f"Unsupported LightGBM split: {node['decision_type']} (categorical features)")
+            for key, value in (('feature', node['split_feature']), ('threshold', node['threshold']),
+                               ('left', -1), ('right', -1), ('value', 0.0),
+                               ('default_left', node['default_left']),
+                               ('missing_mode', missing_modes[node['missing_type']])):
+                nodes[key].append(value)
+            stack.append((node['right_child'], index, 'right', depth + 1))
+            stack.append((node['left_child'], index, 'left', depth + 1))
+
+        tree = {key: np.asarray(values) for key, values in nodes.items()}
+        tree['depth'] = max_depth
+        trees.append(tree)
+
+    return _assemble_forest(
+        trees, strict=False, tree_weights=np.full(len(trees), sigmoid), base_score=0.0, link='sigmoid',
+        classes=estimator.classes_, input_dtype='float64', n_features=booster.num_feature(), source='LightGBM'
+    )
+
+
+def _compile_catboost(estimator: Any) -> CompiledObliviousForest:
+    """Compile a fitted CatBoostClassifier (numeric features, binary) from its JSON export."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / 'model.json'
+        estimator.save_model(str(model_path), format='json')
+        with open(model_path, 'r') as f:
+            model = json.load(f)
+
+    float_features = {info['feature_index']: info for info in model['features_info'].get('float_features', [])}
+    if model['features_info'].get('categorical_features'):
+        raise ValueError("CatBoost models with categorical features are not supported")
+
+    trees = model['oblivious_trees']
+    max_depth = max(len(tree['splits']) for tree in trees)
+    n_trees = len(trees)
+
+    split_feature = np.zeros((n_trees, max_depth), dtype=np.intp)
+    split_border = np.full((n_trees, max_depth), np.inf)
+    nan_true = np.zeros((n_trees, max_depth), dtype=bool)
+    leaf_values = np.zeros((n_trees, 2 ** max_depth))
+
+    for t, tree in enumerate(trees):
+        for level, split in enumerate(tree['splits']):
+            info = float_features[split['float_feature_index']]
+            split_feature[t, level] = info['flat_feature_index']
+            split_border[t, level] = np.float32(split['border'])
+            nan_true[t, level] = info.get('nan_value_treatment') == 'AsTrue'
+        leaf_values[t, :len(tree['leaf_values'])] = tree['leaf_values']
+
+    scale, bias = model.get('scale_and_bias', [1.0, [0.0]])
+    bias = bias[0] if isinstance(bias, list) else bias
+
+    return CompiledObliviousForest(
+        split_feature=split_feature, split_border=split_border, nan_true=nan_true,
+        leaf_values=leaf_values, tree_weights=np.full(n_trees, scale), base_score=bias, link='sigmoid',
+        classes=estimator.classes_, input_dtype='float32', n_features=estimator.n_features_in_, source='CatBoost'
+    )
+
+
+def compile_estimator(estimator: Any) -> _CompiledEnsemble:
+    """
+    Compile a fitted binary tree ensemble classifier into NumPy node arrays.
+
+    The third-party libraries are only touched through the fitted object, so
+    they are never imported here.
+
+    Args:
+        estimator: Fitted DecisionTree / RandomForest / ExtraTrees / GradientBoosting /
+            AdaBoost classifier, XGBClassifier, LGBMClassifier or CatBoostClassifier
+
+    Returns:
+        CompiledForest or CompiledObliviousForest
+    """
+    if len(getattr(estimator, 'classes_', [])) != 2:
+        raise ValueError("Only binary classifiers can be compiled")
+
+    module = type(estimator).__module__.split('.')[0]
+    if module == 'sklearn':
+        return _compile_sklearn(estimator)
+    if module == 'xgboost':
+        return _compile_xgboost(estimator)
+    if module == 'lightgbm':
+        return _compile_lightgbm(estimator)
+    if module == 'catboost':
+        return _compile_catboost(estimator)
+
+    raise ValueError(f"Unsupported estimator: {type(estimator).__name__}")
+
+
+def compile_pipeline(pipeline: Pipeline, fuse_preprocessing: bool = True) -> Pipeline:
+    """
+    Replace a fitted pipeline's final tree ensemble with its compiled form.
+
+    Args:
+        pipeline: Fitted sklearn Pipeline ending in a supported tree ensemble
+        fuse_preprocessing: Also fuse leading StandardScaler/PCA steps into one affine step
+
+    Returns:
+        Pipeline with the same preprocessing and a compiled final step
+    """
+    name, estimator = pipeline.steps[-1]
+    steps = pipeline.steps[:-1]
+
+    if fuse_preprocessing:
+        affine, n_fused = fuse_affine_steps(pipeline)
+        if affine is not None:
+            steps = [('affine', affine)] + steps[n_fused:]
+
+    return Pipeline(steps + [(name, compile_estimator(estimator))])
+
+
+def compile_checkpoint(
+    checkpoint_dir: Path,
+    model_name: str,
+    X_sample: Any,
+    atol: float = 1e-5
+) -> Tuple[Optional[Pipeline], Dict[str, Any]]:
+    """
+    Compile a checkpointed pipeline, verify it and save it as {model_name}.compiled.pkl.
+
+    The compiled pipeline is only saved if its probabilities on X_sample match the
+    native ones within atol (XGBoost/LightGBM accumulate in float32 internally), and
+    is recorded as 'compiled_pipeline' in the checkpoint metadata, which
+    load_scoring_model(compiled=True) requires before serving it.
+
+    Args:
+        checkpoint_dir: Directory containing the checkpoint files
+        model_name: Name of the model (e.g. 'XGB')
+        X_sample: Rows used for verification
+        atol: Absolute tolerance on probabilities
+
+    Returns:
+        Tuple of (compiled pipeline or None if verification failed, report dict)
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    pipeline = joblib.load(checkpoint_dir / f"{model_name}.pkl")
+    compiled = compile_pipeline(pipeline)
+
+    y_proba = pipeline.predict_proba(X_sample)[:, 1]
+    y_proba_compiled = compiled.predict_proba(X_sample)[:, 1]
+    max_abs_diff = float(np.max(np.abs(y_proba_compiled - y_proba))) if len(y_proba) else 0.0
+
+    estimator = compiled.steps[-1][1]
+    report = {
+        'model_name': model_name,
+        'source': estimator.source,
+        'n_trees': estimator.n_trees,
+        'max_abs_diff': max_abs_diff,
+        'equivalent': max_abs_diff <= atol
+    }
+
+    if not report['equivalent']:
+        warnings.warn(f"Compiled {model_name} differs from the native model "
+                      f"(max abs diff {max_abs_diff:.3e}); not saved")
+        return None, report
+
+    compiled_path = checkpoint_dir / f"{model_name}.compiled.pkl"
+    atomic_write(compiled_path, lambda tmp: joblib.dump(compiled, tmp))
+
+    # Same contract as the fused pipeline: rewriting the checkpoint drops the file and this entry
+    metadata_path = checkpoint_dir / f"{model_name}.metadata.json"
+    if metadata_path.exists():
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+        metadata['compiled_pipeline'] = {k: v for k, v in report.items() if k != 'model_name'}
+        atomic_write(metadata_path, lambda tmp: tmp.write_text(json.dumps(metadata, indent=2)))
+    print(f"✅ {model_name}: compiled {report['n_trees']} {report['source']} trees "
+          f"(max abs diff {max_abs_diff:.2e}) → {compiled_path}")
+
+    return compiled, report
+
+
+def benchmark_compiled(
+    native: Any,
+    compiled: Any,
+    X: Any,
+    n_rows: int = 100_000,
+    n_repeats: int = 100
+) -> Dict[str, float]:
+    """
+    Compare native and compiled predict_proba latency for single rows and a large batch.
+
+    Args:
+        native: Fitted native pipeline or estimator
+        compiled: Compiled pipeline or estimator
+        X: Sample rows (tiled up to n_rows for the batch benchmark)
+        n_rows: Batch size of the large-batch benchmark
+        n_repeats: Number of single-row predictions timed per model
+
+    Returns:
+        Dict with median single-row milliseconds and batch seconds for both models
+    """
+    X_row = X.iloc[:1] if hasattr(X, 'iloc') else X[:1]
+    n_tiles = int(np.ceil(n_rows / len(X)))
+    if hasattr(X, 'iloc'):
+        X_batch = X.iloc[np.tile(np.arange(len(X)), n_tiles)[:n_rows]]
+    else:
+        X_batch = np.tile(X, (n_tiles, 1))[:n_rows]
+
+    results = {}
+    for label, model in (('native', native), ('compiled', compiled)):
+        model.predict_proba(X_row)  # warm-up
+        timings = []
+        for _ in range(n_repeats):
+            start_time = time.perf_counter()
+            model.predict_proba(X_row)
+            timings.append(time.perf_counter() - start_time)
+        results[f'{label}_single_row_ms'] = round(float(np.median(timings)) * 1000, 4)
+
+        start_time = time.perf_counter()
+        model.predict_proba(X_batch)
+        results[f'{label}_batch_seconds'] = round(time.perf_counter() - start_time, 4)
+
+    results['single_row_speedup'] = round(results['native_single_row_ms'] / results['compiled_single_row_ms'], 2)
+    results['batch_speedup'] = round(results['native_batch_seconds'] / results['compiled_batch_seconds'], 2)
+    print(f"⏱️  single row: {results['native_single_row_ms']:.3f} → {results['compiled_single_row_ms']:.3f} ms | "
+          f"{n_rows:,} rows: {results['native_batch_seconds']:.3f} → {results['compiled_batch_seconds']:.3f} s")
+
+    return results
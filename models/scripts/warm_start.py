@@ -0,0 +1,131 @@
+"""
+Warm Start Module
+
+Continues training a checkpointed pipeline on newly labeled data instead of
+refitting it from scratch. The fitted preprocessing steps are kept frozen (the
+estimator's feature space must not change) and only the final estimator learns
+from the new rows:
+
+- boosters (XGBoost, LightGBM, CatBoost, HistGradientBoosting) add boosting rounds
+  on top of the existing trees;
+- neural nets (scikeras KerasClassifier, TabNet) resume from their current weights;
+- estimators with partial_fit (GaussianNB, SGDClassifier, ...) update incrementally.
+
+Usage:
+    from warm_start import warm_start_mode, continue_training
+
+    if warm_start_mode(pipe.steps[-1][1]) is not None:
+        updated_pipe, info = continue_training(pipe, X_new, y_new, fraction=0.2)
+"""
+
+import copy
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.base import clone
+
+
+BOOSTERS = ('XGBClassifier', 'LGBMClassifier', 'CatBoostClassifier', 'HistGradientBoostingClassifier')
+NEURAL_NETS = ('KerasClassifier', 'TabNetClassifier')
+
+
+def warm_start_mode(estimator: Any) -> Optional[str]:
+    """
+    How a fitted estimator can continue training.
+
+    Args:
+        estimator: Fitted final estimator of a pipeline
+
+    Returns:
+        'boosting', 'weights', 'partial_fit', or None if it can only be refitted
+    """
+    kind = estimator.__class__.__name__
+    if kind in BOOSTERS:
+        return 'boosting'
+    if kind in NEURAL_NETS:
+        return 'weights'
+    if hasattr(estimator, 'partial_fit'):
+        return 'partial_fit'
+    return None
+
+
+def trained_iterations(estimator: Any) -> int:
+    """Boosting rounds or epochs the fitted estimator has been trained for."""
+    kind = estimator.__class__.__name__
+    if kind == 'XGBClassifier':
+        return int(estimator.get_booster().num_boosted_rounds())
+    if kind == 'LGBMClassifier':
+        return int(estimator.booster_.current_iteration())
+    if kind == 'CatBoostClassifier':
+        return int(estimator.tree_count_)
+    if kind == 'HistGradientBoostingClassifier':
+        return int(estimator.n_iter_)
+    if kind == 'KerasClassifier':
+        return len(estimator.history_['loss'])
+    if kind == 'TabNetClassifier':
+        return len(estimator.history['loss'])
+    raise ValueError(f"{kind} has no iteration count")
+
+
+def continue_training(
+    pipeline: Any,
+    X_new: np.ndarray,
+    y_new: np.ndarray,
+    fraction: float = 0.2
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Continue training a fitted pipeline's estimator on new labeled rows.
+
+    The input pipeline is left untouched; a copy is updated and returned.
+
+    Args:
+        pipeline: Fitted sklearn pipeline (e.g. loaded from a checkpoint)
+        X_new: New feature rows
+        y_new: New labels
+        fraction: Extra boosting rounds / epochs as a fraction of those already trained
+
+    Returns:
+        Tuple of (updated pipeline, info dict with the warm start mode and extra iterations)
+
+    Raises:
+        ValueError: If the estimator can't continue training (see warm_start_mode)
+    """
+    pipeline = copy.deepcopy(pipeline)
+    estimator = pipeline.steps[-1][1]
+    kind = estimator.__class__.__name__
+    mode = warm_start_mode(estimator)
+    if mode is None:
+        raise ValueError(f"{kind} can't continue training; refit it instead")
+
+    # Preprocessing stays as fitted so the estimator sees the same feature space
+    X_t = pipeline[:-1].transform(X_new) if len(pipeline.steps) >= 2 else X_new
+
+    if mode == 'partial_fit':
+        estimator.partial_fit(X_t, y_new)
+        return pipeline, {'mode': mode, 'extra_iterations': None}
+
+    n_extra = max(1, int(round(trained_iterations(estimator) * fraction)))
+
+    if kind == 'XGBClassifier':
+        estimator.set_params(n_estimators=n_extra, early_stopping_rounds=None)
+        estimator.fit(X_t, y_new, xgb_model=estimator.get_booster(), verbose=False)
+    elif kind == 'LGBMClassifier':
+        estimator.set_params(n_estimators=n_extra)
+        estimator.fit(X_t, y_new, init_model=estimator.booster_)
+    elif kind == 'CatBoostClassifier':
+        # Fitted CatBoost models are immutable; train a fresh one on top of the trees
+        continued = clone(estimator).set_params(iterations=n_extra)
+        continued.fit(X_t, y_new, init_model=estimator)
+        pipeline.steps[-1] = (pipeline.steps[-1][0], continued)
+    elif kind == 'HistGradientBoostingClassifier':
+        # max_iter counts every iteration, including the ones already fitted
+        estimator.set_params(warm_start=True, early_stopping=False, max_iter=estimator.n_iter_ + n_extra)
+        estimator.fit(X_t, y_new)
+    elif kind == 'KerasClassifier':
+        estimator.set_params(warm_start=True, epochs=n_extra)
+        estimator.fit(X_t, y_new)
+    else:
+        # TabNet takes its epoch budget at fit time; patience=0 disables its early stopping
+        estimator.fit(X_t, y_new, max_epochs=n_extra, patience=0, warm_start=True)
+
+    return pipeline, {'mode': mode, 'extra_iterations': n_extra}
@@ -2,14 +2,17 @@
 
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 import xgboost as xgb
+from cached_pca import CachedPCA
 from pipeline_wrapper import PipelineWrapper
 
 
 class XGBoostWrapper(PipelineWrapper):
     """Wrapper for XGBoost pipeline."""
 
+    resource_param = 'xgb__n_estimators'
+    early_stopping_rounds = 50
+
     def __init__(self, random_seed: int = 42):
         super().__init__(name='XGB', random_seed=random_seed)
 
@@ -17,7 +20,7 @@ class XGBoostWrapper(PipelineWrapper):
         """Build XGBoost pipeline with StandardScaler and PCA."""
         return Pipeline([
             ('std', StandardScaler()),
-            ('pca', PCA(n_components=n_pca_components)),
+            ('pca', CachedPCA(n_components=n_pca_components)),
             ('xgb', xgb.XGBClassifier(
                 random_state=self.random_seed,
                 eval_metric='logloss',
@@ -0,0 +1,60 @@
+"""
+Tests that pushing checkpoints to blob storage only sends what changed, run
+against LocalContainerClient (a filesystem-backed stand-in for an Azure container).
+
+Usage:
+    python -m pytest -q models/tests
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+for scripts_path in (ROOT / "models" / "scripts", ROOT / "datasets" / "scripts"):
+    if str(scripts_path) not in sys.path:
+        sys.path.insert(0, str(scripts_path))
+
+import pytest  # noqa: E402
+from sklearn.datasets import make_classification  # noqa: E402
+from sklearn.metrics import make_scorer  # noqa: E402
+from sklearn.model_selection import StratifiedKFold  # noqa: E402
+
+from aml_scorer import AMLScorer  # noqa: E402
+from azure_utils import AzureBlobDownloader, LocalContainerClient  # noqa: E402
+from nb_wrapper import NBWrapper  # noqa: E402
+from training_manager import TrainingManager  # noqa: E402
+
+
+@pytest.fixture
+def trained_manager(tmp_path):
+    """TrainingManager with one small trained checkpoint under tmp_path/models/run."""
+    X, y = make_classification(n_samples=300, n_features=8, weights=[0.8], random_state=0)
+    wrapper = NBWrapper(random_seed=0)
+    aml_scorer = AMLScorer()
+    manager = TrainingManager(tmp_path / "models" / "run", n_trials=2, patience_ratio=1.0,
+                              timeout_seconds=60, n_jobs=1, random_seed=0)
+    manager.train_models([wrapper], {wrapper.name: wrapper.get_param_distributions()}, X, y,
+                         StratifiedKFold(3, shuffle=True, random_state=0), make_scorer(aml_scorer.score),
+                         aml_scorer, 0.95)
+    return manager
+
+
+def test_identical_repush_uploads_nothing(trained_manager, tmp_path):
+    uploader = AzureBlobDownloader(container_client=LocalContainerClient(tmp_path / "container"))
+    assert trained_manager.push_checkpoints(uploader)
+    assert uploader.last_transfer_stats["uploaded_files"] > 0
+
+    assert trained_manager.push_checkpoints(uploader)
+    assert uploader.last_transfer_stats["uploaded_files"] == 0
+
+
+def test_loaded_checkpoint_is_not_reuploaded(trained_manager, tmp_path):
+    uploader = AzureBlobDownloader(container_client=LocalContainerClient(tmp_path / "container"))
+    assert trained_manager.push_checkpoints(uploader)
+    n_files = uploader.last_transfer_stats["uploaded_files"]
+
+    assert len(trained_manager.load_models_from_checkpoint()) == 1
+    assert trained_manager.push_checkpoints(uploader)
+
+    assert uploader.last_transfer_stats["uploaded_files"] == 0
+    assert uploader.last_transfer_stats["skipped_files"] == n_files